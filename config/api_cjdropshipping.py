@@ -1,103 +1,182 @@
-"""
-Configuração da API do CJ Dropshipping
-"""
-import requests
-import os
-from dotenv import load_dotenv
-
-# Carrega variáveis de ambiente
-load_dotenv()
-
-# Credenciais
-CJ_API_KEY = os.getenv("CJ_API_KEY")
-CJ_EMAIL = os.getenv("CJ_EMAIL")
-
-# URLs da API
-CJ_API_BASE_URL = "https://api.cjdropshipping.com"
-CJ_AUTH_URL = f"{CJ_API_BASE_URL}/api/auth/token"
-CJ_PRODUCT_URL = f"{CJ_API_BASE_URL}/api/product/list"
-CJ_ORDER_URL = f"{CJ_API_BASE_URL}/api/order/create"
-
-def get_access_token():
-    """Obtém token de acesso da API"""
-    print("DEBUG: Obtendo token CJ Dropshipping")
-    
-    data = {
-        "email": CJ_EMAIL,
-        "password": CJ_API_KEY
-    }
-    
-    response = requests.post(CJ_AUTH_URL, json=data)
-    if response.status_code == 200:
-        result = response.json()
-        if result.get("code") == 200:
-            return result.get("data", {}).get("accessToken")
-    
-    print(f"DEBUG: Erro ao obter token CJ: {response.text}")
-    return None
-
-def search_products(keyword, page=1, page_size=20):
-    """Busca produtos no catálogo"""
-    token = get_access_token()
-    if not token:
-        return []
-    
-    print(f"DEBUG: Buscando produtos com keyword: {keyword}")
-    
-    headers = {
-        "CJ-Access-Token": token
-    }
-    
-    params = {
-        "productNameEn": keyword,
-        "pageNum": page,
-        "pageSize": page_size
-    }
-    
-    response = requests.get(CJ_PRODUCT_URL, headers=headers, params=params)
-    if response.status_code == 200:
-        result = response.json()
-        if result.get("code") == 200:
-            return result.get("data", {}).get("list", [])
-    
-    print(f"DEBUG: Erro ao buscar produtos: {response.text}")
-    return []
-
-def create_order(product_id, quantity, shipping_address):
-    """Cria um pedido para o fornecedor"""
-    token = get_access_token()
-    if not token:
-        return None
-    
-    print(f"DEBUG: Criando pedido para produto {product_id}")
-    
-    headers = {
-        "CJ-Access-Token": token,
-        "Content-Type": "application/json"
-    }
-    
-    data = {
-        "productId": product_id,
-        "quantity": quantity,
-        "shippingAddress": shipping_address
-    }
-    
-    response = requests.post(CJ_ORDER_URL, headers=headers, json=data)
-    if response.status_code == 200:
-        result = response.json()
-        if result.get("code") == 200:
-            return result.get("data")
-    
-    print(f"DEBUG: Erro ao criar pedido: {response.text}")
-    return None
-
-# Exemplo de teste da API
-if __name__ == "__main__":
-    token = get_access_token()
-    print(f"DEBUG: Token obtido: {token[:10]}...") if token else print("DEBUG: Falha ao obter token")
-    
-    products = search_products("phone case")
-    if products:
-        print(f"DEBUG: {len(products)} produtos encontrados")
-        for i, product in enumerate(products[:3]):
+"""
+Configuração da API do CJ Dropshipping
+"""
+from config import http_client, rate_limit, circuit_breaker, json_codec
+from config.token_cache import TokenCache
+from config.cache import HTTPCache
+import os
+import time
+from datetime import datetime
+from dotenv import load_dotenv
+
+# Carrega variáveis de ambiente
+load_dotenv()
+
+# Credenciais
+CJ_API_KEY = os.getenv("CJ_API_KEY")
+CJ_EMAIL = os.getenv("CJ_EMAIL")
+
+# URLs da API
+CJ_API_BASE_URL = os.getenv("CJ_API_BASE_URL", "https://api.cjdropshipping.com")
+CJ_AUTH_URL = f"{CJ_API_BASE_URL}/api/auth/token"
+CJ_PRODUCT_URL = f"{CJ_API_BASE_URL}/api/product/list"
+CJ_PRODUCT_DETAIL_URL = f"{CJ_API_BASE_URL}/api/product/query"
+CJ_ORDER_URL = f"{CJ_API_BASE_URL}/api/order/create"
+
+# Limite de requisições por segundo (0 desativa)
+CJ_RATE_LIMIT = float(os.getenv("CJ_RATE_LIMIT", "1"))
+rate_limit.configure(CJ_API_BASE_URL, CJ_RATE_LIMIT, name="CJ Dropshipping")
+
+# Circuit breaker (limites em CIRCUIT_*)
+circuit_breaker.configure(CJ_API_BASE_URL, name="CJ Dropshipping")
+
+# Cache de detalhes de produto (segundos)
+CJ_PRODUCT_CACHE_TTL = int(os.getenv("CJ_PRODUCT_CACHE_TTL", "300"))
+product_cache = HTTPCache.from_env("cj_produtos", ttl=CJ_PRODUCT_CACHE_TTL)
+
+# Cache do token (arquivo opcional para reaproveitar entre reinícios)
+CJ_TOKEN_CACHE_FILE = os.getenv("CJ_TOKEN_CACHE_FILE")
+CJ_TOKEN_REFRESH_MARGIN = int(os.getenv("CJ_TOKEN_REFRESH_MARGIN", "3600"))
+CJ_TOKEN_DEFAULT_TTL = int(os.getenv("CJ_TOKEN_DEFAULT_TTL", "86400"))
+
+def _parse_expiry(value):
+    """Converte a data de expiração retornada pela CJ em timestamp"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+def _fetch_access_token():
+    """Solicita um novo token à API de autenticação"""
+    print("DEBUG: Obtendo token CJ Dropshipping")
+    
+    data = {
+        "email": CJ_EMAIL,
+        "password": CJ_API_KEY
+    }
+    
+    response = http_client.post(CJ_AUTH_URL, json=data)
+    if response.status_code == 200:
+        result = json_codec.response_json(response)
+        if result.get("code") == 200:
+            token_data = result.get("data", {})
+            expires_at = _parse_expiry(token_data.get("accessTokenExpiryDate"))
+            return {
+                "access_token": token_data.get("accessToken"),
+                "refresh_token": token_data.get("refreshToken"),
+                "expires_at": expires_at or time.time() + CJ_TOKEN_DEFAULT_TTL
+            }
+    
+    print(f"DEBUG: Erro ao obter token CJ: {response.text}")
+    return None
+
+# Cache compartilhado pelo processo
+token_cache = TokenCache(
+    _fetch_access_token,
+    refresh_margin=CJ_TOKEN_REFRESH_MARGIN,
+    persist_path=CJ_TOKEN_CACHE_FILE,
+    name="token CJ Dropshipping"
+)
+
+def get_access_token():
+    """Obtém token de acesso da API (reaproveitado até perto de expirar)"""
+    return token_cache.get_token()
+
+def search_products(keyword, page=1, page_size=20):
+    """Busca produtos no catálogo"""
+    token = get_access_token()
+    if not token:
+        return []
+    
+    print(f"DEBUG: Buscando produtos com keyword: {keyword}")
+    
+    headers = {
+        "CJ-Access-Token": token
+    }
+    
+    params = {
+        "productNameEn": keyword,
+        "pageNum": page,
+        "pageSize": page_size
+    }
+    
+    response = http_client.get(CJ_PRODUCT_URL, headers=headers, params=params)
+    if response.status_code == 401:
+        token_cache.invalidate()
+    if response.status_code == 200:
+        result = json_codec.response_json(response)
+        if result.get("code") == 200:
+            return result.get("data", {}).get("list", [])
+    
+    print(f"DEBUG: Erro ao buscar produtos: {response.text}")
+    return []
+
+def get_product_details(product_id):
+    """Obtém detalhes de um produto específico (preço e estoque atuais)"""
+    token = get_access_token()
+    if not token:
+        return None
+    
+    print(f"DEBUG: Obtendo detalhes do produto CJ {product_id}")
+    
+    headers = {
+        "CJ-Access-Token": token
+    }
+    
+    params = {
+        "pid": product_id
+    }
+    
+    response = product_cache.fetch(CJ_PRODUCT_DETAIL_URL, http_client.get, headers=headers, params=params)
+    if response.status_code == 401:
+        token_cache.invalidate()
+    if response.status_code == 200:
+        result = json_codec.response_json(response)
+        if result.get("code") == 200:
+            return result.get("data")
+    
+    print(f"DEBUG: Erro ao obter detalhes CJ: {response.text}")
+    return None
+
+def create_order(product_id, quantity, shipping_address):
+    """Cria um pedido para o fornecedor"""
+    token = get_access_token()
+    if not token:
+        return None
+    
+    print(f"DEBUG: Criando pedido para produto {product_id}")
+    
+    headers = {
+        "CJ-Access-Token": token,
+        "Content-Type": "application/json"
+    }
+    
+    data = {
+        "productId": product_id,
+        "quantity": quantity,
+        "shippingAddress": shipping_address
+    }
+    
+    response = http_client.post(CJ_ORDER_URL, headers=headers, json=data)
+    if response.status_code == 401:
+        token_cache.invalidate()
+    if response.status_code == 200:
+        result = json_codec.response_json(response)
+        if result.get("code") == 200:
+            return result.get("data")
+    
+    print(f"DEBUG: Erro ao criar pedido: {response.text}")
+    return None
+
+# Exemplo de teste da API
+if __name__ == "__main__":
+    token = get_access_token()
+    print(f"DEBUG: Token obtido: {token[:10]}...") if token else print("DEBUG: Falha ao obter token")
+    
+    products = search_products("phone case")
+    if products:
+        print(f"DEBUG: {len(products)} produtos encontrados")
+        for i, product in enumerate(products[:3]):
             print(f"DEBUG: Produto {i+1}: {product.get('productNameEn')}") 
\ No newline at end of file
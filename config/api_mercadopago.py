@@ -1,61 +1,68 @@
-"""
-Configuração da API do Mercado Pago
-"""
-import requests
-import os
-from dotenv import load_dotenv
-
-# Carrega variáveis de ambiente
-load_dotenv()
-
-# Credenciais
-MP_ACCESS_TOKEN = os.getenv("MP_ACCESS_TOKEN")
-
-# URLs da API
-MP_API_BASE_URL = "https://api.mercadopago.com/v1"
-MP_PAYMENTS_URL = f"{MP_API_BASE_URL}/payments"
-MP_TRANSFERS_URL = f"{MP_API_BASE_URL}/transfers"
-
-def get_payment_info(payment_id):
-    """Obtém informações sobre um pagamento"""
-    print(f"DEBUG: Obtendo info do pagamento {payment_id}")
-    
-    headers = {
-        "Authorization": f"Bearer {MP_ACCESS_TOKEN}"
-    }
-    
-    response = requests.get(f"{MP_PAYMENTS_URL}/{payment_id}", headers=headers)
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"DEBUG: Erro ao obter pagamento: {response.text}")
-        return None
-
-def create_transfer(user_id, amount, description="Pagamento de fornecedor"):
-    """Cria uma transferência para conta de terceiros"""
-    print(f"DEBUG: Transferindo R${amount} para {user_id}")
-    
-    headers = {
-        "Authorization": f"Bearer {MP_ACCESS_TOKEN}",
-        "Content-Type": "application/json"
-    }
-    
-    data = {
-        "user_id": user_id,
-        "amount": amount,
-        "description": description
-    }
-    
-    response = requests.post(MP_TRANSFERS_URL, headers=headers, json=data)
-    if response.status_code in (200, 201):
-        return response.json()
-    else:
-        print(f"DEBUG: Erro ao transferir: {response.text}")
-        return None
-
-# Exemplo de teste da API
-if __name__ == "__main__":
-    # Simula consulta de pagamento
-    payment_info = get_payment_info("12345678")
-    if payment_info:
+"""
+Configuração da API do Mercado Pago
+"""
+from config import http_client, rate_limit, circuit_breaker, json_codec
+import os
+from dotenv import load_dotenv
+
+# Carrega variáveis de ambiente
+load_dotenv()
+
+# Credenciais
+MP_ACCESS_TOKEN = os.getenv("MP_ACCESS_TOKEN")
+
+# URLs da API
+MP_API_BASE_URL = os.getenv("MP_API_BASE_URL", "https://api.mercadopago.com/v1")
+MP_PAYMENTS_URL = f"{MP_API_BASE_URL}/payments"
+MP_TRANSFERS_URL = f"{MP_API_BASE_URL}/transfers"
+
+# Limite de requisições por segundo (0 desativa)
+MP_RATE_LIMIT = float(os.getenv("MP_RATE_LIMIT", "10"))
+rate_limit.configure(MP_API_BASE_URL, MP_RATE_LIMIT, name="Mercado Pago")
+
+# Circuit breaker (limites em CIRCUIT_*)
+circuit_breaker.configure(MP_API_BASE_URL, name="Mercado Pago")
+
+def get_payment_info(payment_id):
+    """Obtém informações sobre um pagamento"""
+    print(f"DEBUG: Obtendo info do pagamento {payment_id}")
+    
+    headers = {
+        "Authorization": f"Bearer {MP_ACCESS_TOKEN}"
+    }
+    
+    response = http_client.get(f"{MP_PAYMENTS_URL}/{payment_id}", headers=headers)
+    if response.status_code == 200:
+        return json_codec.response_json(response)
+    else:
+        print(f"DEBUG: Erro ao obter pagamento: {response.text}")
+        return None
+
+def create_transfer(user_id, amount, description="Pagamento de fornecedor"):
+    """Cria uma transferência para conta de terceiros"""
+    print(f"DEBUG: Transferindo R${amount} para {user_id}")
+    
+    headers = {
+        "Authorization": f"Bearer {MP_ACCESS_TOKEN}",
+        "Content-Type": "application/json"
+    }
+    
+    data = {
+        "user_id": user_id,
+        "amount": amount,
+        "description": description
+    }
+    
+    response = http_client.post(MP_TRANSFERS_URL, headers=headers, json=data)
+    if response.status_code in (200, 201):
+        return json_codec.response_json(response)
+    else:
+        print(f"DEBUG: Erro ao transferir: {response.text}")
+        return None
+
+# Exemplo de teste da API
+if __name__ == "__main__":
+    # Simula consulta de pagamento
+    payment_info = get_payment_info("12345678")
+    if payment_info:
         print(f"DEBUG: Pagamento encontrado: R${payment_info.get('transaction_amount')}") 
\ No newline at end of file
@@ -1,70 +1,146 @@
-"""
-Configuração da API do Telegram
-"""
-import requests
-import os
-from dotenv import load_dotenv
-
-# Carrega variáveis de ambiente
-load_dotenv()
-
-# Credenciais
-TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
-
-# URLs da API
-TELEGRAM_API_BASE_URL = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}"
-TELEGRAM_SEND_MESSAGE_URL = f"{TELEGRAM_API_BASE_URL}/sendMessage"
-
-def send_message(text, chat_id=None):
-    """Envia mensagem para o canal ou chat"""
-    if not chat_id:
-        chat_id = TELEGRAM_CHAT_ID
-        
-    print(f"DEBUG: Enviando mensagem para {chat_id}")
-    
-    data = {
-        "chat_id": chat_id,
-        "text": text,
-        "parse_mode": "HTML"
-    }
-    
-    response = requests.post(TELEGRAM_SEND_MESSAGE_URL, json=data)
-    if response.status_code == 200:
-        return response.json()
-    
-    print(f"DEBUG: Erro ao enviar mensagem: {response.text}")
-    return None
-
-def send_daily_report(pedidos, lucro, estoque_baixo=None):
-    """Envia relatório diário formatado"""
-    print("DEBUG: Gerando relatório diário")
-    
-    if estoque_baixo is None:
-        estoque_baixo = []
-    
-    message = f"""
-<b>📊 Relatório Diário MeliAutoProfit</b>
-
-🛒 <b>Pedidos:</b> {pedidos}
-💰 <b>Lucro:</b> R$ {lucro:.2f}
-"""
-
-    if estoque_baixo:
-        message += "\n<b>⚠️ Produtos com estoque baixo:</b>\n"
-        for produto in estoque_baixo:
-            message += f"- {produto}\n"
-    
-    return send_message(message)
-
-# Exemplo de teste da API
-if __name__ == "__main__":
-    # Teste simples
-    result = send_message("Teste de conexão com a API do Telegram.")
-    if result:
-        print("DEBUG: Mensagem enviada com sucesso!")
-    
-    # Teste de relatório
-    report = send_daily_report(5, 150.50, ["Fone JBL", "Carregador Portátil"])
-    if report:
+"""
+Configuração da API do Telegram
+"""
+from config import http_client, rate_limit, circuit_breaker, json_codec
+from config.cache import TTLCache
+from config.singleflight import SingleFlight
+from config.telegram_notifier import (
+    TelegramNotifier, register_shutdown, PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW
+)
+import os
+import requests
+from dotenv import load_dotenv
+
+# Carrega variáveis de ambiente
+load_dotenv()
+
+# Credenciais
+TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
+TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
+
+# URLs da API
+TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL", "https://api.telegram.org")
+TELEGRAM_API_BASE_URL = f"{TELEGRAM_API_URL}/bot{TELEGRAM_BOT_TOKEN}"
+TELEGRAM_SEND_MESSAGE_URL = f"{TELEGRAM_API_BASE_URL}/sendMessage"
+TELEGRAM_GET_ME_URL = f"{TELEGRAM_API_BASE_URL}/getMe"
+
+# Limite de requisições por segundo (0 desativa)
+TELEGRAM_RATE_LIMIT = float(os.getenv("TELEGRAM_RATE_LIMIT", "30"))
+rate_limit.configure(TELEGRAM_API_BASE_URL, TELEGRAM_RATE_LIMIT, name="Telegram")
+
+# Circuit breaker (limites em CIRCUIT_*)
+circuit_breaker.configure(TELEGRAM_API_BASE_URL, name="Telegram")
+
+# Fila de envio em segundo plano
+TELEGRAM_QUEUE_SIZE = int(os.getenv("TELEGRAM_QUEUE_SIZE", "1000"))
+TELEGRAM_CHAT_RATE = float(os.getenv("TELEGRAM_CHAT_RATE", "1"))
+TELEGRAM_GROUP_RATE = float(os.getenv("TELEGRAM_GROUP_RATE", str(20 / 60)))
+TELEGRAM_DIGEST_WINDOW = float(os.getenv("TELEGRAM_DIGEST_WINDOW", "5"))
+TELEGRAM_DIGEST_MAX = int(os.getenv("TELEGRAM_DIGEST_MAX", "20"))
+
+# Verificação de saúde (getMe), compartilhada pelo processo
+TELEGRAM_HEALTH_TTL = float(os.getenv("TELEGRAM_HEALTH_TTL", "60"))
+health_cache = TTLCache("telegram_health", ttl=TELEGRAM_HEALTH_TTL, max_entries=1)
+health_reads = SingleFlight("telegram_health")
+
+def send_message(text, chat_id=None, parse_mode="HTML"):
+    """Envia mensagem para o canal ou chat (síncrono)"""
+    if not chat_id:
+        chat_id = TELEGRAM_CHAT_ID
+        
+    print(f"DEBUG: Enviando mensagem para {chat_id}")
+    
+    data = {
+        "chat_id": chat_id,
+        "text": text,
+        "parse_mode": parse_mode
+    }
+    
+    response = http_client.post(TELEGRAM_SEND_MESSAGE_URL, json=data)
+    if response.status_code == 200:
+        return json_codec.response_json(response)
+    
+    print(f"DEBUG: Erro ao enviar mensagem: {response.text}")
+    return None
+
+def _probe_health():
+    """Consulta o getMe e guarda o resultado no cache"""
+    print("DEBUG: Verificando bot do Telegram (getMe)")
+    try:
+        response = http_client.get(TELEGRAM_GET_ME_URL)
+        healthy = response.status_code == 200 and bool(json_codec.response_json(response).get("ok"))
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"DEBUG: Erro ao verificar bot do Telegram: {str(e)}")
+        healthy = False
+
+    health_cache.set("getMe", healthy)
+    return healthy
+
+def health_check(force=False):
+    """Indica se o bot do Telegram está acessível
+
+    Usa o getMe, que não envia mensagens. O resultado fica em cache por
+    TELEGRAM_HEALTH_TTL segundos e verificações simultâneas compartilham
+    a mesma requisição.
+    """
+    if not TELEGRAM_BOT_TOKEN:
+        return False
+
+    if not force:
+        cached = health_cache.get("getMe")
+        if cached is not None:
+            return cached
+
+    return health_reads.do("getMe", _probe_health)
+
+# Notificador único do processo
+notifier = TelegramNotifier(
+    send_message,
+    max_queue=TELEGRAM_QUEUE_SIZE,
+    chat_rate=TELEGRAM_CHAT_RATE,
+    group_rate=TELEGRAM_GROUP_RATE,
+    digest_window=TELEGRAM_DIGEST_WINDOW,
+    digest_max=TELEGRAM_DIGEST_MAX
+)
+register_shutdown(notifier)
+
+def notify(text, chat_id=None, priority=PRIORITY_NORMAL, parse_mode="HTML"):
+    """Agenda o envio de uma mensagem sem esperar a resposta do Telegram
+
+    Mensagens com PRIORITY_LOW podem ser reunidas em um resumo.
+    Retorna False se a mensagem foi descartada (fila cheia).
+    """
+    return notifier.notify(text, chat_id or TELEGRAM_CHAT_ID, priority=priority, parse_mode=parse_mode)
+
+def send_daily_report(pedidos, lucro, estoque_baixo=None):
+    """Envia relatório diário formatado"""
+    print("DEBUG: Gerando relatório diário")
+    
+    if estoque_baixo is None:
+        estoque_baixo = []
+    
+    message = f"""
+<b>📊 Relatório Diário MeliAutoProfit</b>
+
+🛒 <b>Pedidos:</b> {pedidos}
+💰 <b>Lucro:</b> R$ {lucro:.2f}
+"""
+
+    if estoque_baixo:
+        message += "\n<b>⚠️ Produtos com estoque baixo:</b>\n"
+        for produto in estoque_baixo:
+            message += f"- {produto}\n"
+    
+    return send_message(message)
+
+# Exemplo de teste da API
+if __name__ == "__main__":
+    # Teste simples
+    result = send_message("Teste de conexão com a API do Telegram.")
+    if result:
+        print("DEBUG: Mensagem enviada com sucesso!")
+    
+    # Teste de relatório
+    report = send_daily_report(5, 150.50, ["Fone JBL", "Carregador Portátil"])
+    if report:
         print("DEBUG: Relatório enviado com sucesso!") 
\ No newline at end of file
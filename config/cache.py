@@ -0,0 +1,269 @@
+"""
+Caches em memória (LRU com TTL) com camada opcional em disco
+"""
+import os
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+from dotenv import load_dotenv
+
+from config import json_codec
+
+# Carrega variáveis de ambiente
+load_dotenv()
+
+# Configuração de logging
+logger = logging.getLogger(__name__)
+
+# Diretório da camada em disco (desativada se vazio)
+CACHE_DIR = os.getenv("CACHE_DIR")
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "2048"))
+
+# Caches criados, para exposição de métricas
+_registry = {}
+
+class TTLCache:
+    """Cache LRU limitado com expiração por entrada
+
+    Entradas expiradas não são descartadas de imediato: `get_entry` ainda
+    as devolve (marcadas como não frescas) para permitir revalidação.
+    Com `disk_path`, as entradas também são gravadas em um SQLite e
+    recuperadas de lá quando não estão em memória.
+    """
+
+    def __init__(self, name, ttl=300, max_entries=None, disk_path=None):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries or CACHE_MAX_ENTRIES
+        self.disk_path = disk_path
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = self._open_disk() if disk_path else None
+        _registry[name] = self
+
+    @classmethod
+    def from_env(cls, name, ttl=300, max_entries=None):
+        """Cria o cache usando CACHE_DIR para a camada em disco"""
+        disk_path = os.path.join(CACHE_DIR, f"{name}.sqlite") if CACHE_DIR else None
+        return cls(name, ttl=ttl, max_entries=max_entries, disk_path=disk_path)
+
+    def _open_disk(self):
+        """Abre (ou cria) o armazenamento em disco"""
+        try:
+            diretorio = os.path.dirname(self.disk_path)
+            if diretorio:
+                os.makedirs(diretorio, exist_ok=True)
+            conn = sqlite3.connect(self.disk_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, expires_at REAL)"
+            )
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            logger.warning(f"Camada em disco do cache {self.name} desativada: {str(e)}")
+            return None
+
+    def get_entry(self, key):
+        """Retorna (valor, fresco) ou None se a chave não existir"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._disk is not None:
+                entry = self._disk_get(key)
+                if entry is not None:
+                    self._put(key, entry)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            fresh = now < entry[1]
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry[0], fresh
+
+    def get(self, key, default=None):
+        """Retorna o valor se a entrada estiver fresca"""
+        entry = self.get_entry(key)
+        if entry is None or not entry[1]:
+            return default
+        return entry[0]
+
+    def set(self, key, value, ttl=None):
+        """Armazena um valor com o TTL informado (ou o padrão do cache)"""
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._put(key, (value, expires_at))
+            if self._disk is not None:
+                self._disk_set(key, value, expires_at)
+
+    def delete(self, key):
+        """Remove uma entrada"""
+        with self._lock:
+            self._entries.pop(key, None)
+            if self._disk is not None:
+                self._disk_execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self):
+        """Remove todas as entradas"""
+        with self._lock:
+            self._entries.clear()
+            if self._disk is not None:
+                self._disk_execute("DELETE FROM cache", ())
+
+    def stats(self):
+        """Contadores de uso do cache"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _put(self, key, entry):
+        """Insere em memória respeitando o limite (chamado com o lock)"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_get(self, key):
+        """Lê uma entrada do disco"""
+        try:
+            row = self._disk.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Erro ao ler cache {self.name} do disco: {str(e)}")
+            return None
+        if row is None:
+            return None
+        return json_codec.loads(row[0]), row[1]
+
+    def _disk_set(self, key, value, expires_at):
+        """Grava uma entrada no disco"""
+        self._disk_execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json_codec.dumps(value), expires_at)
+        )
+
+    def _disk_execute(self, sql, params):
+        """Executa um comando de escrita no disco"""
+        try:
+            self._disk.execute(sql, params)
+            self._disk.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Erro ao gravar cache {self.name} no disco: {str(e)}")
+
+class CachedResponse:
+    """Resposta servida pelo cache, compatível com o uso de `requests.Response`"""
+
+    def __init__(self, entry, revalidated=False):
+        self.status_code = 200
+        self.text = entry["text"]
+        self.headers = entry.get("headers", {})
+        self.from_cache = True
+        self.revalidated = revalidated
+
+    def json(self):
+        """Decodifica o corpo armazenado (uma cópia nova a cada chamada)"""
+        return json_codec.loads(self.text)
+
+class HTTPCache(TTLCache):
+    """Cache de respostas GET com revalidação condicional
+
+    Entradas frescas são servidas sem rede. Entradas expiradas são
+    revalidadas com If-None-Match/If-Modified-Since; um 304 renova a
+    entrada sem baixar o corpo novamente.
+    """
+
+    def __init__(self, name, ttl=60, max_entries=None, disk_path=None):
+        super().__init__(name, ttl=ttl, max_entries=max_entries, disk_path=disk_path)
+        self.revalidations = 0
+
+    @staticmethod
+    def make_key(url, params=None):
+        """Chave da requisição (URL + parâmetros ordenados)"""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    def _prepare(self, url, headers, params):
+        """Consulta o cache e monta os cabeçalhos condicionais"""
+        key = self.make_key(url, params)
+        cached = self.get_entry(key)
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached[0].get("etag"):
+                request_headers["If-None-Match"] = cached[0]["etag"]
+            if cached[0].get("last_modified"):
+                request_headers["If-Modified-Since"] = cached[0]["last_modified"]
+
+        kwargs = {"headers": request_headers}
+        if params:
+            kwargs["params"] = params
+        return key, cached, kwargs
+
+    def _complete(self, key, cached, response, ttl):
+        """Atualiza o cache com a resposta da rede"""
+        if response.status_code == 304 and cached is not None:
+            self.revalidations += 1
+            self.set(key, cached[0], ttl)
+            return CachedResponse(cached[0], revalidated=True)
+
+        if response.status_code == 200:
+            self.set(key, {
+                "text": response.text,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }, ttl)
+        return response
+
+    def fetch(self, url, send, headers=None, params=None, ttl=None):
+        """Executa um GET através do cache
+
+        Args:
+            url: URL do recurso
+            send: Função `send(url, headers=..., params=...)` que faz o GET
+            headers: Cabeçalhos da requisição
+            params: Parâmetros de query
+            ttl: Validade da entrada (padrão do cache se None)
+        """
+        key, cached, kwargs = self._prepare(url, headers, params)
+        if cached is not None and cached[1]:
+            return CachedResponse(cached[0])
+        return self._complete(key, cached, send(url, **kwargs), ttl)
+
+    async def afetch(self, url, send, headers=None, params=None, ttl=None):
+        """Versão assíncrona de `fetch` (`send` é uma corrotina)"""
+        key, cached, kwargs = self._prepare(url, headers, params)
+        if cached is not None and cached[1]:
+            return CachedResponse(cached[0])
+        return self._complete(key, cached, await send(url, **kwargs), ttl)
+
+    def invalidate(self, url, params=None):
+        """Descarta a entrada de uma URL (ex.: após atualizar o recurso)"""
+        self.delete(self.make_key(url, params))
+
+    def stats(self):
+        """Contadores de uso, incluindo revalidações"""
+        stats = super().stats()
+        stats["revalidations"] = self.revalidations
+        return stats
+
+def stats():
+    """Métricas de todos os caches do processo"""
+    return {name: cache.stats() for name, cache in _registry.items()}
@@ -0,0 +1,194 @@
+"""
+Circuit breaker por host para as integrações externas
+"""
+import os
+import time
+import logging
+import threading
+from collections import deque
+from urllib.parse import urlsplit
+
+import requests
+from dotenv import load_dotenv
+
+# Carrega variáveis de ambiente
+load_dotenv()
+
+# Configuração de logging
+logger = logging.getLogger(__name__)
+
+# Limites padrão
+CIRCUIT_WINDOW_SIZE = int(os.getenv("CIRCUIT_WINDOW_SIZE", "20"))
+CIRCUIT_MIN_CALLS = int(os.getenv("CIRCUIT_MIN_CALLS", "5"))
+CIRCUIT_FAILURE_RATE = float(os.getenv("CIRCUIT_FAILURE_RATE", "0.5"))
+CIRCUIT_SLOW_CALL_SECONDS = float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "10"))
+CIRCUIT_SLOW_CALL_RATE = float(os.getenv("CIRCUIT_SLOW_CALL_RATE", "0.8"))
+CIRCUIT_OPEN_SECONDS = float(os.getenv("CIRCUIT_OPEN_SECONDS", "30"))
+CIRCUIT_HALF_OPEN_CALLS = int(os.getenv("CIRCUIT_HALF_OPEN_CALLS", "2"))
+
+# Estados do circuito
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Requisição recusada porque o circuito do host está aberto"""
+
+    def __init__(self, name, retry_in):
+        super().__init__(f"Circuito de {name} aberto; nova tentativa em {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+class CircuitBreaker:
+    """Circuit breaker com limites de taxa de falhas e de chamadas lentas
+
+    As últimas `window_size` chamadas são avaliadas; com pelo menos
+    `min_calls` registradas, o circuito abre se a fração de falhas ou de
+    chamadas lentas passar do limite. Aberto, recusa chamadas por
+    `open_seconds` e depois libera `half_open_calls` chamadas de teste:
+    se todas derem certo o circuito fecha, senão volta a abrir.
+    """
+
+    def __init__(
+        self,
+        name="",
+        window_size=None,
+        min_calls=None,
+        failure_rate=None,
+        slow_call_seconds=None,
+        slow_call_rate=None,
+        open_seconds=None,
+        half_open_calls=None,
+    ):
+        self.name = name
+        self.window_size = window_size or CIRCUIT_WINDOW_SIZE
+        self.min_calls = min_calls or CIRCUIT_MIN_CALLS
+        self.failure_rate = failure_rate or CIRCUIT_FAILURE_RATE
+        self.slow_call_seconds = slow_call_seconds or CIRCUIT_SLOW_CALL_SECONDS
+        self.slow_call_rate = slow_call_rate or CIRCUIT_SLOW_CALL_RATE
+        self.open_seconds = open_seconds or CIRCUIT_OPEN_SECONDS
+        self.half_open_calls = half_open_calls or CIRCUIT_HALF_OPEN_CALLS
+
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._calls = deque(maxlen=self.window_size)
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        self._lock = threading.Lock()
+
+    def _transition(self, state):
+        """Muda de estado (chamado com o lock)"""
+        if state == self.state:
+            return
+        logger.warning(f"Circuito de {self.name}: {self.state} -> {state}")
+        self.state = state
+        if state == OPEN:
+            self.opened_at = time.monotonic()
+            self.times_opened += 1
+        elif state == HALF_OPEN:
+            self._probes_started = 0
+            self._probes_succeeded = 0
+        else:
+            self._calls.clear()
+
+    def _retry_in(self, now):
+        """Segundos até o circuito aceitar chamadas de teste"""
+        return max(self.opened_at + self.open_seconds - now, 0.0)
+
+    def is_available(self):
+        """Indica se uma chamada seria aceita agora (sem consumir teste)"""
+        with self._lock:
+            if self.state == OPEN:
+                return self._retry_in(time.monotonic()) <= 0
+            if self.state == HALF_OPEN:
+                return self._probes_started < self.half_open_calls
+            return True
+
+    def before_call(self):
+        """Autoriza uma chamada ou lança CircuitOpenError"""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == OPEN:
+                retry_in = self._retry_in(now)
+                if retry_in > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.name, retry_in)
+                self._transition(HALF_OPEN)
+
+            if self.state == HALF_OPEN:
+                if self._probes_started >= self.half_open_calls:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.name, self.open_seconds)
+                self._probes_started += 1
+
+    def record(self, success, duration=0.0):
+        """Registra o resultado de uma chamada autorizada"""
+        slow = duration >= self.slow_call_seconds
+        with self._lock:
+            if self.state == HALF_OPEN:
+                if not success or slow:
+                    self._transition(OPEN)
+                    return
+                self._probes_succeeded += 1
+                if self._probes_succeeded >= self.half_open_calls:
+                    self._transition(CLOSED)
+                return
+
+            if self.state != CLOSED:
+                return
+
+            self._calls.append((success, slow))
+            if len(self._calls) < self.min_calls:
+                return
+            total = len(self._calls)
+            failures = sum(1 for ok, _ in self._calls if not ok)
+            slow_calls = sum(1 for _, is_slow in self._calls if is_slow)
+            if failures / total >= self.failure_rate or slow_calls / total >= self.slow_call_rate:
+                self._transition(OPEN)
+
+    def record_response(self, status_code, duration=0.0):
+        """Registra uma resposta HTTP (5xx conta como falha)"""
+        self.record(status_code < 500, duration)
+
+    def stats(self):
+        """Estado atual e métricas do circuito"""
+        with self._lock:
+            total = len(self._calls)
+            return {
+                "name": self.name,
+                "state": self.state,
+                "calls": total,
+                "failure_rate": sum(1 for ok, _ in self._calls if not ok) / total if total else 0.0,
+                "slow_call_rate": sum(1 for _, slow in self._calls if slow) / total if total else 0.0,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+                "retry_in": self._retry_in(time.monotonic()) if self.state == OPEN else 0.0,
+            }
+
+# Circuitos registrados por host
+_breakers = {}
+
+def _host_of(url):
+    """Extrai o host de uma URL (ou retorna o próprio host)"""
+    return (urlsplit(url).netloc or url).lower()
+
+def configure(url, name=None, **kwargs):
+    """Registra o circuit breaker de um host"""
+    breaker = CircuitBreaker(name=name or _host_of(url), **kwargs)
+    _breakers[_host_of(url)] = breaker
+    return breaker
+
+def get_breaker(url):
+    """Retorna o circuito do host da URL, se houver"""
+    return _breakers.get(_host_of(url))
+
+def is_available(url):
+    """Indica se o host da URL está aceitando chamadas"""
+    breaker = get_breaker(url)
+    return breaker is None or breaker.is_available()
+
+def stats():
+    """Estado de todos os circuitos"""
+    return {host: breaker.stats() for host, breaker in _breakers.items()}
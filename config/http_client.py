@@ -0,0 +1,194 @@
+"""
+Transporte HTTP compartilhado pelas integrações externas
+"""
+import os
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+
+from config import rate_limit, circuit_breaker
+
+# Carrega variáveis de ambiente
+load_dotenv()
+
+# Configuração de logging
+logger = logging.getLogger(__name__)
+
+# Timeouts padrão (segundos)
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+
+# Tamanho padrão do pool de conexões keep-alive por host
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "4"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+
+# Sessões (e seus pools) indexadas por host
+_sessions = {}
+_host_config = {}
+_lock = threading.Lock()
+
+# Clientes assíncronos, um por event loop (o pool do httpx é ligado ao loop)
+_async_clients = weakref.WeakKeyDictionary()
+
+def _host_of(url):
+    """Extrai o host (com porta) de uma URL"""
+    return urlsplit(url).netloc.lower()
+
+def configure_host(host, pool_connections=None, pool_maxsize=None, connect_timeout=None, read_timeout=None):
+    """Ajusta pool e timeouts de um host específico
+
+    Deve ser chamada antes do primeiro uso do host; se a sessão já existir
+    ela é recriada com a nova configuração.
+    """
+    host = host.lower()
+    with _lock:
+        config = _host_config.setdefault(host, {})
+        if pool_connections is not None:
+            config["pool_connections"] = pool_connections
+        if pool_maxsize is not None:
+            config["pool_maxsize"] = pool_maxsize
+        if connect_timeout is not None:
+            config["connect_timeout"] = connect_timeout
+        if read_timeout is not None:
+            config["read_timeout"] = read_timeout
+
+        session = _sessions.pop(host, None)
+    if session is not None:
+        session.close()
+
+def get_timeout(url):
+    """Retorna a tupla (connect, read) de timeout para a URL"""
+    config = _host_config.get(_host_of(url), {})
+    return (
+        config.get("connect_timeout", HTTP_CONNECT_TIMEOUT),
+        config.get("read_timeout", HTTP_READ_TIMEOUT),
+    )
+
+def get_session(url):
+    """Retorna a sessão com pool keep-alive do host da URL"""
+    host = _host_of(url)
+    session = _sessions.get(host)
+    if session is not None:
+        return session
+
+    with _lock:
+        session = _sessions.get(host)
+        if session is None:
+            config = _host_config.get(host, {})
+            adapter = HTTPAdapter(
+                pool_connections=config.get("pool_connections", HTTP_POOL_CONNECTIONS),
+                pool_maxsize=config.get("pool_maxsize", HTTP_POOL_MAXSIZE),
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[host] = session
+            logger.debug(f"Pool HTTP criado para {host}")
+    return session
+
+def _record(breaker, response, start):
+    """Registra o resultado da chamada no circuito
+
+    Chamado em `finally`: qualquer saída sem resposta (erro de rede, outra
+    exceção, cancelamento) conta como falha, então a chamada de teste do
+    circuito meio aberto nunca fica presa.
+    """
+    if response is None:
+        breaker.record(False, time.monotonic() - start)
+    else:
+        breaker.record_response(response.status_code, time.monotonic() - start)
+
+def request(method, url, **kwargs):
+    """Faz uma requisição reaproveitando as conexões do host
+
+    Respeita o limitador de requisições do host e falha imediatamente com
+    CircuitOpenError enquanto o circuito do host estiver aberto.
+    """
+    kwargs.setdefault("timeout", get_timeout(url))
+    breaker = circuit_breaker.get_breaker(url)
+    if breaker is not None:
+        breaker.before_call()
+    start = time.monotonic()
+    response = None
+    try:
+        rate_limit.acquire(url)
+        start = time.monotonic()
+        response = get_session(url).request(method, url, **kwargs)
+    finally:
+        if breaker is not None:
+            _record(breaker, response, start)
+    rate_limit.observe(url, response)
+    return response
+
+def get(url, **kwargs):
+    """Atalho para requisições GET"""
+    return request("GET", url, **kwargs)
+
+def post(url, **kwargs):
+    """Atalho para requisições POST"""
+    return request("POST", url, **kwargs)
+
+def put(url, **kwargs):
+    """Atalho para requisições PUT"""
+    return request("PUT", url, **kwargs)
+
+def close_all():
+    """Fecha todas as sessões e libera as conexões"""
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+def get_async_client():
+    """Retorna o cliente assíncrono compartilhado do event loop atual
+
+    Um único pool atende todos os hosts; os limites seguem as mesmas
+    variáveis de ambiente do transporte síncrono.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_MAXSIZE * HTTP_POOL_CONNECTIONS,
+                max_keepalive_connections=HTTP_POOL_MAXSIZE,
+            ),
+        )
+        _async_clients[loop] = client
+        logger.debug("Cliente HTTP assíncrono criado")
+    return client
+
+async def arequest(method, url, **kwargs):
+    """Versão assíncrona de `request`"""
+    connect_timeout, read_timeout = get_timeout(url)
+    kwargs.setdefault("timeout", httpx.Timeout(read_timeout, connect=connect_timeout))
+    breaker = circuit_breaker.get_breaker(url)
+    if breaker is not None:
+        breaker.before_call()
+    start = time.monotonic()
+    response = None
+    try:
+        await rate_limit.acquire_async(url)
+        start = time.monotonic()
+        response = await get_async_client().request(method, url, **kwargs)
+    finally:
+        if breaker is not None:
+            _record(breaker, response, start)
+    rate_limit.observe(url, response)
+    return response
+
+async def aclose_all():
+    """Fecha o cliente assíncrono do event loop atual"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,71 @@
+"""
+Codificação e decodificação de JSON (orjson quando disponível)
+"""
+import os
+import json
+import logging
+
+from dotenv import load_dotenv
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende do ambiente
+    orjson = None
+
+# Carrega variáveis de ambiente
+load_dotenv()
+
+# Configuração de logging
+logger = logging.getLogger(__name__)
+
+# "auto" usa orjson se instalado; "stdlib" força o módulo json padrão
+JSON_CODEC = os.getenv("JSON_CODEC", "auto").lower()
+
+USE_ORJSON = orjson is not None and JSON_CODEC != "stdlib"
+BACKEND = "orjson" if USE_ORJSON else "json"
+
+if JSON_CODEC == "orjson" and orjson is None:
+    logger.warning("JSON_CODEC=orjson, mas o orjson não está instalado; usando json padrão")
+
+def loads(data):
+    """Decodifica JSON de bytes ou str
+
+    Erros de sintaxe lançam json.JSONDecodeError nos dois backends.
+    """
+    if USE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps_bytes(obj, indent=False):
+    """Codifica em JSON UTF-8 (bytes)"""
+    if USE_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+def dumps(obj, indent=False):
+    """Codifica em JSON (str)"""
+    if USE_ORJSON:
+        return dumps_bytes(obj, indent).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+def response_json(response):
+    """Decodifica o corpo de uma resposta HTTP (requests, httpx ou cache)
+
+    Lê os bytes do corpo direto, sem passar pelo `response.json()` do
+    cliente, que usa o módulo json padrão.
+    """
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray, str)) and content:
+        return loads(content)
+    return response.json()
+
+def response_class():
+    """Classe de resposta padrão para as aplicações FastAPI"""
+    if USE_ORJSON:
+        from fastapi.responses import ORJSONResponse
+        return ORJSONResponse
+    from fastapi.responses import JSONResponse
+    return JSONResponse
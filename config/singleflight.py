@@ -0,0 +1,123 @@
+"""
+Agrupamento de leituras idênticas concorrentes (single-flight)
+"""
+import copy
+import asyncio
+import functools
+import logging
+import threading
+import weakref
+
+# Configuração de logging
+logger = logging.getLogger(__name__)
+
+# Instâncias criadas, para exposição de métricas
+_registry = {}
+
+class _Call:
+    """Chamada em andamento compartilhada pelas threads que esperam"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+class SingleFlight:
+    """Executa uma única chamada por chave entre requisições simultâneas
+
+    Enquanto a primeira chamada para uma chave está em andamento, as
+    demais (threads com `do` ou corrotinas com `ado`) esperam por ela e
+    recebem o mesmo resultado ou a mesma exceção. Nada é guardado depois
+    que a chamada termina; para isso existem os caches.
+
+    Quem espera recebe uma cópia do resultado, para que uma alteração
+    feita por um chamador não apareça para os outros.
+    """
+
+    def __init__(self, name=""):
+        self.name = name
+        self.calls = 0
+        self.shared = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+        # Futures do asyncio pertencem a um event loop
+        self._async_calls = weakref.WeakKeyDictionary()
+        _registry[name] = self
+
+    def do(self, key, fn, *args, **kwargs):
+        """Executa `fn(*args, **kwargs)` ou espera a chamada igual em andamento"""
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            logger.debug(f"Aguardando leitura em andamento de {self.name}: {key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    async def ado(self, key, fn, *args, **kwargs):
+        """Versão assíncrona de `do` (`fn` retorna uma corrotina)
+
+        A chamada roda em uma tarefa própria: o cancelamento de qualquer
+        chamador, inclusive o que a iniciou, só interrompe a espera dele.
+        """
+        loop = asyncio.get_running_loop()
+        calls = self._async_calls.setdefault(loop, {})
+        self.calls += 1
+
+        task = calls.get(key)
+        leader = task is None
+        if leader:
+            task = loop.create_task(fn(*args, **kwargs))
+            calls[key] = task
+            task.add_done_callback(functools.partial(self._async_done, calls, key))
+        else:
+            self.shared += 1
+            logger.debug(f"Aguardando leitura em andamento de {self.name}: {key}")
+
+        result = await asyncio.shield(task)
+        return result if leader else copy.deepcopy(result)
+
+    @staticmethod
+    def _async_done(calls, key, task):
+        """Libera a chave quando a tarefa compartilhada termina"""
+        if calls.get(key) is task:
+            calls.pop(key)
+        if not task.cancelled():
+            # Evita o aviso de exceção não recuperada quando ninguém mais espera
+            task.exception()
+
+    def stats(self):
+        """Contadores de chamadas e de chamadas compartilhadas"""
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "shared": self.shared,
+            "in_flight": len(self._calls) + sum(len(c) for c in list(self._async_calls.values())),
+        }
+
+def stats():
+    """Métricas de todas as instâncias do processo"""
+    return {name: flight.stats() for name, flight in _registry.items()}
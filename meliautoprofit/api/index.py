@@ -1,4 +1,4 @@
-from app.main import app
-
-# Isso permite que a Vercel encontre a aplicação FastAPI
+from app.main import app
+
+# Isso permite que a Vercel encontre a aplicação FastAPI
 # como uma função serverless simples 
\ No newline at end of file
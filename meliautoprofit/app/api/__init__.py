@@ -1,7 +1,9 @@
-"""
-Pacote de integração com APIs externas
-"""
-from .mercado_livre import MercadoLivreAPI
-from .mercado_pago import MercadoPagoAPI
-from .fornecedor import FornecedorAPI, FornecedorType
+"""
+Pacote de integração com APIs externas
+"""
+from .mercado_livre import MercadoLivreAPI
+from .mercado_livre_async import AsyncMercadoLivreAPI
+from .mercado_pago import MercadoPagoAPI
+from .fornecedor import FornecedorAPI, FornecedorType
+from .adaptadores_fornecedor import SupplierAdapter, SupplierCandidate, register_adapter, get_adapter
 from .telegram import TelegramAPI 
\ No newline at end of file
@@ -0,0 +1,270 @@
+"""
+Adaptadores dos fornecedores e registro de fornecedores suportados
+"""
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.api_cjdropshipping import (
+    search_products as cj_search, get_product_details as cj_get_product_details,
+    create_order as cj_create_order, CJ_API_BASE_URL
+)
+from config.api_spocket import (
+    search_products as spocket_search, get_product_details as spocket_get_product_details,
+    create_order as spocket_create_order, SPOCKET_API_BASE_URL
+)
+
+def _numero(valor) -> Optional[float]:
+    """Converte preço/estoque do fornecedor em número (faixas "3.5-5.0" usam o início)"""
+    if valor is None or isinstance(valor, bool):
+        return None
+    if isinstance(valor, (int, float)):
+        return float(valor)
+    encontrado = re.search(r"\d+(?:\.\d+)?", str(valor))
+    return float(encontrado.group()) if encontrado else None
+
+class SupplierCandidate:
+    """Produto de fornecedor em formato único e compacto
+
+    Usa `__slots__` para ocupar bem menos memória que o dicionário do
+    JSON original em listas grandes de candidatos. `price`, `stock`,
+    `rating` e `shipping_days` (prazo de envio) ficam None quando o
+    fornecedor não os informou (a busca nem sempre traz esses campos).
+    Para o código que lê produtos como dicionário, `get`, `[]` e `in`
+    funcionam com os nomes dos campos.
+    """
+
+    __slots__ = (
+        "id", "fornecedor", "name", "description", "price", "stock", "rating",
+        "category", "sku", "images", "shipping_days", "updated_at", "origem",
+    )
+
+    def __init__(self, id, fornecedor, name="", description="", price=None, stock=None, rating=None,
+                 category="", sku="", images=(), shipping_days=None, updated_at=None, origem="api"):
+        self.id = str(id)
+        self.fornecedor = fornecedor
+        self.name = name
+        self.description = description
+        self.price = price
+        self.stock = stock
+        self.rating = rating
+        self.category = category
+        self.sku = sku
+        self.images = tuple(images)
+        self.shipping_days = shipping_days
+        self.updated_at = updated_at
+        self.origem = origem
+
+    @classmethod
+    def from_dict(cls, dados: Dict[str, Any], fornecedor: Optional[str] = None) -> "SupplierCandidate":
+        """Cria a partir de um dicionário já no formato normalizado"""
+        if isinstance(dados, cls):
+            return dados
+        valores = {campo: dados[campo] for campo in cls.__slots__ if campo in dados}
+        valores.setdefault("fornecedor", fornecedor)
+        return cls(**valores)
+
+    def replace(self, **campos) -> "SupplierCandidate":
+        """Cópia com alguns campos alterados"""
+        valores = self.to_dict()
+        valores.update(campos)
+        return SupplierCandidate(**valores)
+
+    def merge(self, outro: "SupplierCandidate") -> "SupplierCandidate":
+        """Cópia completada com os campos informados em `outro` (ex.: detalhes)"""
+        campos = {}
+        for campo in self.__slots__:
+            if campo in ("id", "fornecedor", "origem", "updated_at"):
+                continue
+            valor = getattr(outro, campo)
+            if valor not in (None, "", ()):
+                campos[campo] = valor
+        return self.replace(**campos)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dicionário com todos os campos (imagens como lista)"""
+        dados = {campo: getattr(self, campo) for campo in self.__slots__}
+        dados["images"] = list(self.images)
+        return dados
+
+    def get(self, campo, padrao=None):
+        """Leitura no estilo dicionário (campos vazios devolvem o padrão)"""
+        valor = getattr(self, campo, None) if campo in self.__slots__ else None
+        return padrao if valor is None else valor
+
+    def __getitem__(self, campo):
+        if campo not in self.__slots__:
+            raise KeyError(campo)
+        return getattr(self, campo)
+
+    def __contains__(self, campo):
+        return campo in self.__slots__ and getattr(self, campo) is not None
+
+    def __eq__(self, outro):
+        if not isinstance(outro, SupplierCandidate):
+            return NotImplemented
+        return self.to_dict() == outro.to_dict()
+
+    def __repr__(self):
+        return f"<SupplierCandidate {self.fornecedor}:{self.id} {self.name[:30]!r}>"
+
+class SupplierAdapter(ABC):
+    """Contrato de um fornecedor
+
+    Cada fornecedor declara o que suporta e como seus campos se chamam;
+    `normalize` converte o JSON de busca ou de detalhe em SupplierCandidate.
+    `search` é obrigatório; `get_details` e `create_order` só são chamados
+    quando `supports_detail`/`supports_order` estão ligados.
+    """
+
+    tipo = None
+    base_url = None
+
+    # Capacidades
+    supports_detail = False
+    supports_pagination = True
+    supports_order = False
+
+    # Parâmetros obrigatórios de create_order
+    order_params: Tuple[str, ...] = ()
+
+    # Nomes dos campos no JSON do fornecedor, em ordem de preferência
+    campos = {
+        "id": ("id",),
+        "name": ("name", "title"),
+        "description": ("description",),
+        "price": ("price",),
+        "stock": ("stock",),
+        "rating": ("rating",),
+        "category": ("category",),
+        "sku": ("sku",),
+        "images": ("images",),
+        "shipping_days": ("shipping_days", "delivery_days"),
+    }
+
+    @abstractmethod
+    def search(self, keyword, page=1, limit=20) -> List[Dict[str, Any]]:
+        """Busca produtos (JSON do fornecedor)"""
+
+    def search_many(self, keywords, page=1, limit=20) -> Dict[str, List[Dict[str, Any]]]:
+        """Busca várias palavras-chave (uma chamada por palavra; sobrescreva se houver busca em lote)"""
+        return {keyword: self.search(keyword, page, limit) for keyword in keywords}
+
+    def get_details(self, product_id) -> Optional[Dict[str, Any]]:
+        """Detalhes de um produto (JSON do fornecedor); obrigatório com `supports_detail`"""
+        raise NotImplementedError(f"{self.tipo} não consulta detalhes de produto")
+
+    def create_order(self, **kwargs):
+        """Cria um pedido no fornecedor; obrigatório com `supports_order`"""
+        raise NotImplementedError(f"{self.tipo} não cria pedidos")
+
+    def __init_subclass__(cls, **kwargs):
+        """Falha na definição da classe se uma capacidade ligada não tiver implementação"""
+        super().__init_subclass__(**kwargs)
+        for capacidade, metodo in (("supports_detail", "get_details"), ("supports_order", "create_order")):
+            if getattr(cls, capacidade) and getattr(cls, metodo) is getattr(SupplierAdapter, metodo):
+                raise TypeError(f"{cls.__name__} declara {capacidade} sem implementar {metodo}")
+
+    def _campo(self, dados, campo):
+        """Primeiro valor presente entre os nomes declarados para o campo"""
+        for nome in self.campos.get(campo, ()):
+            if dados.get(nome) not in (None, ""):
+                return dados[nome]
+        return None
+
+    def normalize(self, dados: Dict[str, Any]) -> SupplierCandidate:
+        """Converte o JSON do fornecedor em SupplierCandidate"""
+        imagens = self._campo(dados, "images") or ()
+        if isinstance(imagens, str):
+            imagens = (imagens,)
+
+        estoque = _numero(self._campo(dados, "stock"))
+        prazo = _numero(self._campo(dados, "shipping_days"))
+        return SupplierCandidate(
+            id=self._campo(dados, "id") or "",
+            fornecedor=self.tipo,
+            name=self._campo(dados, "name") or "",
+            description=self._campo(dados, "description") or "",
+            price=_numero(self._campo(dados, "price")),
+            stock=int(estoque) if estoque is not None else None,
+            rating=_numero(self._campo(dados, "rating")),
+            category=self._campo(dados, "category") or "",
+            sku=self._campo(dados, "sku") or "",
+            images=imagens,
+            shipping_days=int(prazo) if prazo is not None else None,
+        )
+
+class CJDropshippingAdapter(SupplierAdapter):
+    """CJ Dropshipping"""
+
+    tipo = "cj_dropshipping"
+    base_url = CJ_API_BASE_URL
+    supports_detail = True
+    supports_order = True
+    order_params = ("product_id", "quantity", "shipping_address")
+
+    campos = dict(
+        SupplierAdapter.campos,
+        id=("pid", "id"),
+        name=("productNameEn", "name", "title"),
+        description=("description", "productDescription"),
+        price=("sellPrice", "price"),
+        stock=("stock", "inventory"),
+        category=("categoryName", "category"),
+        sku=("productSku", "sku"),
+        images=("images", "productImage"),
+        shipping_days=("deliveryTime", "shipping_days"),
+    )
+
+    def search(self, keyword, page=1, limit=20):
+        return cj_search(keyword, page, limit)
+
+    def get_details(self, product_id):
+        return cj_get_product_details(product_id)
+
+    def create_order(self, **kwargs):
+        return cj_create_order(kwargs["product_id"], kwargs["quantity"], kwargs["shipping_address"])
+
+class SpocketAdapter(SupplierAdapter):
+    """Spocket"""
+
+    tipo = "spocket"
+    base_url = SPOCKET_API_BASE_URL
+    supports_detail = True
+    supports_order = True
+    order_params = ("variant_id", "quantity", "shipping_address")
+
+    campos = dict(
+        SupplierAdapter.campos,
+        name=("title", "name"),
+        stock=("inventory_quantity", "stock"),
+        shipping_days=("processing_time", "shipping_days"),
+    )
+
+    def search(self, keyword, page=1, limit=20):
+        return spocket_search(keyword, page, limit)
+
+    def get_details(self, product_id):
+        return spocket_get_product_details(product_id)
+
+    def create_order(self, **kwargs):
+        return spocket_create_order(kwargs["variant_id"], kwargs["quantity"], kwargs["shipping_address"])
+
+# Fornecedores registrados, na ordem de registro
+_adapters: Dict[str, SupplierAdapter] = {}
+
+def register_adapter(adapter: SupplierAdapter) -> SupplierAdapter:
+    """Registra (ou substitui) o adaptador de um fornecedor"""
+    _adapters[adapter.tipo] = adapter
+    return adapter
+
+def get_adapter(tipo) -> Optional[SupplierAdapter]:
+    """Adaptador do fornecedor (aceita o valor ou o FornecedorType)"""
+    return _adapters.get(getattr(tipo, "value", tipo))
+
+def registered_types() -> List[str]:
+    """Tipos de fornecedor registrados"""
+    return list(_adapters)
+
+register_adapter(CJDropshippingAdapter())
+register_adapter(SpocketAdapter())
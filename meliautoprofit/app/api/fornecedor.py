@@ -1,111 +1,238 @@
-"""
-Integração com APIs de fornecedores
-"""
-import logging
-from fastapi import HTTPException
-from enum import Enum
-from ..config import setup_logger
-from config.api_cjdropshipping import search_products as cj_search, create_order as cj_create_order
-from config.api_spocket import search_products as spocket_search, get_product_details, create_order as spocket_create_order
-
-# Configuração de logger
-logger = setup_logger(__name__)
-
-class FornecedorType(str, Enum):
-    """Tipos de fornecedores suportados"""
-    CJ_DROPSHIPPING = "cj_dropshipping"
-    SPOCKET = "spocket"
-
-class FornecedorAPI:
-    """Classe para integração com APIs de fornecedores"""
-    
-    def __init__(self, fornecedor_type=None):
-        """Inicializa a API do fornecedor"""
-        self.fornecedor_type = fornecedor_type
-    
-    def set_fornecedor(self, fornecedor_type):
-        """Define o tipo de fornecedor a ser usado"""
-        if fornecedor_type not in [ft.value for ft in FornecedorType]:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Tipo de fornecedor não suportado: {fornecedor_type}"
-            )
-        
-        self.fornecedor_type = fornecedor_type
-    
-    def search_products(self, keyword, page=1, limit=20):
-        """Busca produtos no catálogo do fornecedor"""
-        logger.debug(f"Buscando produtos com keyword '{keyword}' no fornecedor {self.fornecedor_type}")
-        
-        if not self.fornecedor_type:
-            raise HTTPException(status_code=400, detail="Tipo de fornecedor não definido")
-        
-        if self.fornecedor_type == FornecedorType.CJ_DROPSHIPPING:
-            return cj_search(keyword, page, limit)
-        elif self.fornecedor_type == FornecedorType.SPOCKET:
-            return spocket_search(keyword, page, limit)
-        else:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Tipo de fornecedor não suportado: {self.fornecedor_type}"
-            )
-    
-    def get_product_details(self, product_id):
-        """Obtém detalhes de um produto específico"""
-        logger.debug(f"Obtendo detalhes do produto {product_id} do fornecedor {self.fornecedor_type}")
-        
-        if not self.fornecedor_type:
-            raise HTTPException(status_code=400, detail="Tipo de fornecedor não definido")
-        
-        if self.fornecedor_type == FornecedorType.SPOCKET:
-            return get_product_details(product_id)
-        else:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Operação não suportada para o fornecedor: {self.fornecedor_type}"
-            )
-    
-    def create_order(self, **kwargs):
-        """Cria um pedido no fornecedor"""
-        logger.debug(f"Criando pedido no fornecedor {self.fornecedor_type}")
-        
-        if not self.fornecedor_type:
-            raise HTTPException(status_code=400, detail="Tipo de fornecedor não definido")
-        
-        if self.fornecedor_type == FornecedorType.CJ_DROPSHIPPING:
-            # Verifica parâmetros esperados
-            required_params = ["product_id", "quantity", "shipping_address"]
-            for param in required_params:
-                if param not in kwargs:
-                    raise HTTPException(
-                        status_code=400, 
-                        detail=f"Parâmetro obrigatório ausente: {param}"
-                    )
-            
-            return cj_create_order(
-                kwargs["product_id"],
-                kwargs["quantity"],
-                kwargs["shipping_address"]
-            )
-        
-        elif self.fornecedor_type == FornecedorType.SPOCKET:
-            # Verifica parâmetros esperados
-            required_params = ["variant_id", "quantity", "shipping_address"]
-            for param in required_params:
-                if param not in kwargs:
-                    raise HTTPException(
-                        status_code=400, 
-                        detail=f"Parâmetro obrigatório ausente: {param}"
-                    )
-            
-            return spocket_create_order(
-                kwargs["variant_id"],
-                kwargs["quantity"],
-                kwargs["shipping_address"]
-            )
-        
-        else:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Tipo de fornecedor não suportado: {self.fornecedor_type}"
-            ) 
\ No newline at end of file
+"""
+Integração com APIs de fornecedores
+"""
+import copy
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List
+from fastapi import HTTPException
+from enum import Enum
+from ..config import (
+    setup_logger, SUPPLIER_SEARCH_CACHE_TTL, SUPPLIER_SEARCH_PAGE_SIZE, SUPPLIER_SEARCH_MAX_PAGES
+)
+from .adaptadores_fornecedor import get_adapter
+from config import circuit_breaker
+from config.cache import TTLCache
+from config.singleflight import SingleFlight
+
+# Configuração de logger
+logger = setup_logger(__name__)
+
+class FornecedorType(str, Enum):
+    """Tipos de fornecedores nativos (outros podem ser registrados em adaptadores_fornecedor)"""
+    CJ_DROPSHIPPING = "cj_dropshipping"
+    SPOCKET = "spocket"
+
+# Leituras de detalhes idênticas simultâneas viram uma única chamada
+fornecedor_reads = SingleFlight("fornecedores")
+
+# Resultados de busca por (fornecedor, palavra-chave normalizada, página, limite)
+search_cache = TTLCache.from_env("fornecedor_buscas", ttl=SUPPLIER_SEARCH_CACHE_TTL)
+
+def _search_key(fornecedor_type, keyword, page, limit):
+    """Chave da busca no cache (palavra-chave em minúsculas e com espaços simples)"""
+    keyword = " ".join(str(keyword or "").lower().split())
+    return f"{fornecedor_type}|{keyword}|{page}|{limit}"
+
+def iter_pages(fetch_page: Callable[[int], List], max_pages: int = SUPPLIER_SEARCH_MAX_PAGES,
+               page_size: int = SUPPLIER_SEARCH_PAGE_SIZE, prefetch: bool = True) -> Iterator[List]:
+    """Percorre as páginas de uma busca sob demanda
+    
+    `fetch_page(page)` devolve a lista de uma página. Com `prefetch`, a
+    página seguinte é buscada em segundo plano enquanto quem consome
+    processa a atual. A leitura termina na primeira página vazia ou
+    incompleta (menos que `page_size` itens), ao atingir `max_pages` ou
+    quando o consumidor para de iterar (a página adiantada é descartada).
+    """
+    max_pages = max(1, max_pages)
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pagina-fornecedor") if prefetch else None
+    
+    try:
+        proxima = executor.submit(fetch_page, 1) if executor else None
+        for page in range(1, max_pages + 1):
+            itens = proxima.result() if executor else fetch_page(page)
+            if not itens:
+                return
+            
+            ultima = page >= max_pages or len(itens) < page_size
+            if executor and not ultima:
+                proxima = executor.submit(fetch_page, page + 1)
+            
+            yield itens
+            
+            if ultima:
+                return
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+class FornecedorAPI:
+    """Classe para integração com APIs de fornecedores
+    
+    As chamadas são repassadas ao adaptador registrado para o fornecedor
+    (ver adaptadores_fornecedor); cache, single-flight e circuit breaker
+    ficam aqui e valem para todos.
+    """
+    
+    def __init__(self, fornecedor_type=None):
+        """Inicializa a API do fornecedor"""
+        self.fornecedor_type = fornecedor_type
+    
+    def set_fornecedor(self, fornecedor_type):
+        """Define o tipo de fornecedor a ser usado"""
+        if get_adapter(fornecedor_type) is None:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Tipo de fornecedor não suportado: {fornecedor_type}"
+            )
+        
+        self.fornecedor_type = fornecedor_type
+    
+    def _adapter(self, capability=None):
+        """Adaptador do fornecedor atual, opcionalmente exigindo uma capacidade"""
+        if not self.fornecedor_type:
+            raise HTTPException(status_code=400, detail="Tipo de fornecedor não definido")
+        
+        adapter = get_adapter(self.fornecedor_type)
+        if adapter is None:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Tipo de fornecedor não suportado: {self.fornecedor_type}"
+            )
+        if capability and not getattr(adapter, capability):
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Operação não suportada para o fornecedor: {self.fornecedor_type}"
+            )
+        return adapter
+    
+    def is_available(self, fornecedor_type=None):
+        """Indica se o circuito do fornecedor está aceitando chamadas"""
+        adapter = get_adapter(fornecedor_type or self.fornecedor_type)
+        return adapter is None or not adapter.base_url or circuit_breaker.is_available(adapter.base_url)
+    
+    def reliability(self, fornecedor_type=None):
+        """Confiabilidade do fornecedor, de 0 a 1 (1 menos a taxa de falhas recente do circuito)"""
+        adapter = get_adapter(fornecedor_type or self.fornecedor_type)
+        breaker = circuit_breaker.get_breaker(adapter.base_url) if adapter and adapter.base_url else None
+        if breaker is None:
+            return 1.0
+        stats = breaker.stats()
+        if stats["state"] == circuit_breaker.OPEN:
+            return 0.0
+        return 1.0 - stats["failure_rate"]
+    
+    def _check_available(self):
+        """Falha imediatamente se o circuito do fornecedor estiver aberto"""
+        if not self.is_available():
+            raise HTTPException(
+                status_code=503,
+                detail=f"Fornecedor {self.fornecedor_type} temporariamente indisponível"
+            )
+    
+    def search_products(self, keyword, page=1, limit=20, force_refresh=False):
+        """Busca produtos no catálogo do fornecedor (JSON do fornecedor)
+        
+        Resultados não vazios ficam em cache por SUPPLIER_SEARCH_CACHE_TTL
+        segundos; `force_refresh` ignora o cache e o atualiza.
+        """
+        logger.debug(f"Buscando produtos com keyword '{keyword}' no fornecedor {self.fornecedor_type}")
+        
+        adapter = self._adapter()
+        if page > 1 and not adapter.supports_pagination:
+            return []
+        
+        key = _search_key(adapter.tipo, keyword, page, limit)
+        if not force_refresh:
+            cached = search_cache.get(key)
+            if cached is not None:
+                logger.debug(f"Busca '{keyword}' do fornecedor {self.fornecedor_type} servida pelo cache")
+                return copy.deepcopy(cached)
+        
+        self._check_available()
+        
+        produtos = fornecedor_reads.do(("busca", key), adapter.search, keyword, page, limit)
+        
+        # Lista vazia também é o retorno de erro das funções de busca; não vai para o cache
+        if produtos:
+            search_cache.set(key, copy.deepcopy(produtos))
+        return produtos
+    
+    def search_candidates(self, keyword, page=1, limit=20, force_refresh=False):
+        """Busca produtos já normalizados em SupplierCandidate"""
+        adapter = self._adapter()
+        produtos = self.search_products(keyword, page, limit, force_refresh)
+        return [adapter.normalize(produto) for produto in produtos]
+    
+    def iter_candidates(self, keyword, limit=SUPPLIER_SEARCH_PAGE_SIZE, max_pages=SUPPLIER_SEARCH_MAX_PAGES,
+                        prefetch=True):
+        """Gerador das páginas de busca normalizadas, lidas sob demanda (ver `iter_pages`)"""
+        adapter = self._adapter()
+        if not adapter.supports_pagination:
+            max_pages = 1
+        return iter_pages(
+            lambda page: self.search_candidates(keyword, page, limit), max_pages, limit, prefetch
+        )
+    
+    def normalize(self, produto):
+        """Converte o JSON do fornecedor atual em SupplierCandidate"""
+        return self._adapter().normalize(produto)
+    
+    def get_product_details(self, product_id):
+        """Obtém detalhes de um produto específico (JSON do fornecedor)"""
+        logger.debug(f"Obtendo detalhes do produto {product_id} do fornecedor {self.fornecedor_type}")
+        
+        adapter = self._adapter("supports_detail")
+        self._check_available()
+        return fornecedor_reads.do((adapter.tipo, product_id), adapter.get_details, product_id)
+    
+    def get_products_details(self, product_ids, max_workers=4):
+        """Obtém detalhes de vários produtos em paralelo
+        
+        Cada produto passa pelo cache de detalhes e pelo single-flight;
+        falhas individuais não interrompem os demais.
+        
+        Returns:
+            Dicionário {product_id: detalhes ou None}
+        """
+        ids = list(dict.fromkeys(product_ids))
+        logger.debug(f"Obtendo detalhes de {len(ids)} produtos do fornecedor {self.fornecedor_type}")
+        if not ids:
+            return {}
+        
+        def obter(product_id):
+            try:
+                return self.get_product_details(product_id)
+            except Exception as e:
+                logger.error(f"Erro ao obter detalhes do produto {product_id}: {str(e)}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ids)))) as executor:
+            return dict(zip(ids, executor.map(obter, ids)))
+    
+    def get_candidates_details(self, product_ids, max_workers=4):
+        """Versão de `get_products_details` que devolve SupplierCandidate (ou None)"""
+        adapter = self._adapter("supports_detail")
+        detalhes = self.get_products_details(product_ids, max_workers)
+        return {
+            product_id: adapter.normalize(dados) if dados else None
+            for product_id, dados in detalhes.items()
+        }
+    
+    def create_order(self, **kwargs):
+        """Cria um pedido no fornecedor"""
+        logger.debug(f"Criando pedido no fornecedor {self.fornecedor_type}")
+        
+        adapter = self._adapter("supports_order")
+        
+        # Verifica parâmetros esperados
+        for param in adapter.order_params:
+            if param not in kwargs:
+                raise HTTPException(
+                    status_code=400, 
+                    detail=f"Parâmetro obrigatório ausente: {param}"
+                )
+        
+        self._check_available()
+        
+        return adapter.create_order(**kwargs)
@@ -1,261 +1,490 @@
-"""
-Integração com a API do Mercado Livre
-"""
-import requests
-import logging
-import time
-from fastapi import HTTPException
-from functools import wraps
-from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type
-from ..config import setup_logger
-from config.api_mercadolivre import get_access_token, get_trends
-
-# Configuração de logger
-logger = setup_logger(__name__)
-
-class MercadoLivreAPI:
-    """Classe para integração com o Mercado Livre"""
-    
-    def __init__(self):
-        """Inicializa a API do Mercado Livre"""
-        self.token = None
-        self.refresh_token()
-    
-    def refresh_token(self):
-        """Obtém um novo token de acesso"""
-        logger.debug("Atualizando token de acesso do Mercado Livre")
-        self.token = get_access_token()
-        return self.token is not None
-    
-    @retry(
-        retry=retry_if_exception_type((requests.exceptions.HTTPError, ConnectionError)),
-        stop=stop_after_attempt(3),
-        wait=wait_fixed(60),
-        before_sleep=lambda retry_state: logger.debug(
-            f"Retry após erro de API. Tentativa {retry_state.attempt_number}/3"
-        )
-    )
-    def _request_with_retry(self, method, url, **kwargs):
-        """Faz uma requisição com retry em caso de erro 429"""
-        logger.debug(f"Fazendo requisição {method} para {url}")
-        
-        response = requests.request(method, url, **kwargs)
-        
-        # Se for erro 429 (Too Many Requests), lança uma exceção que será capturada pelo retry
-        if response.status_code == 429:
-            logger.warning(f"API rate limit excedido: {response.text}")
-            response.raise_for_status()
-        
-        return response
-    
-    def get_trends(self, limit=10):
-        """Obtém as tendências de busca"""
-        logger.debug(f"Obtendo top {limit} tendências do Mercado Livre")
-        trends = get_trends()
-        return trends[:limit] if trends else []
-    
-    def get_item(self, item_id):
-        """Obtém detalhes de um item específico"""
-        logger.debug(f"Obtendo detalhes do item {item_id}")
-        if not self.token:
-            if not self.refresh_token():
-                raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
-        
-        headers = {"Authorization": f"Bearer {self.token}"}
-        
-        try:
-            response = self._request_with_retry(
-                "GET",
-                f"https://api.mercadolibre.com/items/{item_id}",
-                headers=headers
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 401:
-                # Tenta renovar o token e tentar novamente
-                if self.refresh_token():
-                    return self.get_item(item_id)
-                else:
-                    raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
-            else:
-                logger.error(f"Erro ao obter item {item_id}: {response.text}")
-                raise HTTPException(status_code=response.status_code, detail=response.text)
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Erro de requisição ao obter item {item_id}: {str(e)}")
-            raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}")
-    
-    def create_item(self, item_data):
-        """Cria um novo item/anúncio"""
-        logger.debug(f"Criando novo item: {item_data.get('title')}")
-        if not self.token:
-            if not self.refresh_token():
-                raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
-        
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json"
-        }
-        
-        try:
-            response = self._request_with_retry(
-                "POST",
-                "https://api.mercadolibre.com/items",
-                headers=headers,
-                json=item_data
-            )
-            
-            if response.status_code in (200, 201):
-                return response.json()
-            elif response.status_code == 401:
-                # Tenta renovar o token e tentar novamente
-                if self.refresh_token():
-                    return self.create_item(item_data)
-                else:
-                    raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
-            else:
-                logger.error(f"Erro ao criar item: {response.text}")
-                raise HTTPException(status_code=response.status_code, detail=response.text)
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Erro de requisição ao criar item: {str(e)}")
-            raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}")
-    
-    def update_item(self, item_id, item_data):
-        """Atualiza um item existente"""
-        logger.debug(f"Atualizando item {item_id}")
-        if not self.token:
-            if not self.refresh_token():
-                raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
-        
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json"
-        }
-        
-        try:
-            response = self._request_with_retry(
-                "PUT",
-                f"https://api.mercadolibre.com/items/{item_id}",
-                headers=headers,
-                json=item_data
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 401:
-                # Tenta renovar o token e tentar novamente
-                if self.refresh_token():
-                    return self.update_item(item_id, item_data)
-                else:
-                    raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
-            else:
-                logger.error(f"Erro ao atualizar item {item_id}: {response.text}")
-                raise HTTPException(status_code=response.status_code, detail=response.text)
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Erro de requisição ao atualizar item {item_id}: {str(e)}")
-            raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}")
-    
-    def get_orders(self, status="paid", limit=50, offset=0):
-        """Obtém pedidos com um determinado status"""
-        logger.debug(f"Obtendo pedidos com status '{status}'")
-        if not self.token:
-            if not self.refresh_token():
-                raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
-        
-        headers = {"Authorization": f"Bearer {self.token}"}
-        params = {
-            "status": status,
-            "limit": limit,
-            "offset": offset
-        }
-        
-        try:
-            response = self._request_with_retry(
-                "GET",
-                "https://api.mercadolibre.com/orders/search",
-                headers=headers,
-                params=params
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 401:
-                # Tenta renovar o token e tentar novamente
-                if self.refresh_token():
-                    return self.get_orders(status, limit, offset)
-                else:
-                    raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
-            else:
-                logger.error(f"Erro ao obter pedidos: {response.text}")
-                raise HTTPException(status_code=response.status_code, detail=response.text)
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Erro de requisição ao obter pedidos: {str(e)}")
-            raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}")
-    
-    def get_order(self, order_id):
-        """Obtém detalhes de um pedido específico"""
-        logger.debug(f"Obtendo detalhes do pedido {order_id}")
-        if not self.token:
-            if not self.refresh_token():
-                raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
-        
-        headers = {"Authorization": f"Bearer {self.token}"}
-        
-        try:
-            response = self._request_with_retry(
-                "GET",
-                f"https://api.mercadolibre.com/orders/{order_id}",
-                headers=headers
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 401:
-                # Tenta renovar o token e tentar novamente
-                if self.refresh_token():
-                    return self.get_order(order_id)
-                else:
-                    raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
-            else:
-                logger.error(f"Erro ao obter pedido {order_id}: {response.text}")
-                raise HTTPException(status_code=response.status_code, detail=response.text)
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Erro de requisição ao obter pedido {order_id}: {str(e)}")
-            raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}")
-    
-    def get_shipping(self, shipping_id):
-        """Obtém detalhes de uma entrega"""
-        logger.debug(f"Obtendo detalhes da entrega {shipping_id}")
-        if not self.token:
-            if not self.refresh_token():
-                raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
-        
-        headers = {"Authorization": f"Bearer {self.token}"}
-        
-        try:
-            response = self._request_with_retry(
-                "GET",
-                f"https://api.mercadolibre.com/shipments/{shipping_id}",
-                headers=headers
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 401:
-                # Tenta renovar o token e tentar novamente
-                if self.refresh_token():
-                    return self.get_shipping(shipping_id)
-                else:
-                    raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
-            else:
-                logger.error(f"Erro ao obter entrega {shipping_id}: {response.text}")
-                raise HTTPException(status_code=response.status_code, detail=response.text)
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Erro de requisição ao obter entrega {shipping_id}: {str(e)}")
+"""
+Integração com a API do Mercado Livre
+"""
+import requests
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException
+from functools import wraps
+from tenacity import retry, stop_after_attempt, retry_if_exception_type
+from ..config import setup_logger
+from config.api_mercadolivre import token_manager, get_trends, ML_ITEMS_URL, ML_API_BASE_URL, item_cache, shipment_cache
+from config import http_client, circuit_breaker, json_codec, rate_limit
+from config.singleflight import SingleFlight
+
+# Configuração de logger
+logger = setup_logger(__name__)
+
+# Máximo de IDs aceitos pelo multiget /items?ids=
+ML_MULTIGET_LIMIT = 20
+
+# Maior offset aceito pelo /orders/search
+ML_ORDERS_MAX_OFFSET = 10000
+
+# Cursores de retomada: parâmetro de filtro e campo correspondente no pedido
+ORDER_CURSORS = {
+    "date_created": ("order.date_created.from", "date_created"),
+    "last_updated": ("order.date_last_updated.from", "last_updated"),
+}
+
+# Leituras idênticas simultâneas viram uma única chamada (compartilhado com o cliente assíncrono)
+ml_reads = SingleFlight("mercado_livre")
+
+def _espera_retry_after(retry_state):
+    """Espera antes da próxima tentativa após um 429
+
+    Usa o Retry-After (ou X-RateLimit-Reset) da resposta; sem o cabeçalho,
+    espera 1 s, 2 s, ... Serve para as respostas do requests e do httpx.
+    """
+    resposta = getattr(retry_state.outcome.exception(), "response", None)
+    espera = rate_limit.retry_delay(resposta.headers) if resposta is not None else None
+    if espera is None:
+        espera = 2 ** (retry_state.attempt_number - 1)
+    return min(espera, rate_limit.MAX_PENALTY)
+
+def _chunks(ids, size):
+    """Divide a lista de IDs em blocos de até `size` elementos"""
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+def _map_multiget(chunk, response):
+    """Associa cada entrada do multiget ao seu ID
+
+    O Mercado Livre devolve as entradas na ordem dos IDs pedidos; o `id`
+    do corpo é usado quando presente.
+    """
+    if response.status_code != 200:
+        erro = {"code": response.status_code, "body": {"error": response.text}}
+        return {item_id: dict(erro) for item_id in chunk}
+
+    resultado = {}
+    for item_id, entrada in zip(chunk, json_codec.response_json(response)):
+        body = entrada.get("body") or {}
+        resultado[body.get("id", item_id)] = {"code": entrada.get("code"), "body": body}
+    return resultado
+
+class MercadoLivreAPI:
+    """Classe para integração com o Mercado Livre"""
+    
+    def __init__(self):
+        """Inicializa a API do Mercado Livre
+
+        O token é compartilhado por todas as instâncias através do
+        `token_manager`, então a construção não faz chamadas de rede.
+        """
+        self._token_em_uso = None
+    
+    @property
+    def token(self):
+        """Token de acesso atual do gerenciador compartilhado"""
+        self._token_em_uso = token_manager.get_token()
+        return self._token_em_uso
+    
+    def refresh_token(self):
+        """Renova o token após um 401, se outra instância ainda não o fez"""
+        logger.debug("Atualizando token de acesso do Mercado Livre")
+        self._token_em_uso = token_manager.refresh_if_stale(self._token_em_uso)
+        return self._token_em_uso is not None
+    
+    def is_available(self):
+        """Indica se o circuito do Mercado Livre está aceitando chamadas"""
+        return circuit_breaker.is_available(ML_API_BASE_URL)
+    
+    @retry(
+        retry=retry_if_exception_type((requests.exceptions.HTTPError, ConnectionError)),
+        stop=stop_after_attempt(3),
+        wait=_espera_retry_after,
+        # Esgotadas as tentativas, o chamador recebe o próprio HTTPError (um RequestException)
+        reraise=True,
+        before_sleep=lambda retry_state: logger.debug(
+            f"Retry após erro de API. Tentativa {retry_state.attempt_number}/3"
+        )
+    )
+    def _request_with_retry(self, method, url, **kwargs):
+        """Faz uma requisição com retry em caso de erro 429
+
+        A próxima tentativa sai depois do tempo indicado em
+        Retry-After/X-RateLimit-Reset. Se todas falharem, o HTTPError do
+        último 429 é relançado.
+        """
+        logger.debug(f"Fazendo requisição {method} para {url}")
+        
+        response = http_client.request(method, url, **kwargs)
+        
+        # Se for erro 429 (Too Many Requests), lança uma exceção que será capturada pelo retry
+        if response.status_code == 429:
+            logger.warning(f"API rate limit excedido: {response.text}")
+            response.raise_for_status()
+        
+        return response
+    
+    def _get_with_retry(self, url, **kwargs):
+        """GET com retry, no formato esperado pelos caches HTTP"""
+        return self._request_with_retry("GET", url, **kwargs)
+    
+    def get_trends(self, limit=10):
+        """Obtém as tendências de busca"""
+        logger.debug(f"Obtendo top {limit} tendências do Mercado Livre")
+        trends = get_trends()
+        return trends[:limit] if trends else []
+    
+    def get_item(self, item_id):
+        """Obtém detalhes de um item específico
+
+        Chamadas simultâneas para o mesmo item compartilham uma única
+        requisição.
+        """
+        return ml_reads.do(("item", item_id), self._fetch_item, item_id)
+    
+    def _fetch_item(self, item_id):
+        """Obtém detalhes de um item específico"""
+        logger.debug(f"Obtendo detalhes do item {item_id}")
+        if not self.token:
+            if not self.refresh_token():
+                raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
+        
+        headers = {"Authorization": f"Bearer {self.token}"}
+        
+        try:
+            response = item_cache.fetch(
+                f"{ML_API_BASE_URL}/items/{item_id}",
+                self._get_with_retry,
+                headers=headers
+            )
+            
+            if response.status_code == 200:
+                return json_codec.response_json(response)
+            elif response.status_code == 401:
+                # Tenta renovar o token e tentar novamente
+                if self.refresh_token():
+                    return self._fetch_item(item_id)
+                else:
+                    raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
+            else:
+                logger.error(f"Erro ao obter item {item_id}: {response.text}")
+                raise HTTPException(status_code=response.status_code, detail=response.text)
+                
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Erro de requisição ao obter item {item_id}: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}")
+    
+    def _get_items_chunk(self, chunk, attributes=None):
+        """Busca um bloco de itens pelo multiget"""
+        params = {"ids": ",".join(chunk)}
+        if attributes:
+            params["attributes"] = ",".join(attributes)
+        
+        response = self._request_with_retry(
+            "GET",
+            ML_ITEMS_URL,
+            headers={"Authorization": f"Bearer {self.token}"},
+            params=params
+        )
+        if response.status_code == 401 and self.refresh_token():
+            response = self._request_with_retry(
+                "GET",
+                ML_ITEMS_URL,
+                headers={"Authorization": f"Bearer {self._token_em_uso}"},
+                params=params
+            )
+        
+        if response.status_code != 200:
+            logger.error(f"Erro no multiget de {len(chunk)} itens: {response.text}")
+        return _map_multiget(chunk, response)
+    
+    def get_items(self, item_ids, attributes=None, max_workers=4):
+        """Obtém vários itens com o multiget, em blocos concorrentes
+        
+        Args:
+            item_ids: IDs dos itens
+            attributes: Lista opcional de atributos a retornar (projeção)
+            max_workers: Blocos buscados em paralelo
+            
+        Returns:
+            Dicionário {item_id: {"code": status, "body": dados}}
+        """
+        ids = list(dict.fromkeys(item_ids))
+        logger.debug(f"Obtendo {len(ids)} itens via multiget")
+        if not ids:
+            return {}
+        if not self.token:
+            if not self.refresh_token():
+                raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
+        
+        resultado = {}
+        blocos = _chunks(ids, ML_MULTIGET_LIMIT)
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(blocos))) as executor:
+                for parcial in executor.map(lambda bloco: self._get_items_chunk(bloco, attributes), blocos):
+                    resultado.update(parcial)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Erro de requisição no multiget de itens: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}")
+        
+        return resultado
+    
+    def create_item(self, item_data):
+        """Cria um novo item/anúncio"""
+        logger.debug(f"Criando novo item: {item_data.get('title')}")
+        if not self.token:
+            if not self.refresh_token():
+                raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
+        
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json"
+        }
+        
+        try:
+            response = self._request_with_retry(
+                "POST",
+                f"{ML_API_BASE_URL}/items",
+                headers=headers,
+                json=item_data
+            )
+            
+            if response.status_code in (200, 201):
+                return json_codec.response_json(response)
+            elif response.status_code == 401:
+                # Tenta renovar o token e tentar novamente
+                if self.refresh_token():
+                    return self.create_item(item_data)
+                else:
+                    raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
+            else:
+                logger.error(f"Erro ao criar item: {response.text}")
+                raise HTTPException(status_code=response.status_code, detail=response.text)
+                
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Erro de requisição ao criar item: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}")
+    
+    def update_item(self, item_id, item_data):
+        """Atualiza um item existente"""
+        logger.debug(f"Atualizando item {item_id}")
+        if not self.token:
+            if not self.refresh_token():
+                raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
+        
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json"
+        }
+        
+        try:
+            response = self._request_with_retry(
+                "PUT",
+                f"{ML_API_BASE_URL}/items/{item_id}",
+                headers=headers,
+                json=item_data
+            )
+            
+            if response.status_code == 200:
+                item_cache.invalidate(f"{ML_API_BASE_URL}/items/{item_id}")
+                return json_codec.response_json(response)
+            elif response.status_code == 401:
+                # Tenta renovar o token e tentar novamente
+                if self.refresh_token():
+                    return self.update_item(item_id, item_data)
+                else:
+                    raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
+            else:
+                logger.error(f"Erro ao atualizar item {item_id}: {response.text}")
+                raise HTTPException(status_code=response.status_code, detail=response.text)
+                
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Erro de requisição ao atualizar item {item_id}: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}")
+    
+    def get_orders(self, status="paid", limit=50, offset=0, filters=None):
+        """Obtém pedidos com um determinado status
+        
+        `filters` aceita parâmetros extras do /orders/search, como `sort`
+        ou `order.date_created.from`.
+        """
+        logger.debug(f"Obtendo pedidos com status '{status}'")
+        if not self.token:
+            if not self.refresh_token():
+                raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
+        
+        headers = {"Authorization": f"Bearer {self.token}"}
+        params = {
+            "status": status,
+            "limit": limit,
+            "offset": offset
+        }
+        if filters:
+            params.update(filters)
+        
+        try:
+            response = self._request_with_retry(
+                "GET",
+                f"{ML_API_BASE_URL}/orders/search",
+                headers=headers,
+                params=params
+            )
+            
+            if response.status_code == 200:
+                return json_codec.response_json(response)
+            elif response.status_code == 401:
+                # Tenta renovar o token e tentar novamente
+                if self.refresh_token():
+                    return self.get_orders(status, limit, offset, filters)
+                else:
+                    raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
+            else:
+                logger.error(f"Erro ao obter pedidos: {response.text}")
+                raise HTTPException(status_code=response.status_code, detail=response.text)
+                
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Erro de requisição ao obter pedidos: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}")
+    
+    def iter_orders(self, status="paid", page_size=50, since=None, cursor="date_created"):
+        """Percorre todas as páginas de /orders/search como um gerador
+        
+        A página seguinte é buscada em segundo plano enquanto a atual é
+        consumida, então no máximo duas páginas ficam em memória.
+        
+        Args:
+            status: Status dos pedidos
+            page_size: Pedidos por página
+            since: Data ISO a partir da qual retomar (inclusive)
+            cursor: "date_created" ou "last_updated", campo usado por `since`
+            
+        Yields:
+            Pedidos em ordem crescente de data de criação
+        """
+        if cursor not in ORDER_CURSORS:
+            raise ValueError(f"Cursor de pedidos inválido: {cursor}")
+        param_cursor, campo_cursor = ORDER_CURSORS[cursor]
+        
+        def buscar(offset, desde):
+            filters = {"sort": "date_asc"}
+            if desde:
+                filters[param_cursor] = desde
+            return self.get_orders(status, page_size, offset, filters)
+        
+        offset = 0
+        executor = ThreadPoolExecutor(max_workers=1)
+        futuro = executor.submit(buscar, offset, since)
+        # IDs já entregues que reaparecem quando o cursor é reancorado (valem até a próxima reancoragem)
+        pular = set()
+        # Última data de cursor entregue e os IDs entregues com ela, em todas as páginas
+        ultima_data, ids_ultima_data = None, set()
+        try:
+            while futuro is not None:
+                pagina = futuro.result()
+                pedidos = pagina.get("results", [])
+                total = pagina.get("paging", {}).get("total", 0)
+                offset += len(pedidos)
+                pular_atual = pular
+                
+                # Agenda a próxima página antes de entregar a atual
+                futuro = None
+                if pedidos and offset < total:
+                    if offset + page_size <= ML_ORDERS_MAX_OFFSET:
+                        futuro = executor.submit(buscar, offset, since)
+                    elif cursor == "date_created":
+                        # Offset máximo da API: reancora o cursor na última data vista
+                        since = pedidos[-1].get(campo_cursor)
+                        pular = {p.get("id") for p in pedidos if p.get(campo_cursor) == since}
+                        if ultima_data == since:
+                            pular |= ids_ultima_data
+                        offset = 0
+                        futuro = executor.submit(buscar, offset, since)
+                    else:
+                        logger.warning("Offset máximo de /orders/search atingido; retome com `since`")
+                
+                for pedido in pedidos:
+                    data = pedido.get(campo_cursor)
+                    if data != ultima_data:
+                        ultima_data, ids_ultima_data = data, set()
+                    ids_ultima_data.add(pedido.get("id"))
+                    if pedido.get("id") in pular_atual:
+                        continue
+                    yield pedido
+        finally:
+            if futuro is not None:
+                futuro.cancel()
+            executor.shutdown(wait=False)
+    
+    def get_order(self, order_id):
+        """Obtém detalhes de um pedido específico
+
+        Chamadas simultâneas para o mesmo pedido compartilham uma única
+        requisição.
+        """
+        return ml_reads.do(("order", order_id), self._fetch_order, order_id)
+    
+    def _fetch_order(self, order_id):
+        """Obtém detalhes de um pedido específico"""
+        logger.debug(f"Obtendo detalhes do pedido {order_id}")
+        if not self.token:
+            if not self.refresh_token():
+                raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
+        
+        headers = {"Authorization": f"Bearer {self.token}"}
+        
+        try:
+            response = self._request_with_retry(
+                "GET",
+                f"{ML_API_BASE_URL}/orders/{order_id}",
+                headers=headers
+            )
+            
+            if response.status_code == 200:
+                return json_codec.response_json(response)
+            elif response.status_code == 401:
+                # Tenta renovar o token e tentar novamente
+                if self.refresh_token():
+                    return self._fetch_order(order_id)
+                else:
+                    raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
+            else:
+                logger.error(f"Erro ao obter pedido {order_id}: {response.text}")
+                raise HTTPException(status_code=response.status_code, detail=response.text)
+                
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Erro de requisição ao obter pedido {order_id}: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}")
+    
+    def get_shipping(self, shipping_id):
+        """Obtém detalhes de uma entrega
+
+        Chamadas simultâneas para a mesma entrega compartilham uma única
+        requisição.
+        """
+        return ml_reads.do(("shipping", shipping_id), self._fetch_shipping, shipping_id)
+    
+    def _fetch_shipping(self, shipping_id):
+        """Obtém detalhes de uma entrega"""
+        logger.debug(f"Obtendo detalhes da entrega {shipping_id}")
+        if not self.token:
+            if not self.refresh_token():
+                raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
+        
+        headers = {"Authorization": f"Bearer {self.token}"}
+        
+        try:
+            response = shipment_cache.fetch(
+                f"{ML_API_BASE_URL}/shipments/{shipping_id}",
+                self._get_with_retry,
+                headers=headers
+            )
+            
+            if response.status_code == 200:
+                return json_codec.response_json(response)
+            elif response.status_code == 401:
+                # Tenta renovar o token e tentar novamente
+                if self.refresh_token():
+                    return self._fetch_shipping(shipping_id)
+                else:
+                    raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
+            else:
+                logger.error(f"Erro ao obter entrega {shipping_id}: {response.text}")
+                raise HTTPException(status_code=response.status_code, detail=response.text)
+                
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Erro de requisição ao obter entrega {shipping_id}: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}") 
\ No newline at end of file
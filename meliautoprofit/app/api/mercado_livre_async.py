@@ -0,0 +1,214 @@
+"""
+Integração assíncrona com a API do Mercado Livre
+"""
+import asyncio
+import logging
+import httpx
+from fastapi import HTTPException
+from tenacity import retry, stop_after_attempt, retry_if_exception_type
+from ..config import setup_logger
+from config.api_mercadolivre import token_manager, ML_API_BASE_URL, item_cache, shipment_cache
+from config import http_client, json_codec
+from config.circuit_breaker import CircuitOpenError
+from .mercado_livre import ML_MULTIGET_LIMIT, _chunks, _espera_retry_after, _map_multiget, ml_reads
+
+# Configuração de logger
+logger = setup_logger(__name__)
+
+class AsyncMercadoLivreAPI:
+    """Versão assíncrona do MercadoLivreAPI para rotas e jobs em asyncio
+
+    Todas as instâncias compartilham o token do `token_manager` e o pool do
+    cliente HTTP assíncrono, então várias chamadas podem ser feitas em
+    paralelo (ex.: com `asyncio.gather`) sem threads. Leituras idênticas
+    de item, pedido e entrega em andamento são compartilhadas.
+    """
+
+    async def _get_token(self):
+        """Obtém o token sem bloquear o event loop quando há renovação"""
+        if token_manager.needs_refresh():
+            return await asyncio.to_thread(token_manager.get_token)
+        return token_manager.access_token
+
+    @retry(
+        retry=retry_if_exception_type((httpx.HTTPStatusError, ConnectionError)),
+        stop=stop_after_attempt(3),
+        wait=_espera_retry_after,
+        # Esgotadas as tentativas, o chamador recebe o próprio HTTPStatusError (um httpx.HTTPError)
+        reraise=True,
+        before_sleep=lambda retry_state: logger.debug(
+            f"Retry após erro de API. Tentativa {retry_state.attempt_number}/3"
+        )
+    )
+    async def _request_with_retry(self, method, url, **kwargs):
+        """Faz uma requisição com retry em caso de erro 429
+
+        A próxima tentativa sai depois do tempo indicado em
+        Retry-After/X-RateLimit-Reset. Se todas falharem, o HTTPStatusError
+        do último 429 é relançado.
+        """
+        logger.debug(f"Fazendo requisição assíncrona {method} para {url}")
+
+        response = await http_client.arequest(method, url, **kwargs)
+
+        # Se for erro 429 (Too Many Requests), lança uma exceção que será capturada pelo retry
+        if response.status_code == 429:
+            logger.warning(f"API rate limit excedido: {response.text}")
+            response.raise_for_status()
+
+        return response
+
+    async def _get_with_retry(self, url, **kwargs):
+        """GET com retry, no formato esperado pelos caches HTTP"""
+        return await self._request_with_retry("GET", url, **kwargs)
+
+    async def _call(self, method, path, descricao, ok_status=(200,), cache=None, **kwargs):
+        """Executa uma chamada autenticada, renovando o token uma vez após 401
+
+        Com `cache`, o GET passa pelo cache HTTP condicional.
+        """
+        token = await self._get_token()
+        if not token:
+            raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
+
+        headers = kwargs.pop("headers", {})
+        if "json" in kwargs:
+            headers["Content-Type"] = "application/json"
+
+        try:
+            for tentativa in range(2):
+                headers["Authorization"] = f"Bearer {token}"
+                if cache is not None:
+                    response = await cache.afetch(f"{ML_API_BASE_URL}{path}", self._get_with_retry, headers=headers)
+                else:
+                    response = await self._request_with_retry(
+                        method,
+                        f"{ML_API_BASE_URL}{path}",
+                        headers=headers,
+                        **kwargs
+                    )
+
+                if response.status_code in ok_status:
+                    return json_codec.response_json(response)
+                if response.status_code != 401 or tentativa:
+                    break
+
+                # Tenta renovar o token e tentar novamente
+                token = await asyncio.to_thread(token_manager.refresh_if_stale, token)
+                if not token:
+                    raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
+
+            if response.status_code == 401:
+                raise HTTPException(status_code=401, detail="Não autorizado pelo Mercado Livre")
+
+            logger.error(f"Erro ao {descricao}: {response.text}")
+            raise HTTPException(status_code=response.status_code, detail=response.text)
+
+        except CircuitOpenError as e:
+            logger.warning(f"Chamada para {descricao} recusada: {str(e)}")
+            raise HTTPException(status_code=503, detail=str(e))
+        except httpx.HTTPError as e:
+            logger.error(f"Erro de requisição ao {descricao}: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}")
+
+    async def get_item(self, item_id):
+        """Obtém detalhes de um item específico"""
+        logger.debug(f"Obtendo detalhes do item {item_id}")
+        return await ml_reads.ado(
+            ("item", item_id), self._call, "GET", f"/items/{item_id}", f"obter item {item_id}", cache=item_cache
+        )
+
+    async def _get_items_chunk(self, chunk, attributes=None):
+        """Busca um bloco de itens pelo multiget"""
+        params = {"ids": ",".join(chunk)}
+        if attributes:
+            params["attributes"] = ",".join(attributes)
+
+        token = await self._get_token()
+        response = await self._request_with_retry(
+            "GET",
+            f"{ML_API_BASE_URL}/items",
+            headers={"Authorization": f"Bearer {token}"},
+            params=params
+        )
+        if response.status_code == 401:
+            token = await asyncio.to_thread(token_manager.refresh_if_stale, token)
+            if token:
+                response = await self._request_with_retry(
+                    "GET",
+                    f"{ML_API_BASE_URL}/items",
+                    headers={"Authorization": f"Bearer {token}"},
+                    params=params
+                )
+
+        if response.status_code != 200:
+            logger.error(f"Erro no multiget de {len(chunk)} itens: {response.text}")
+        return _map_multiget(chunk, response)
+
+    async def get_items(self, item_ids, attributes=None, max_concurrency=4):
+        """Obtém vários itens com o multiget, em blocos concorrentes
+
+        Returns:
+            Dicionário {item_id: {"code": status, "body": dados}}
+        """
+        ids = list(dict.fromkeys(item_ids))
+        logger.debug(f"Obtendo {len(ids)} itens via multiget")
+        if not ids:
+            return {}
+        if not await self._get_token():
+            raise HTTPException(status_code=500, detail="Falha ao obter token do Mercado Livre")
+
+        semaforo = asyncio.Semaphore(max_concurrency)
+
+        async def buscar(bloco):
+            async with semaforo:
+                return await self._get_items_chunk(bloco, attributes)
+
+        resultado = {}
+        try:
+            parciais = await asyncio.gather(*(buscar(bloco) for bloco in _chunks(ids, ML_MULTIGET_LIMIT)))
+        except CircuitOpenError as e:
+            logger.warning(f"Multiget de itens recusado: {str(e)}")
+            raise HTTPException(status_code=503, detail=str(e))
+        except httpx.HTTPError as e:
+            logger.error(f"Erro de requisição no multiget de itens: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Erro ao comunicar com API do Mercado Livre: {str(e)}")
+
+        for parcial in parciais:
+            resultado.update(parcial)
+        return resultado
+
+    async def create_item(self, item_data):
+        """Cria um novo item/anúncio"""
+        logger.debug(f"Criando novo item: {item_data.get('title')}")
+        return await self._call("POST", "/items", "criar item", ok_status=(200, 201), json=item_data)
+
+    async def update_item(self, item_id, item_data):
+        """Atualiza um item existente"""
+        logger.debug(f"Atualizando item {item_id}")
+        resultado = await self._call("PUT", f"/items/{item_id}", f"atualizar item {item_id}", json=item_data)
+        item_cache.invalidate(f"{ML_API_BASE_URL}/items/{item_id}")
+        return resultado
+
+    async def get_orders(self, status="paid", limit=50, offset=0):
+        """Obtém pedidos com um determinado status"""
+        logger.debug(f"Obtendo pedidos com status '{status}'")
+        params = {
+            "status": status,
+            "limit": limit,
+            "offset": offset
+        }
+        return await self._call("GET", "/orders/search", "obter pedidos", params=params)
+
+    async def get_order(self, order_id):
+        """Obtém detalhes de um pedido específico"""
+        logger.debug(f"Obtendo detalhes do pedido {order_id}")
+        return await ml_reads.ado(("order", order_id), self._call, "GET", f"/orders/{order_id}", f"obter pedido {order_id}")
+
+    async def get_shipping(self, shipping_id):
+        """Obtém detalhes de uma entrega"""
+        logger.debug(f"Obtendo detalhes da entrega {shipping_id}")
+        return await ml_reads.ado(
+            ("shipping", shipping_id), self._call, "GET", f"/shipments/{shipping_id}",
+            f"obter entrega {shipping_id}", cache=shipment_cache
+        )
@@ -1,65 +1,102 @@
-"""
-Configurações da aplicação MeliAutoProfit
-"""
-import os
-from dotenv import load_dotenv
-import logging
-
-# Carrega variáveis de ambiente
-load_dotenv()
-
-# Configurações de aplicação
-APP_NAME = "MeliAutoProfit"
-APP_VERSION = "1.0.0"
-DEBUG = os.getenv("DEBUG", "False").lower() in ("true", "1", "t")
-
-# Configurações de API
-API_PREFIX = "/api/v1"
-API_TAGS_METADATA = [
-    {"name": "produtos", "description": "Operações com produtos"},
-    {"name": "pedidos", "description": "Operações com pedidos"},
-    {"name": "fornecedores", "description": "Operações com fornecedores"},
-    {"name": "relatórios", "description": "Geração de relatórios"}
-]
-
-# Configurações de banco de dados
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./meliautoprofit.db")
-
-# Configurações de logging
-LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG")
-LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-LOG_FILE = "meliautoprofit.log"
-
-# Configurações de Mercado Livre
-ML_ITEMS_PER_DAY = int(os.getenv("ML_ITEMS_PER_DAY", "5"))
-ML_MARGIN_PERCENTAGE = float(os.getenv("ML_MARGIN_PERCENTAGE", "0.3"))
-
-# Configurações de relatórios
-REPORT_DAILY_TIME = os.getenv("REPORT_DAILY_TIME", "20:00")  # Hora para envio do relatório diário
-REPORT_RECIPIENTS = os.getenv("REPORT_RECIPIENTS", "").split(",")  # Lista de destinatários
-
-# Configurações de monitoramento
-MONITOR_INTERVAL_SECONDS = int(os.getenv("MONITOR_INTERVAL_SECONDS", "300"))  # 5 minutos
-
-# Função para configurar o logger
-def setup_logger(name):
-    """Configuração de logger para os módulos da aplicação"""
-    logger = logging.getLogger(name)
-    
-    # Define o nível de log
-    level = getattr(logging, LOG_LEVEL)
-    logger.setLevel(level)
-    
-    # Cria handlers se não existirem
-    if not logger.handlers:
-        # Handler de arquivo
-        file_handler = logging.FileHandler(LOG_FILE)
-        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
-        logger.addHandler(file_handler)
-        
-        # Handler de console
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
-        logger.addHandler(console_handler)
-    
+"""
+Configurações da aplicação MeliAutoProfit
+"""
+import os
+from dotenv import load_dotenv
+import logging
+
+# Carrega variáveis de ambiente
+load_dotenv()
+
+# Configurações de aplicação
+APP_NAME = "MeliAutoProfit"
+APP_VERSION = "1.0.0"
+DEBUG = os.getenv("DEBUG", "False").lower() in ("true", "1", "t")
+
+# Configurações de API
+API_PREFIX = "/api/v1"
+API_TAGS_METADATA = [
+    {"name": "produtos", "description": "Operações com produtos"},
+    {"name": "pedidos", "description": "Operações com pedidos"},
+    {"name": "fornecedores", "description": "Operações com fornecedores"},
+    {"name": "relatórios", "description": "Geração de relatórios"}
+]
+
+# Configurações de banco de dados
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./meliautoprofit.db")
+
+# Configurações de logging
+LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG")
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_FILE = "meliautoprofit.log"
+
+# Configurações de Mercado Livre
+ML_ITEMS_PER_DAY = int(os.getenv("ML_ITEMS_PER_DAY", "5"))
+ML_MARGIN_PERCENTAGE = float(os.getenv("ML_MARGIN_PERCENTAGE", "0.3"))
+
+# Configurações da busca em fornecedores
+SUPPLIER_MAX_CONCURRENCY = int(os.getenv("SUPPLIER_MAX_CONCURRENCY", "4"))  # Buscas simultâneas por fornecedor
+LISTING_PARALLEL_KEYWORDS = int(os.getenv("LISTING_PARALLEL_KEYWORDS", "4"))  # Tendências buscadas ao mesmo tempo
+LISTING_PUBLISH_WORKERS = int(os.getenv("LISTING_PUBLISH_WORKERS", "2"))  # Anúncios publicados no ML ao mesmo tempo
+LISTING_QUEUE_SIZE = int(os.getenv("LISTING_QUEUE_SIZE", "4"))  # Itens aguardando entre estágios da listagem
+SUPPLIER_SEARCH_CACHE_TTL = int(os.getenv("SUPPLIER_SEARCH_CACHE_TTL", "3600"))  # Validade das buscas em cache (segundos)
+SUPPLIER_DETAIL_TOP_K = int(os.getenv("SUPPLIER_DETAIL_TOP_K", "5"))  # Candidatos completados com os detalhes
+SUPPLIER_DETAIL_WORKERS = int(os.getenv("SUPPLIER_DETAIL_WORKERS", "4"))  # Detalhes buscados em paralelo
+SUPPLIER_SEARCH_PAGE_SIZE = int(os.getenv("SUPPLIER_SEARCH_PAGE_SIZE", "20"))  # Produtos por página de busca
+SUPPLIER_SEARCH_MAX_PAGES = int(os.getenv("SUPPLIER_SEARCH_MAX_PAGES", "3"))  # Páginas lidas por keyword, no máximo
+LISTING_SCORE_THRESHOLD = float(os.getenv("LISTING_SCORE_THRESHOLD", "0.8"))  # Score (0 a 1) que encerra a busca (0 lê todas as páginas)
+
+# Configurações da pontuação dos candidatos (pesos por critério; ver app/services/pontuacao.py)
+SCORE_WEIGHTS = os.getenv(
+    "SCORE_WEIGHTS", "avaliacao=0.3,estoque=0.2,preco=0.2,margem=0.1,prazo=0.1,confiabilidade=0.1"
+)
+SCORE_STOCK_REFERENCE = float(os.getenv("SCORE_STOCK_REFERENCE", "100"))  # Estoque a partir do qual o critério vale o máximo
+SCORE_MAX_SHIPPING_DAYS = float(os.getenv("SCORE_MAX_SHIPPING_DAYS", "30"))  # Prazo de envio que zera o critério
+
+# Configurações da detecção de títulos quase iguais (MinHash/LSH; ver app/services/similaridade.py)
+TITLE_DEDUP_THRESHOLD = float(os.getenv("TITLE_DEDUP_THRESHOLD", "0.7"))  # Similaridade (0 a 1) a partir da qual o título é duplicado (0 desativa)
+TITLE_MINHASH_PERMUTATIONS = int(os.getenv("TITLE_MINHASH_PERMUTATIONS", "64"))  # Tamanho da assinatura MinHash
+TITLE_LSH_BANDS = int(os.getenv("TITLE_LSH_BANDS", "16"))  # Bandas do LSH (mais bandas acham pares menos parecidos)
+
+# Configurações do catálogo local de fornecedores (desativado por padrão: precisa de disco gravável,
+# o que não existe na Vercel; ex.: SUPPLIER_CATALOG_PATH=/var/cache/meliautoprofit/catalogo.db)
+SUPPLIER_CATALOG_PATH = os.getenv("SUPPLIER_CATALOG_PATH", "")
+SUPPLIER_CATALOG_MAX_AGE_HOURS = float(os.getenv("SUPPLIER_CATALOG_MAX_AGE_HOURS", "24"))  # Idade máxima de uma keyword sincronizada
+SUPPLIER_CATALOG_MIN_RESULTS = int(os.getenv("SUPPLIER_CATALOG_MIN_RESULTS", "5"))  # Menos candidatos que isso: busca na API
+SUPPLIER_CATALOG_RETENTION_HOURS = float(os.getenv("SUPPLIER_CATALOG_RETENTION_HOURS", "168"))  # Produtos não vistos há mais tempo são removidos
+SUPPLIER_CATALOG_SYNC_PAGES = int(os.getenv("SUPPLIER_CATALOG_SYNC_PAGES", "3"))  # Páginas copiadas por keyword
+
+# Configurações da sincronização de preço e estoque dos produtos ativos
+PRODUCT_SYNC_BATCH_SIZE = int(os.getenv("PRODUCT_SYNC_BATCH_SIZE", "200"))  # Produtos por lote (uma transação por lote)
+PRODUCT_SYNC_WORKERS = int(os.getenv("PRODUCT_SYNC_WORKERS", "4"))  # Consultas simultâneas por fornecedor
+PRODUCT_SYNC_INTERVAL_HOURS = float(os.getenv("PRODUCT_SYNC_INTERVAL_HOURS", "6"))  # Intervalo da sincronização agendada (0 desativa)
+
+# Configurações de relatórios
+REPORT_DAILY_TIME = os.getenv("REPORT_DAILY_TIME", "20:00")  # Hora para envio do relatório diário
+REPORT_RECIPIENTS = os.getenv("REPORT_RECIPIENTS", "").split(",")  # Lista de destinatários
+
+# Configurações de monitoramento
+MONITOR_INTERVAL_SECONDS = int(os.getenv("MONITOR_INTERVAL_SECONDS", "300"))  # 5 minutos
+
+# Função para configurar o logger
+def setup_logger(name):
+    """Configuração de logger para os módulos da aplicação"""
+    logger = logging.getLogger(name)
+    
+    # Define o nível de log
+    level = getattr(logging, LOG_LEVEL)
+    logger.setLevel(level)
+    
+    # Cria handlers se não existirem
+    if not logger.handlers:
+        # Handler de arquivo
+        file_handler = logging.FileHandler(LOG_FILE)
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logger.addHandler(file_handler)
+        
+        # Handler de console
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logger.addHandler(console_handler)
+    
     return logger 
\ No newline at end of file
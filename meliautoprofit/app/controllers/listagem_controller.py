@@ -1,98 +1,190 @@
-"""
-Controlador de listagem automática
-"""
-import logging
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
-from datetime import datetime
-from typing import Dict, Any, List
-
-from ..config import setup_logger
-from ..services.listagem import ListagemService
-from ...database import get_db
-from ..api.telegram import TelegramAPI
-
-# Configuração de logger
-logger = setup_logger(__name__)
-
-# Roteador FastAPI
-router = APIRouter(
-    prefix="/listagem",
-    tags=["listagem"],
-    responses={404: {"description": "Not found"}},
-)
-
-@router.post("/automatica")
-async def criar_anuncios_automaticos(background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
-    """Inicia o processo de criação automática de anúncios em background"""
-    logger.info("Iniciando processo de criação automática de anúncios")
-    
-    # Adiciona a tarefa ao processamento em background
-    background_tasks.add_task(processar_listagem_automatica, db)
-    
-    return {"message": "Processo de listagem automática iniciado em background"}
-
-@router.get("/tendencias")
-async def buscar_tendencias(limit: int = 10, db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
-    """Busca as tendências atuais no Mercado Livre"""
-    logger.info(f"Buscando top {limit} tendências")
-    
-    try:
-        service = ListagemService(db)
-        tendencias = service.buscar_tendencias(limit=limit)
-        
-        return tendencias
-    
-    except Exception as e:
-        logger.error(f"Erro ao buscar tendências: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Erro ao buscar tendências: {str(e)}")
-
-def processar_listagem_automatica(db: Session):
-    """Processa a listagem automática em background"""
-    logger.info("Executando processamento de listagem automática")
-    
-    try:
-        # Inicializa o serviço de listagem
-        service = ListagemService(db)
-        
-        # Inicializa o API do Telegram para notificações
-        telegram = TelegramAPI()
-        
-        # Hora inicial
-        hora_inicio = datetime.now()
-        
-        # Cria anúncios automaticamente
-        total_anuncios = service.criar_anuncios_diarios()
-        
-        # Hora final
-        hora_fim = datetime.now()
-        duracao = (hora_fim - hora_inicio).total_seconds() / 60  # Duração em minutos
-        
-        # Envia notificação pelo Telegram
-        mensagem = f"""
-🟢 Listagem Automática Concluída
-
-📊 Resumo:
-- Anúncios criados: {total_anuncios}
-- Data: {hora_inicio.strftime('%d/%m/%Y')}
-- Horário: {hora_inicio.strftime('%H:%M')}
-- Duração: {duracao:.1f} minutos
-        """
-        
-        telegram.send_message(mensagem)
-        
-        logger.info(f"Processo de listagem automática concluído. {total_anuncios} anúncios criados.")
-    
-    except Exception as e:
-        logger.error(f"Erro durante processo de listagem automática: {str(e)}")
-        
-        # Tenta enviar notificação de erro
-        try:
-            telegram = TelegramAPI()
-            telegram.send_notification(
-                "Erro na Listagem Automática",
-                f"Ocorreu um erro durante o processo de listagem automática: {str(e)}",
-                is_error=True
-            )
-        except Exception as telegram_error:
+"""
+Controlador de listagem automática
+"""
+import logging
+import threading
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Dict, Any, List
+
+from ..config import setup_logger, PRODUCT_SYNC_INTERVAL_HOURS
+from ..services.listagem import ListagemService
+from ..services.sincronizacao import SincronizacaoService
+from database import get_db, SessionLocal
+from ..api.telegram import TelegramAPI
+
+# Configuração de logger
+logger = setup_logger(__name__)
+
+# Roteador FastAPI
+router = APIRouter(
+    prefix="/listagem",
+    tags=["listagem"],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.post("/automatica")
+async def criar_anuncios_automaticos(background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    """Inicia o processo de criação automática de anúncios em background"""
+    logger.info("Iniciando processo de criação automática de anúncios")
+    
+    # Adiciona a tarefa ao processamento em background
+    background_tasks.add_task(processar_listagem_automatica, db)
+    
+    return {"message": "Processo de listagem automática iniciado em background"}
+
+@router.get("/tendencias")
+async def buscar_tendencias(limit: int = 10, db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+    """Busca as tendências atuais no Mercado Livre"""
+    logger.info(f"Buscando top {limit} tendências")
+    
+    try:
+        service = ListagemService(db)
+        tendencias = service.buscar_tendencias(limit=limit)
+        
+        return tendencias
+    
+    except Exception as e:
+        logger.error(f"Erro ao buscar tendências: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Erro ao buscar tendências: {str(e)}")
+
+@router.post("/catalogo/sincronizar")
+async def sincronizar_catalogo(background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    """Inicia em background a cópia dos produtos das tendências para o catálogo local"""
+    logger.info("Iniciando sincronização do catálogo local de fornecedores")
+    
+    background_tasks.add_task(processar_sincronizacao_catalogo, db)
+    
+    return {"message": "Sincronização do catálogo iniciada em background"}
+
+@router.get("/catalogo/busca")
+async def buscar_catalogo(keyword: str, fornecedor: str = None, limit: int = 20, db: Session = Depends(get_db)) -> Dict[str, Any]:
+    """Busca produtos no catálogo local de fornecedores"""
+    service = ListagemService(db)
+    if service.catalogo is None:
+        raise HTTPException(status_code=404, detail="Catálogo local de fornecedores desativado")
+    
+    return {
+        "produtos": [produto.to_dict() for produto in service.catalogo.buscar(keyword, fornecedor, limit)],
+        "estatisticas": service.catalogo.stats()
+    }
+
+@router.post("/sincronizacao")
+async def sincronizar_produtos(background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    """Inicia em background a atualização de preço de custo e estoque dos produtos ativos"""
+    logger.info("Iniciando sincronização de preço e estoque dos produtos")
+    
+    background_tasks.add_task(processar_sincronizacao_produtos, db)
+    
+    return {"message": "Sincronização de preço e estoque iniciada em background"}
+
+def processar_sincronizacao_produtos(db: Session):
+    """Sincroniza preço e estoque dos produtos em background"""
+    try:
+        resultado = SincronizacaoService(db).sincronizar()
+        logger.info(f"Sincronização de produtos concluída: {resultado}")
+    except Exception as e:
+        logger.error(f"Erro durante sincronização de produtos: {str(e)}")
+
+# Timer da sincronização agendada de preço e estoque
+_timer_sincronizacao = None
+_timer_lock = threading.Lock()
+
+def agendar_sincronizacao_produtos(intervalo_horas: float = PRODUCT_SYNC_INTERVAL_HOURS):
+    """Agenda a sincronização de preço e estoque a cada `intervalo_horas` (0 desativa)
+    
+    Roda em uma thread do próprio processo (ex.: o uvicorn do Procfile), com
+    uma sessão de banco por execução. Onde não há processo contínuo (Vercel),
+    a sincronização deve ser disparada por um agendador externo com um POST
+    para /api/v1/listagem/sincronizacao.
+    """
+    global _timer_sincronizacao
+    if intervalo_horas <= 0:
+        return None
+    
+    def executar():
+        db = SessionLocal()
+        try:
+            processar_sincronizacao_produtos(db)
+        finally:
+            db.close()
+            # Só reagenda se não foi parada durante a execução
+            if _timer_sincronizacao is not None:
+                agendar_sincronizacao_produtos(intervalo_horas)
+    
+    with _timer_lock:
+        if _timer_sincronizacao is not None:
+            _timer_sincronizacao.cancel()
+        _timer_sincronizacao = threading.Timer(intervalo_horas * 3600, executar)
+        _timer_sincronizacao.daemon = True
+        _timer_sincronizacao.start()
+    logger.info(f"Sincronização de preço e estoque agendada a cada {intervalo_horas:g}h")
+    return _timer_sincronizacao
+
+def parar_sincronizacao_produtos():
+    """Cancela a sincronização agendada"""
+    global _timer_sincronizacao
+    with _timer_lock:
+        if _timer_sincronizacao is not None:
+            _timer_sincronizacao.cancel()
+            _timer_sincronizacao = None
+
+def processar_sincronizacao_catalogo(db: Session):
+    """Sincroniza o catálogo local em background"""
+    try:
+        service = ListagemService(db)
+        resultado = service.sincronizar_catalogo()
+        logger.info(f"Sincronização do catálogo concluída: {resultado}")
+    except Exception as e:
+        logger.error(f"Erro durante sincronização do catálogo: {str(e)}")
+
+def processar_listagem_automatica(db: Session):
+    """Processa a listagem automática em background"""
+    logger.info("Executando processamento de listagem automática")
+    
+    try:
+        # Inicializa o serviço de listagem
+        service = ListagemService(db)
+        
+        # Inicializa o API do Telegram para notificações
+        telegram = TelegramAPI()
+        
+        # Hora inicial
+        hora_inicio = datetime.now()
+        
+        # Cria anúncios automaticamente
+        total_anuncios = service.criar_anuncios_diarios()
+        
+        # Hora final
+        hora_fim = datetime.now()
+        duracao = (hora_fim - hora_inicio).total_seconds() / 60  # Duração em minutos
+        
+        # Envia notificação pelo Telegram
+        mensagem = f"""
+🟢 Listagem Automática Concluída
+
+📊 Resumo:
+- Anúncios criados: {total_anuncios}
+- Data: {hora_inicio.strftime('%d/%m/%Y')}
+- Horário: {hora_inicio.strftime('%H:%M')}
+- Duração: {duracao:.1f} minutos
+        """
+        
+        telegram.notify(mensagem)
+        
+        logger.info(f"Processo de listagem automática concluído. {total_anuncios} anúncios criados.")
+    
+    except Exception as e:
+        logger.error(f"Erro durante processo de listagem automática: {str(e)}")
+        
+        # Tenta enviar notificação de erro
+        try:
+            telegram = TelegramAPI()
+            telegram.send_notification(
+                "Erro na Listagem Automática",
+                f"Ocorreu um erro durante o processo de listagem automática: {str(e)}",
+                is_error=True
+            )
+        except Exception as telegram_error:
             logger.error(f"Erro ao enviar notificação de erro pelo Telegram: {str(telegram_error)}") 
\ No newline at end of file
@@ -1,36 +1,59 @@
-from fastapi import FastAPI, Request, HTTPException
-import logging
-
-# Configurar logging para console (compatível com Vercel)
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-logger = logging.getLogger(__name__)
-
-app = FastAPI(title="MeliAutoProfit")
-
-@app.post("/webhook/mercadolivre")
-async def handle_order(request: Request):
-    try:
-        data = await request.json()
-        order_id = data.get("order_id", "N/A")
-        logger.debug(f"DEBUG: Pedido recebido: {order_id}")
-        return {"status": "received"}
-    except Exception as e:
-        logger.error(f"DEBUG: Erro no webhook: {str(e)}")
-        raise HTTPException(status_code=400, detail="Erro ao processar notificação")
-
-@app.get("/auth/callback")
-async def oauth_callback(code: str = None, state: str = None):
-    try:
-        logger.debug(f"DEBUG: Callback OAuth recebido: code={code}, state={state}")
-        return {"message": "Callback recebido, autenticação pendente"}
-    except Exception as e:
-        logger.error(f"DEBUG: Erro no callback: {str(e)}")
-        raise HTTPException(status_code=500, detail="Erro no callback")
-
-@app.get("/")
-async def root():
-    logger.debug("DEBUG: Acessando raiz")
+from fastapi import FastAPI, Request, HTTPException
+import logging
+from config import http_client, json_codec
+from .api.mercado_livre_async import AsyncMercadoLivreAPI
+from .controllers.listagem_controller import agendar_sincronizacao_produtos, parar_sincronizacao_produtos
+
+# Configurar logging para console (compatível com Vercel)
+logging.basicConfig(
+    level=logging.DEBUG,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+app = FastAPI(title="MeliAutoProfit", default_response_class=json_codec.response_class())
+
+@app.on_event("startup")
+async def agendar_tarefas():
+    """Inicia a sincronização periódica de preço e estoque (PRODUCT_SYNC_INTERVAL_HOURS)"""
+    agendar_sincronizacao_produtos()
+
+@app.on_event("shutdown")
+async def fechar_conexoes():
+    """Libera os pools HTTP compartilhados e cancela as tarefas agendadas"""
+    parar_sincronizacao_produtos()
+    await http_client.aclose_all()
+    http_client.close_all()
+
+@app.post("/webhook/mercadolivre")
+async def handle_order(request: Request):
+    try:
+        data = json_codec.loads(await request.body())
+        order_id = data.get("order_id", "N/A")
+        logger.debug(f"DEBUG: Pedido recebido: {order_id}")
+    except Exception as e:
+        logger.error(f"DEBUG: Erro no webhook: {str(e)}")
+        raise HTTPException(status_code=400, detail="Erro ao processar notificação")
+
+    if order_id != "N/A":
+        # Consulta o pedido sem bloquear o event loop; falhas não recusam a notificação
+        try:
+            pedido = await AsyncMercadoLivreAPI().get_order(order_id)
+            logger.info(f"Pedido {order_id} recebido com status {pedido.get('status')}")
+        except HTTPException as e:
+            logger.warning(f"Não foi possível obter o pedido {order_id}: {e.detail}")
+    return {"status": "received"}
+
+@app.get("/auth/callback")
+async def oauth_callback(code: str = None, state: str = None):
+    try:
+        logger.debug(f"DEBUG: Callback OAuth recebido: code={code}, state={state}")
+        return {"message": "Callback recebido, autenticação pendente"}
+    except Exception as e:
+        logger.error(f"DEBUG: Erro no callback: {str(e)}")
+        raise HTTPException(status_code=500, detail="Erro no callback")
+
+@app.get("/")
+async def root():
+    logger.debug("DEBUG: Acessando raiz")
     return {"message": "Loja Ativa!"}
\ No newline at end of file
@@ -0,0 +1,353 @@
+"""
+Catálogo local dos fornecedores com índice de texto completo
+"""
+import os
+import re
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterable
+
+from ..config import (
+    setup_logger, SUPPLIER_CATALOG_PATH, SUPPLIER_CATALOG_MAX_AGE_HOURS, SUPPLIER_CATALOG_SYNC_PAGES
+)
+from ..api.adaptadores_fornecedor import SupplierCandidate
+from ..api.fornecedor import iter_pages
+from config import json_codec
+
+# Configuração de logger
+logger = setup_logger(__name__)
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS produtos (
+        fornecedor TEXT NOT NULL,
+        product_id TEXT NOT NULL,
+        nome TEXT NOT NULL DEFAULT '',
+        descricao TEXT NOT NULL DEFAULT '',
+        preco REAL NOT NULL DEFAULT 0,
+        estoque INTEGER,
+        avaliacao REAL,
+        categoria TEXT NOT NULL DEFAULT '',
+        sku TEXT NOT NULL DEFAULT '',
+        imagens TEXT NOT NULL DEFAULT '[]',
+        prazo_envio INTEGER,
+        updated_at REAL NOT NULL,
+        visto_em REAL NOT NULL,
+        PRIMARY KEY (fornecedor, product_id)
+    )
+    """,
+    # Índice FTS5 sobre título e descrição, mantido por gatilhos
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS produtos_fts USING fts5(
+        nome, descricao, content='produtos', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS produtos_ai AFTER INSERT ON produtos BEGIN
+        INSERT INTO produtos_fts(rowid, nome, descricao) VALUES (new.rowid, new.nome, new.descricao);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS produtos_ad AFTER DELETE ON produtos BEGIN
+        INSERT INTO produtos_fts(produtos_fts, rowid, nome, descricao)
+        VALUES ('delete', old.rowid, old.nome, old.descricao);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS produtos_au AFTER UPDATE OF nome, descricao ON produtos BEGIN
+        INSERT INTO produtos_fts(produtos_fts, rowid, nome, descricao)
+        VALUES ('delete', old.rowid, old.nome, old.descricao);
+        INSERT INTO produtos_fts(rowid, nome, descricao) VALUES (new.rowid, new.nome, new.descricao);
+    END
+    """,
+    # Última sincronização de cada palavra-chave por fornecedor
+    """
+    CREATE TABLE IF NOT EXISTS sincronizacoes (
+        fornecedor TEXT NOT NULL,
+        keyword TEXT NOT NULL,
+        sincronizado_em REAL NOT NULL,
+        produtos INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (fornecedor, keyword)
+    )
+    """,
+]
+
+# Versão do esquema (PRAGMA user_version); catálogos de outra versão são recriados
+_VERSAO_SCHEMA = 2
+
+# Objetos do esquema, apagados para recriar um catálogo de versão antiga
+_OBJETOS_SCHEMA = [
+    "DROP TRIGGER IF EXISTS produtos_ai",
+    "DROP TRIGGER IF EXISTS produtos_ad",
+    "DROP TRIGGER IF EXISTS produtos_au",
+    "DROP TABLE IF EXISTS produtos_fts",
+    "DROP TABLE IF EXISTS produtos",
+    "DROP TABLE IF EXISTS sincronizacoes",
+]
+
+def normalizar_keyword(keyword: str) -> str:
+    """Forma canônica da palavra-chave (minúsculas, espaços simples)"""
+    return " ".join((keyword or "").lower().split())
+
+def _consulta_fts(keyword: str) -> Optional[str]:
+    """Monta a expressão MATCH: todos os termos (um termo comum sozinho não casa o catálogo inteiro)"""
+    termos = [t for t in re.findall(r"\w+", normalizar_keyword(keyword)) if len(t) > 1]
+    if not termos:
+        return None
+    return " AND ".join(f'"{termo}"' for termo in termos)
+
+class CatalogoFornecedores:
+    """Cópia local dos produtos dos fornecedores
+
+    Guarda preço, estoque, avaliação, prazo de envio, imagens e `updated_at`
+    (quando o conteúdo mudou pela última vez) em um SQLite próprio, com índice FTS5
+    sobre título e descrição. A busca por palavra-chave é local; a API do
+    fornecedor só precisa ser consultada para confirmar o produto escolhido.
+    """
+
+    def __init__(self, caminho: str = SUPPLIER_CATALOG_PATH):
+        """Abre (ou cria) o catálogo"""
+        self.caminho = caminho
+        self.consultas = 0
+        self.encontrados = 0
+        self._lock = threading.Lock()
+
+        diretorio = os.path.dirname(caminho)
+        if diretorio and caminho != ":memory:":
+            os.makedirs(diretorio, exist_ok=True)
+
+        self._conn = sqlite3.connect(caminho, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            if caminho != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            versao = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if versao != _VERSAO_SCHEMA:
+                # O catálogo é uma cópia: um esquema antigo é descartado e ressincronizado
+                if versao:
+                    logger.info(f"Recriando catálogo {caminho} (esquema {versao} -> {_VERSAO_SCHEMA})")
+                for comando in _OBJETOS_SCHEMA:
+                    self._conn.execute(comando)
+            for comando in _SCHEMA:
+                self._conn.execute(comando)
+            self._conn.execute(f"PRAGMA user_version = {_VERSAO_SCHEMA}")
+
+    def salvar_produtos(self, fornecedor: str, produtos: Iterable[SupplierCandidate], agora: Optional[float] = None) -> Dict[str, int]:
+        """Insere ou atualiza produtos de um fornecedor em uma única transação
+        
+        Aceita SupplierCandidate ou dicionários no mesmo formato.
+
+        Produtos sem mudança só têm `visto_em` renovado; `updated_at` e o
+        índice de texto só mudam quando o conteúdo muda.
+
+        Returns:
+            Contadores de produtos novos, alterados e inalterados
+        """
+        agora = agora or time.time()
+        contadores = {"novos": 0, "alterados": 0, "inalterados": 0}
+
+        with self._lock, self._conn:
+            for item in produtos:
+                produto = SupplierCandidate.from_dict(item, fornecedor)
+                if not produto.id:
+                    continue
+
+                # Estoque, avaliação e prazo não informados ficam NULL (desconhecidos, não zero)
+                valores = (
+                    produto.name, produto.description, produto.get("price", 0.0), produto.stock,
+                    produto.rating, produto.category, produto.sku, json_codec.dumps(list(produto.images)),
+                    produto.shipping_days
+                )
+                atual = self._conn.execute(
+                    "SELECT nome, descricao, preco, estoque, avaliacao, categoria, sku, imagens, prazo_envio "
+                    "FROM produtos WHERE fornecedor = ? AND product_id = ?",
+                    (fornecedor, produto.id)
+                ).fetchone()
+
+                if atual is None:
+                    self._conn.execute(
+                        "INSERT INTO produtos (fornecedor, product_id, nome, descricao, preco, estoque, "
+                        "avaliacao, categoria, sku, imagens, prazo_envio, updated_at, visto_em) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (fornecedor, produto.id, *valores, agora, agora)
+                    )
+                    contadores["novos"] += 1
+                elif tuple(atual) != valores:
+                    self._conn.execute(
+                        "UPDATE produtos SET nome = ?, descricao = ?, preco = ?, estoque = ?, avaliacao = ?, "
+                        "categoria = ?, sku = ?, imagens = ?, prazo_envio = ?, updated_at = ?, visto_em = ? "
+                        "WHERE fornecedor = ? AND product_id = ?",
+                        (*valores, agora, agora, fornecedor, produto.id)
+                    )
+                    contadores["alterados"] += 1
+                else:
+                    self._conn.execute(
+                        "UPDATE produtos SET visto_em = ? WHERE fornecedor = ? AND product_id = ?",
+                        (agora, fornecedor, produto.id)
+                    )
+                    contadores["inalterados"] += 1
+
+        return contadores
+
+    def buscar(self, keyword: str, fornecedor: Optional[str] = None, limit: int = 20) -> List[SupplierCandidate]:
+        """Busca produtos pelo índice de texto, do mais ao menos relevante"""
+        consulta = _consulta_fts(keyword)
+        if consulta is None:
+            return []
+
+        sql = (
+            "SELECT p.* FROM produtos_fts JOIN produtos p ON p.rowid = produtos_fts.rowid "
+            "WHERE produtos_fts MATCH ?"
+        )
+        params = [consulta]
+        if fornecedor:
+            sql += " AND p.fornecedor = ?"
+            params.append(fornecedor)
+        sql += " ORDER BY bm25(produtos_fts) LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            try:
+                linhas = self._conn.execute(sql, params).fetchall()
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Erro na busca do catálogo por '{keyword}': {str(e)}")
+                linhas = []
+            self.consultas += 1
+            if linhas:
+                self.encontrados += 1
+
+        return [self._para_produto(linha) for linha in linhas]
+
+    def obter(self, fornecedor: str, product_id: str) -> Optional[SupplierCandidate]:
+        """Retorna um produto do catálogo"""
+        with self._lock:
+            linha = self._conn.execute(
+                "SELECT * FROM produtos WHERE fornecedor = ? AND product_id = ?",
+                (fornecedor, str(product_id))
+            ).fetchone()
+        return self._para_produto(linha) if linha else None
+
+    def remover(self, fornecedor: str, product_id: str) -> None:
+        """Remove um produto (por exemplo, descontinuado no fornecedor)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM produtos WHERE fornecedor = ? AND product_id = ?",
+                (fornecedor, str(product_id))
+            )
+
+    def remover_antigos(self, max_idade_horas: float) -> int:
+        """Remove produtos que não aparecem nas sincronizações há muito tempo"""
+        limite = time.time() - max_idade_horas * 3600
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM produtos WHERE visto_em < ?", (limite,))
+        return cursor.rowcount
+
+    def precisa_sincronizar(self, fornecedor: str, keyword: str, max_idade_horas: float = SUPPLIER_CATALOG_MAX_AGE_HOURS) -> bool:
+        """Indica se a palavra-chave não foi sincronizada dentro do prazo"""
+        with self._lock:
+            linha = self._conn.execute(
+                "SELECT sincronizado_em FROM sincronizacoes WHERE fornecedor = ? AND keyword = ?",
+                (fornecedor, normalizar_keyword(keyword))
+            ).fetchone()
+        return linha is None or linha[0] < time.time() - max_idade_horas * 3600
+
+    def registrar_sincronizacao(self, fornecedor: str, keyword: str, produtos: int) -> None:
+        """Registra a sincronização de uma palavra-chave"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sincronizacoes (fornecedor, keyword, sincronizado_em, produtos) "
+                "VALUES (?, ?, ?, ?)",
+                (fornecedor, normalizar_keyword(keyword), time.time(), produtos)
+            )
+
+    def sincronizar(self, fornecedor_api, fornecedor: str, keywords: Iterable[str],
+                    paginas: int = SUPPLIER_CATALOG_SYNC_PAGES, limit: int = 50,
+                    max_idade_horas: float = SUPPLIER_CATALOG_MAX_AGE_HOURS) -> Dict[str, int]:
+        """Copia para o catálogo os resultados de busca das palavras-chave
+
+        Incremental: palavras-chave sincronizadas dentro de `max_idade_horas`
+        são puladas e a paginação para na primeira página incompleta.
+        """
+        totais = {"keywords": 0, "novos": 0, "alterados": 0, "inalterados": 0}
+
+        for keyword in keywords:
+            if not keyword or not self.precisa_sincronizar(fornecedor, keyword, max_idade_horas):
+                continue
+
+            recebidos = 0
+            # A próxima página é buscada enquanto a atual é gravada
+            leitura = iter_pages(
+                lambda pagina, keyword=keyword: fornecedor_api.search_candidates(keyword, pagina, limit), paginas, limit
+            )
+            try:
+                for produtos in leitura:
+                    for chave, valor in self.salvar_produtos(fornecedor, produtos).items():
+                        totais[chave] += valor
+                    recebidos += len(produtos)
+            except Exception as e:
+                logger.error(f"Erro ao sincronizar '{keyword}' do fornecedor {fornecedor}: {str(e)}")
+            finally:
+                leitura.close()
+
+            self.registrar_sincronizacao(fornecedor, keyword, recebidos)
+            totais["keywords"] += 1
+
+        logger.info(f"Catálogo do fornecedor {fornecedor} sincronizado: {totais}")
+        return totais
+
+    def stats(self) -> Dict[str, Any]:
+        """Tamanho do catálogo e aproveitamento das buscas"""
+        with self._lock:
+            por_fornecedor = dict(self._conn.execute(
+                "SELECT fornecedor, COUNT(*) FROM produtos GROUP BY fornecedor"
+            ).fetchall())
+        return {
+            "produtos": por_fornecedor,
+            "consultas": self.consultas,
+            "consultas_com_resultado": self.encontrados,
+        }
+
+    def fechar(self) -> None:
+        """Fecha a conexão com o banco do catálogo"""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _para_produto(linha) -> SupplierCandidate:
+        """Converte uma linha do banco em SupplierCandidate"""
+        return SupplierCandidate(
+            id=linha["product_id"],
+            fornecedor=linha["fornecedor"],
+            name=linha["nome"],
+            description=linha["descricao"],
+            price=linha["preco"],
+            stock=linha["estoque"],
+            rating=linha["avaliacao"],
+            category=linha["categoria"],
+            sku=linha["sku"],
+            images=json_codec.loads(linha["imagens"]),
+            shipping_days=linha["prazo_envio"],
+            updated_at=datetime.fromtimestamp(linha["updated_at"]).isoformat(),
+            origem="catalogo",
+        )
+
+# Catálogo compartilhado pelo processo (aberto no primeiro uso)
+_catalogo = None
+_catalogo_lock = threading.Lock()
+
+def obter_catalogo() -> Optional[CatalogoFornecedores]:
+    """Retorna o catálogo do processo (None se SUPPLIER_CATALOG_PATH estiver vazio)"""
+    global _catalogo
+    if not SUPPLIER_CATALOG_PATH:
+        return None
+    with _catalogo_lock:
+        if _catalogo is None:
+            try:
+                _catalogo = CatalogoFornecedores(SUPPLIER_CATALOG_PATH)
+            except (sqlite3.Error, OSError) as e:
+                logger.error(f"Catálogo local de fornecedores desativado: {str(e)}")
+                return None
+        return _catalogo
@@ -0,0 +1,85 @@
+"""
+Índice em memória dos produtos já anunciados
+"""
+import threading
+from typing import Any, Optional, Tuple
+
+from ..config import setup_logger
+
+# Configuração de logger
+logger = setup_logger(__name__)
+
+def chave_produto(fornecedor_id, product_id) -> Optional[Tuple[Any, str]]:
+    """Chave do produto no fornecedor (o id só é único dentro de cada fornecedor)"""
+    if fornecedor_id is None or not product_id:
+        return None
+    return fornecedor_id, str(product_id)
+
+class IndiceAnunciados:
+    """Produtos já anunciados, por produto no fornecedor e por SKU
+
+    Dois conjuntos em memória: a consulta é O(1) e não toca o banco nem a
+    rede. É carregado da tabela de produtos no início de cada execução
+    (`do_banco`) e atualizado conforme os anúncios são criados. SKU vazio
+    não é indexado. Seguro para uso por várias threads.
+    """
+
+    def __init__(self):
+        self._produtos = set()
+        self._skus = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def do_banco(cls, produto_repo) -> "IndiceAnunciados":
+        """Monta o índice com todos os produtos já gravados"""
+        indice = cls()
+        for fornecedor_id, product_id, sku in produto_repo.list_listing_keys():
+            indice._adicionar(fornecedor_id, product_id, sku)
+        logger.info(f"Índice de anunciados carregado: {len(indice._produtos)} produtos, {len(indice._skus)} SKUs")
+        return indice
+
+    def __len__(self):
+        return len(self._produtos)
+
+    def _contem(self, fornecedor_id, product_id, sku) -> bool:
+        chave = chave_produto(fornecedor_id, product_id)
+        return (chave is not None and chave in self._produtos) or (bool(sku) and sku in self._skus)
+
+    def _adicionar(self, fornecedor_id, product_id, sku):
+        chave = chave_produto(fornecedor_id, product_id)
+        if chave is not None:
+            self._produtos.add(chave)
+        if sku:
+            self._skus.add(sku)
+
+    def contem(self, fornecedor_id, product_id, sku: Optional[str] = None) -> bool:
+        """Indica se o produto (ou o SKU) já está anunciado"""
+        with self._lock:
+            return self._contem(fornecedor_id, product_id, sku)
+
+    def adicionar(self, fornecedor_id, product_id, sku: Optional[str] = None):
+        """Registra um produto anunciado"""
+        with self._lock:
+            self._adicionar(fornecedor_id, product_id, sku)
+
+    def reservar(self, fornecedor_id, product_id, sku: Optional[str] = None) -> bool:
+        """Registra o produto se ainda não estiver anunciado
+
+        Verificação e registro são atômicos: duas publicações simultâneas do
+        mesmo produto (ex.: tendências diferentes) não passam as duas.
+
+        Returns:
+            False se o produto já estava anunciado ou reservado
+        """
+        with self._lock:
+            if self._contem(fornecedor_id, product_id, sku):
+                return False
+            self._adicionar(fornecedor_id, product_id, sku)
+            return True
+
+    def remover(self, fornecedor_id, product_id, sku: Optional[str] = None):
+        """Retira um produto do índice (ex.: reserva de uma publicação que falhou)"""
+        with self._lock:
+            self._produtos.discard(chave_produto(fornecedor_id, product_id))
+            if sku:
+                self._skus.discard(sku)
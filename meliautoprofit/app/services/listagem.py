@@ -1,241 +1,693 @@
-"""
-Serviço de listagem automática de produtos
-"""
-import logging
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session
-
-from ..config import setup_logger, ML_ITEMS_PER_DAY, ML_MARGIN_PERCENTAGE
-from ..api.mercado_livre import MercadoLivreAPI
-from ..api.fornecedor import FornecedorAPI, FornecedorType
-from ...database.repository import ProdutoRepository, FornecedorRepository
-from ...database.models import StatusProduto, Produto
-
-# Configuração de logger
-logger = setup_logger(__name__)
-
-class ListagemService:
-    """Serviço para listagem automática de produtos no Mercado Livre"""
-    
-    def __init__(self, db: Session):
-        """Inicializa o serviço de listagem"""
-        self.db = db
-        self.ml_api = MercadoLivreAPI()
-        self.fornecedor_api = FornecedorAPI()
-        self.produto_repo = ProdutoRepository(db)
-        self.fornecedor_repo = FornecedorRepository(db)
-    
-    def buscar_tendencias(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Busca as tendências de produtos no Mercado Livre"""
-        logger.info(f"Buscando top {limit} tendências no Mercado Livre")
-        
-        try:
-            # Obtém as tendências de busca do Mercado Livre
-            trends = self.ml_api.get_trends(limit=limit)
-            
-            if not trends:
-                logger.warning("Nenhuma tendência encontrada")
-                return []
-            
-            logger.info(f"Encontradas {len(trends)} tendências")
-            return trends
-        
-        except Exception as e:
-            logger.error(f"Erro ao buscar tendências: {str(e)}")
-            return []
-    
-    def buscar_produtos_fornecedor(self, keyword: str, fornecedor_type: FornecedorType) -> List[Dict[str, Any]]:
-        """Busca produtos no fornecedor com base em uma palavra-chave"""
-        logger.info(f"Buscando produtos com keyword '{keyword}' no fornecedor {fornecedor_type}")
-        
-        try:
-            # Define o fornecedor a ser usado
-            self.fornecedor_api.set_fornecedor(fornecedor_type)
-            
-            # Busca produtos no fornecedor
-            produtos = self.fornecedor_api.search_products(keyword)
-            
-            if not produtos:
-                logger.warning(f"Nenhum produto encontrado para '{keyword}' no fornecedor {fornecedor_type}")
-                return []
-            
-            logger.info(f"Encontrados {len(produtos)} produtos para '{keyword}'")
-            return produtos
-        
-        except Exception as e:
-            logger.error(f"Erro ao buscar produtos no fornecedor: {str(e)}")
-            return []
-    
-    def selecionar_melhor_produto(self, produtos: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-        """Seleciona o melhor produto da lista baseado em critérios como preço, avaliação, etc."""
-        if not produtos:
-            return None
-        
-        # Implementação básica: seleciona o produto com melhor margem potencial
-        # Em uma implementação real, consideraria outros fatores como avaliações, tempo de entrega, etc.
-        melhor_produto = None
-        melhor_score = -1
-        
-        for produto in produtos:
-            preco = produto.get("price", 0)
-            avaliacao = produto.get("rating", 0)
-            estoque = produto.get("stock", 0)
-            
-            if preco <= 0 or estoque <= 0:
-                continue
-            
-            # Cálculo simplificado de score
-            score = (avaliacao * 0.6) + (estoque * 0.4)
-            
-            if score > melhor_score:
-                melhor_score = score
-                melhor_produto = produto
-        
-        if melhor_produto:
-            logger.info(f"Melhor produto selecionado: {melhor_produto.get('name', 'Desconhecido')}")
-        else:
-            logger.warning("Nenhum produto adequado encontrado")
-        
-        return melhor_produto
-    
-    def criar_anuncio_ml(self, produto_fornecedor: Dict[str, Any], fornecedor_id: int) -> Optional[Dict[str, Any]]:
-        """Cria um anúncio no Mercado Livre com base em um produto do fornecedor"""
-        try:
-            # Calcula preço de venda com margem
-            preco_custo = produto_fornecedor.get("price", 0)
-            if preco_custo <= 0:
-                logger.warning("Produto com preço inválido")
-                return None
-            
-            margem = ML_MARGIN_PERCENTAGE  # Percentual de margem definido na configuração
-            preco_venda = preco_custo * (1 + margem)
-            
-            # Monta dados do anúncio
-            item_data = {
-                "title": produto_fornecedor.get("name", ""),
-                "category_id": "MLB1051",  # Categoria padrão (deve ser adaptada)
-                "price": preco_venda,
-                "currency_id": "BRL",
-                "available_quantity": min(produto_fornecedor.get("stock", 10), 50),  # Limita a 50 unidades
-                "buying_mode": "buy_it_now",
-                "condition": "new",
-                "listing_type_id": "gold_special",  # Tipo de listagem
-                "description": {
-                    "plain_text": produto_fornecedor.get("description", "")
-                },
-                "pictures": [
-                    {"source": url} for url in produto_fornecedor.get("images", [])
-                ],
-                "shipping": {
-                    "mode": "me2",
-                    "local_pick_up": False,
-                    "free_shipping": preco_venda > 150,  # Frete grátis para produtos acima de R$150
-                    "logistic_type": "cross_docking"
-                }
-            }
-            
-            # Cria o anúncio no Mercado Livre
-            logger.info(f"Criando anúncio no ML: {item_data['title']}")
-            resultado = self.ml_api.create_item(item_data)
-            
-            if not resultado or "id" not in resultado:
-                logger.error(f"Falha ao criar anúncio: {resultado}")
-                return None
-            
-            # Salva o produto no banco de dados
-            logger.info(f"Salvando produto no banco: {item_data['title']}")
-            produto_db = self.produto_repo.create({
-                "titulo": item_data["title"],
-                "descricao": item_data["description"]["plain_text"],
-                "preco_custo": preco_custo,
-                "preco_venda": preco_venda,
-                "margem": margem,
-                "estoque": item_data["available_quantity"],
-                "categoria": produto_fornecedor.get("category", ""),
-                "sku": produto_fornecedor.get("sku", ""),
-                "ml_item_id": resultado["id"],
-                "fornecedor_id": fornecedor_id,
-                "fornecedor_product_id": produto_fornecedor.get("id", ""),
-                "status": StatusProduto.ATIVO
-            })
-            
-            logger.info(f"Anúncio criado com sucesso: {resultado['id']}")
-            return resultado
-        
-        except Exception as e:
-            logger.error(f"Erro ao criar anúncio no ML: {str(e)}")
-            return None
-    
-    def criar_anuncios_diarios(self) -> int:
-        """Cria anúncios diários com base nas tendências e configurações"""
-        logger.info("Iniciando criação de anúncios diários")
-        
-        # Quantidade de anúncios a serem criados
-        quantidade = ML_ITEMS_PER_DAY
-        
-        # Busca tendências
-        tendencias = self.buscar_tendencias(limit=quantidade * 2)  # Busca o dobro para ter margem
-        
-        if not tendencias:
-            logger.warning("Sem tendências para criar anúncios")
-            return 0
-        
-        # Obtém fornecedores
-        fornecedores = self.fornecedor_repo.list_all()
-        if not fornecedores:
-            logger.error("Nenhum fornecedor cadastrado")
-            return 0
-        
-        # Mapa de fornecedores por tipo de API
-        fornecedores_map = {f.api_type: f for f in fornecedores}
-        
-        # Lista de tipos de fornecedores suportados
-        tipos_fornecedores = [FornecedorType.CJ_DROPSHIPPING, FornecedorType.SPOCKET]
-        
-        # Contador de anúncios criados
-        anuncios_criados = 0
-        
-        # Para cada tendência, tenta criar um anúncio
-        for tendencia in tendencias:
-            if anuncios_criados >= quantidade:
-                break
-            
-            keyword = tendencia.get("keyword", "")
-            if not keyword:
-                continue
-            
-            logger.info(f"Processando tendência: {keyword}")
-            
-            # Tenta cada fornecedor até conseguir criar o anúncio
-            for tipo_fornecedor in tipos_fornecedores:
-                if tipo_fornecedor.value not in fornecedores_map:
-                    logger.warning(f"Fornecedor {tipo_fornecedor} não cadastrado")
-                    continue
-                
-                fornecedor = fornecedores_map[tipo_fornecedor.value]
-                
-                # Busca produtos no fornecedor
-                produtos_fornecedor = self.buscar_produtos_fornecedor(keyword, tipo_fornecedor)
-                
-                if not produtos_fornecedor:
-                    logger.info(f"Nenhum produto encontrado para '{keyword}' no fornecedor {tipo_fornecedor}")
-                    continue
-                
-                # Seleciona o melhor produto
-                melhor_produto = self.selecionar_melhor_produto(produtos_fornecedor)
-                
-                if not melhor_produto:
-                    logger.info(f"Nenhum produto adequado para '{keyword}' no fornecedor {tipo_fornecedor}")
-                    continue
-                
-                # Cria o anúncio no Mercado Livre
-                resultado = self.criar_anuncio_ml(melhor_produto, fornecedor.id)
-                
-                if resultado:
-                    anuncios_criados += 1
-                    logger.info(f"Anúncio {anuncios_criados}/{quantidade} criado com sucesso")
-                    break  # Passa para a próxima tendência
-        
-        logger.info(f"Processo concluído. {anuncios_criados} anúncios criados.")
-        return anuncios_criados 
\ No newline at end of file
+"""
+Serviço de listagem automática de produtos
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+from sqlalchemy.orm import Session
+
+from ..config import (
+    setup_logger, ML_ITEMS_PER_DAY, ML_MARGIN_PERCENTAGE,
+    SUPPLIER_MAX_CONCURRENCY, LISTING_PARALLEL_KEYWORDS, SUPPLIER_DETAIL_TOP_K, SUPPLIER_DETAIL_WORKERS,
+    SUPPLIER_SEARCH_PAGE_SIZE, SUPPLIER_SEARCH_MAX_PAGES, LISTING_SCORE_THRESHOLD,
+    LISTING_PUBLISH_WORKERS, LISTING_QUEUE_SIZE, SUPPLIER_CATALOG_MIN_RESULTS, SUPPLIER_CATALOG_RETENTION_HOURS
+)
+from ..api.mercado_livre import MercadoLivreAPI
+from ..api.fornecedor import FornecedorAPI, iter_pages
+from ..api.adaptadores_fornecedor import SupplierCandidate, registered_types
+from .catalogo import obter_catalogo
+from .pontuacao import MotorPontuacao
+from .pipeline import Pipeline, Estagio
+from .deduplicacao import IndiceAnunciados, chave_produto
+from .similaridade import IndiceTitulos
+from database.repository import ProdutoRepository, FornecedorRepository
+from database.models import StatusProduto, Produto
+
+# Configuração de logger
+logger = setup_logger(__name__)
+
+def _tipo(fornecedor_type) -> str:
+    """Valor do tipo de fornecedor (aceita FornecedorType ou str)"""
+    return getattr(fornecedor_type, "value", fornecedor_type)
+
+class ListagemService:
+    """Serviço para listagem automática de produtos no Mercado Livre"""
+    
+    def __init__(self, db: Session):
+        """Inicializa o serviço de listagem"""
+        self.db = db
+        self.ml_api = MercadoLivreAPI()
+        self.fornecedor_api = FornecedorAPI()
+        # Fornecedores registrados; uma instância por fornecedor, pois as buscas rodam em paralelo
+        self.tipos_fornecedores = registered_types()
+        self.fornecedor_apis = {tipo: FornecedorAPI(tipo) for tipo in self.tipos_fornecedores}
+        self.limites_fornecedor = {
+            tipo: threading.BoundedSemaphore(SUPPLIER_MAX_CONCURRENCY) for tipo in self.tipos_fornecedores
+        }
+        self.catalogo = obter_catalogo()
+        self.motor_pontuacao = MotorPontuacao()
+        self.estatisticas_pipeline = {}
+        self.produto_repo = ProdutoRepository(db)
+        self.fornecedor_repo = FornecedorRepository(db)
+        # Produtos já anunciados e seus títulos; carregados do banco no primeiro uso
+        # e atualizados a cada gravação feita pelo repositório deste serviço
+        self.indice_anunciados = None
+        self.indice_titulos = None
+        self.produto_repo.add_listener(self)
+    
+    def carregar_indice_anunciados(self) -> IndiceAnunciados:
+        """Recarrega do banco os índices de produtos já anunciados (ids, SKUs e títulos)"""
+        self.indice_anunciados = IndiceAnunciados.do_banco(self.produto_repo)
+        self.indice_titulos = IndiceTitulos.do_banco(self.produto_repo)
+        return self.indice_anunciados
+    
+    def obter_indice_anunciados(self) -> IndiceAnunciados:
+        """Índice de produtos já anunciados (carrega do banco se ainda não carregado)"""
+        if self.indice_anunciados is None:
+            return self.carregar_indice_anunciados()
+        return self.indice_anunciados
+    
+    def obter_indice_titulos(self) -> IndiceTitulos:
+        """Índice de títulos dos produtos já anunciados (carrega do banco se ainda não carregado)"""
+        if self.indice_titulos is None:
+            self.carregar_indice_anunciados()
+        return self.indice_titulos
+    
+    def product_saved(self, produto: Produto):
+        """Atualiza os índices após o repositório gravar um produto (inativos saem do índice de títulos)"""
+        if self.indice_anunciados is None:
+            return  # Ainda não carregados: serão lidos do banco, já com a gravação
+        self.indice_anunciados.adicionar(produto.fornecedor_id, produto.fornecedor_product_id, produto.sku)
+        chave = chave_produto(produto.fornecedor_id, produto.fornecedor_product_id) or ("produto", produto.id)
+        if produto.status == StatusProduto.INATIVO:
+            self.indice_titulos.remover(chave)
+        else:
+            self.indice_titulos.adicionar(chave, produto.titulo)
+    
+    def product_deleted(self, produto: Produto):
+        """Retira dos índices um produto removido pelo repositório"""
+        if self.indice_anunciados is None:
+            return
+        self.indice_anunciados.remover(produto.fornecedor_id, produto.fornecedor_product_id, produto.sku)
+        self.indice_titulos.remover(
+            chave_produto(produto.fornecedor_id, produto.fornecedor_product_id) or ("produto", produto.id)
+        )
+    
+    def ja_anunciado(self, fornecedor_id: int, produto: SupplierCandidate) -> bool:
+        """Indica se o produto, o SKU ou um título quase igual já está anunciado (sem acessar banco ou rede)"""
+        if self.obter_indice_anunciados().contem(fornecedor_id, produto.get("id"), produto.get("sku")):
+            return True
+        duplicado = self.obter_indice_titulos().duplicado(
+            produto.get("name", ""), ignorar=chave_produto(fornecedor_id, produto.get("id"))
+        )
+        if duplicado is not None:
+            logger.debug(f"Produto {produto.get('id')} quase igual a {duplicado[0]} (similaridade {duplicado[1]:.2f})")
+            return True
+        return False
+    
+    def reservar_produto(self, fornecedor_id: int, produto: SupplierCandidate) -> bool:
+        """Registra o produto nos índices antes de anunciar; False se já estiver anunciado
+        
+        A reserva é atômica em cada índice, para que publicações simultâneas
+        não anunciem o mesmo produto (ou dois quase iguais) duas vezes.
+        """
+        product_id, sku = produto.get("id"), produto.get("sku")
+        indice = self.obter_indice_anunciados()
+        if not indice.reservar(fornecedor_id, product_id, sku):
+            logger.info(f"Produto {product_id} (SKU {sku}) já anunciado, ignorado")
+            return False
+        
+        chave = chave_produto(fornecedor_id, product_id)
+        if chave is not None and not self.obter_indice_titulos().reservar(chave, produto.get("name", "")):
+            logger.info(f"Produto {product_id} quase igual a um já anunciado, ignorado")
+            indice.remover(fornecedor_id, product_id, sku)
+            return False
+        return True
+    
+    def liberar_produto(self, fornecedor_id: int, produto: SupplierCandidate):
+        """Desfaz a reserva de um produto que não chegou a ser anunciado"""
+        self.obter_indice_anunciados().remover(fornecedor_id, produto.get("id"), produto.get("sku"))
+        chave = chave_produto(fornecedor_id, produto.get("id"))
+        if chave is not None:
+            self.obter_indice_titulos().remover(chave)
+    
+    def filtrar_anunciados(self, resultados: Dict[str, List[SupplierCandidate]],
+                           ids_fornecedores: Dict[str, int]) -> Dict[str, List[SupplierCandidate]]:
+        """Remove dos resultados de cada fornecedor os produtos já anunciados ou quase iguais a um anunciado"""
+        filtrados = {}
+        for tipo, produtos in resultados.items():
+            fornecedor_id = ids_fornecedores[tipo]
+            filtrados[tipo] = [produto for produto in produtos if not self.ja_anunciado(fornecedor_id, produto)]
+            if len(filtrados[tipo]) < len(produtos):
+                logger.info(f"{len(produtos) - len(filtrados[tipo])} produtos de {tipo} já anunciados, ignorados")
+        return filtrados
+    
+    def buscar_tendencias(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Busca as tendências de produtos no Mercado Livre"""
+        logger.info(f"Buscando top {limit} tendências no Mercado Livre")
+        
+        try:
+            # Obtém as tendências de busca do Mercado Livre
+            trends = self.ml_api.get_trends(limit=limit)
+            
+            if not trends:
+                logger.warning("Nenhuma tendência encontrada")
+                return []
+            
+            logger.info(f"Encontradas {len(trends)} tendências")
+            return trends
+        
+        except Exception as e:
+            logger.error(f"Erro ao buscar tendências: {str(e)}")
+            return []
+    
+    def buscar_produtos_fornecedor(self, keyword: str, fornecedor_type: str) -> List[SupplierCandidate]:
+        """Busca produtos no fornecedor com base em uma palavra-chave
+        
+        Consulta primeiro o catálogo local, que só é usado se a palavra-chave
+        foi sincronizada dentro de SUPPLIER_CATALOG_MAX_AGE_HOURS e trouxe
+        ao menos SUPPLIER_CATALOG_MIN_RESULTS candidatos. Caso contrário a
+        API do fornecedor é chamada e o que ela devolve é gravado no
+        catálogo; se a API não trouxer nada, ficam os candidatos do
+        catálogo. As páginas da API são lidas sob demanda, até
+        SUPPLIER_SEARCH_MAX_PAGES ou até surgir um bom candidato.
+        """
+        logger.info(f"Buscando produtos com keyword '{keyword}' no fornecedor {fornecedor_type}")
+        
+        try:
+            fornecedor = _tipo(fornecedor_type)
+            
+            do_catalogo = []
+            if self.catalogo is not None:
+                do_catalogo = self.catalogo.buscar(keyword, fornecedor)
+                if len(do_catalogo) >= SUPPLIER_CATALOG_MIN_RESULTS and not self.catalogo.precisa_sincronizar(fornecedor, keyword):
+                    logger.info(f"Encontrados {len(do_catalogo)} produtos para '{keyword}' no catálogo local")
+                    return do_catalogo
+            
+            fornecedor_api = self.fornecedor_apis.get(fornecedor)
+            if fornecedor_api is None:
+                fornecedor_api = FornecedorAPI()
+                fornecedor_api.set_fornecedor(fornecedor)
+            
+            # Busca produtos no fornecedor, respeitando o limite de buscas simultâneas
+            limite = self.limites_fornecedor.get(fornecedor)
+            
+            def buscar_pagina(page):
+                if limite is None:
+                    return fornecedor_api.search_candidates(keyword, page, SUPPLIER_SEARCH_PAGE_SIZE)
+                with limite:
+                    return fornecedor_api.search_candidates(keyword, page, SUPPLIER_SEARCH_PAGE_SIZE)
+            
+            paginas = iter_pages(buscar_pagina, SUPPLIER_SEARCH_MAX_PAGES, SUPPLIER_SEARCH_PAGE_SIZE)
+            produtos = self.consumir_paginas(paginas, fornecedor_api, fornecedor)
+            
+            if not produtos:
+                if do_catalogo:
+                    logger.info(f"Fornecedor {fornecedor_type} sem resultado para '{keyword}', usando {len(do_catalogo)} produtos do catálogo")
+                    return do_catalogo
+                logger.warning(f"Nenhum produto encontrado para '{keyword}' no fornecedor {fornecedor_type}")
+                return []
+            
+            if self.catalogo is not None:
+                self.catalogo.registrar_sincronizacao(fornecedor, keyword, len(produtos))
+            logger.info(f"Encontrados {len(produtos)} produtos para '{keyword}'")
+            return produtos
+        
+        except Exception as e:
+            logger.error(f"Erro ao buscar produtos no fornecedor: {str(e)}")
+            return []
+    
+    def consumir_paginas(self, paginas, fornecedor_api: FornecedorAPI, fornecedor: str,
+                         limiar: float = LISTING_SCORE_THRESHOLD) -> List[SupplierCandidate]:
+        """Pontua as páginas de busca à medida que chegam
+        
+        Cada página é completada com os detalhes, gravada no catálogo e
+        pontuada enquanto a seguinte já está sendo buscada. Para de pedir
+        páginas assim que algum candidato atinge `limiar` (0 lê todas).
+        """
+        produtos = []
+        try:
+            for numero, pagina in enumerate(paginas, start=1):
+                pagina = self.completar_detalhes(pagina, fornecedor_api)
+                produtos.extend(pagina)
+                
+                if self.catalogo is not None:
+                    self.catalogo.salvar_produtos(fornecedor, pagina)
+                
+                melhores = self.motor_pontuacao.melhores(pagina, 1, confiabilidade=self.confiabilidade_fornecedores())
+                if limiar > 0 and melhores and melhores[0][0] >= limiar:
+                    logger.debug(f"Candidato com score {melhores[0][0]:.2f} na página {numero} de {fornecedor}, encerrando busca")
+                    break
+        finally:
+            paginas.close()
+        return produtos
+    
+    def completar_detalhes(self, produtos: List[SupplierCandidate], fornecedor_api: FornecedorAPI,
+                           top_k: int = SUPPLIER_DETAIL_TOP_K) -> List[SupplierCandidate]:
+        """Completa com os detalhes do fornecedor os primeiros candidatos sem estoque ou avaliação
+        
+        Os detalhes dos `top_k` primeiros resultados incompletos são buscados
+        em paralelo (SUPPLIER_DETAIL_WORKERS), passando pelo cache de detalhes.
+        """
+        incompletos = [
+            produto for produto in produtos[:top_k]
+            if produto.id and (produto.stock is None or produto.rating is None)
+        ]
+        if not incompletos:
+            return produtos
+        
+        try:
+            detalhes = fornecedor_api.get_candidates_details(
+                [produto.id for produto in incompletos], max_workers=SUPPLIER_DETAIL_WORKERS
+            )
+        except Exception as e:
+            # Fornecedor sem endpoint de detalhes: segue com os dados da busca
+            logger.warning(f"Detalhes indisponíveis no fornecedor {fornecedor_api.fornecedor_type}: {str(e)}")
+            return produtos
+        logger.info(f"Detalhes obtidos para {sum(1 for d in detalhes.values() if d)}/{len(incompletos)} candidatos")
+        
+        return [
+            produto.merge(detalhes[produto.id]) if detalhes.get(produto.id) else produto
+            for produto in produtos
+        ]
+    
+    def verificar_produto(self, produto: SupplierCandidate, fornecedor_type: str) -> Optional[SupplierCandidate]:
+        """Confirma na API do fornecedor o preço e o estoque de um produto do catálogo
+        
+        Produtos vindos da busca ao vivo já estão atualizados e são
+        devolvidos como estão. Retorna None se o produto não puder mais
+        ser anunciado.
+        """
+        if produto.origem != "catalogo":
+            return produto
+        
+        fornecedor = _tipo(fornecedor_type)
+        try:
+            atual = self.fornecedor_apis[fornecedor].get_candidates_details([produto.id]).get(produto.id)
+        except Exception as e:
+            logger.error(f"Erro ao verificar produto {produto.id} no fornecedor {fornecedor}: {str(e)}")
+            return None
+        
+        if atual is None:
+            logger.warning(f"Produto {produto.id} não encontrado no fornecedor {fornecedor}")
+            if self.catalogo is not None:
+                self.catalogo.remover(fornecedor, produto.id)
+            return None
+        
+        # Estoque sempre vem da API; os demais campos só se vierem preenchidos
+        verificado = produto.merge(atual).replace(stock=atual.stock)
+        if self.catalogo is not None:
+            self.catalogo.salvar_produtos(fornecedor, [verificado])
+        
+        if self.pontuar_produto(verificado) is None:
+            logger.info(f"Produto {produto.id} sem estoque ou preço no fornecedor {fornecedor}")
+            return None
+        
+        return verificado
+    
+    def confiabilidade_fornecedores(self) -> Dict[str, float]:
+        """Confiabilidade atual de cada fornecedor (de 0 a 1), usada na pontuação"""
+        return {tipo: api.reliability() for tipo, api in self.fornecedor_apis.items()}
+    
+    def pontuar_produto(self, produto: Dict[str, Any], preco_referencia: Optional[float] = None) -> Optional[float]:
+        """Calcula o score de um produto, de 0 a 1 (None se não puder ser anunciado)"""
+        melhores = self.motor_pontuacao.melhores(
+            [produto], 1, preco_referencia, self.confiabilidade_fornecedores()
+        )
+        return melhores[0][0] if melhores else None
+    
+    def selecionar_melhor_produto(self, produtos: List[Dict[str, Any]],
+                                  preco_referencia: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Seleciona o melhor produto da lista (ver MotorPontuacao para os critérios e pesos)"""
+        if not produtos:
+            return None
+        
+        melhores = self.motor_pontuacao.melhores(produtos, 1, preco_referencia, self.confiabilidade_fornecedores())
+        if not melhores:
+            logger.warning("Nenhum produto adequado encontrado")
+            return None
+        
+        score, melhor_produto = melhores[0]
+        logger.info(f"Melhor produto selecionado: {melhor_produto.get('name', 'Desconhecido')} (score {score:.2f})")
+        return melhor_produto
+    
+    def criar_anuncio_ml(self, produto_fornecedor: Dict[str, Any], fornecedor_id: int) -> Optional[Dict[str, Any]]:
+        """Cria um anúncio no Mercado Livre com base em um produto do fornecedor e grava o produto no banco
+        
+        Produtos (ou SKUs) já anunciados, ou com título quase igual ao de um
+        anunciado, são recusados antes de chamar o ML.
+        """
+        if not self.reservar_produto(fornecedor_id, produto_fornecedor):
+            return None
+        
+        publicado = self.publicar_anuncio_ml(produto_fornecedor)
+        if publicado is None:
+            self.liberar_produto(fornecedor_id, produto_fornecedor)
+            return None
+        
+        item_data, resultado = publicado
+        if self.registrar_produto(produto_fornecedor, fornecedor_id, item_data, resultado) is None:
+            return None
+        return resultado
+    
+    def publicar_anuncio_ml(self, produto_fornecedor: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Publica no Mercado Livre o anúncio de um produto do fornecedor, sem gravar no banco
+        
+        Returns:
+            (dados do anúncio, resposta do ML) ou None em caso de falha
+        """
+        try:
+            # Calcula preço de venda com margem
+            preco_custo = produto_fornecedor.get("price", 0)
+            if preco_custo <= 0:
+                logger.warning("Produto com preço inválido")
+                return None
+            
+            margem = ML_MARGIN_PERCENTAGE  # Percentual de margem definido na configuração
+            preco_venda = preco_custo * (1 + margem)
+            
+            # Monta dados do anúncio
+            item_data = {
+                "title": produto_fornecedor.get("name", ""),
+                "category_id": "MLB1051",  # Categoria padrão (deve ser adaptada)
+                "price": preco_venda,
+                "currency_id": "BRL",
+                "available_quantity": min(produto_fornecedor.get("stock", 10), 50),  # Limita a 50 unidades
+                "buying_mode": "buy_it_now",
+                "condition": "new",
+                "listing_type_id": "gold_special",  # Tipo de listagem
+                "description": {
+                    "plain_text": produto_fornecedor.get("description", "")
+                },
+                "pictures": [
+                    {"source": url} for url in produto_fornecedor.get("images", [])
+                ],
+                "shipping": {
+                    "mode": "me2",
+                    "local_pick_up": False,
+                    "free_shipping": preco_venda > 150,  # Frete grátis para produtos acima de R$150
+                    "logistic_type": "cross_docking"
+                }
+            }
+            
+            # Cria o anúncio no Mercado Livre
+            logger.info(f"Criando anúncio no ML: {item_data['title']}")
+            resultado = self.ml_api.create_item(item_data)
+            
+            if not resultado or "id" not in resultado:
+                logger.error(f"Falha ao criar anúncio: {resultado}")
+                return None
+            
+            return item_data, resultado
+        
+        except Exception as e:
+            logger.error(f"Erro ao criar anúncio no ML: {str(e)}")
+            return None
+    
+    def registrar_produto(self, produto_fornecedor: Dict[str, Any], fornecedor_id: int,
+                          item_data: Dict[str, Any], resultado: Dict[str, Any]) -> Optional[Produto]:
+        """Grava no banco o produto de um anúncio já publicado no Mercado Livre"""
+        try:
+            # Salva o produto no banco de dados
+            logger.info(f"Salvando produto no banco: {item_data['title']}")
+            produto_db = self.produto_repo.create({
+                "titulo": item_data["title"],
+                "descricao": item_data["description"]["plain_text"],
+                "preco_custo": produto_fornecedor.get("price", 0),
+                "preco_venda": item_data["price"],
+                "margem": ML_MARGIN_PERCENTAGE,
+                "estoque": item_data["available_quantity"],
+                "categoria": produto_fornecedor.get("category", ""),
+                "sku": produto_fornecedor.get("sku", ""),
+                "ml_item_id": resultado["id"],
+                "fornecedor_id": fornecedor_id,
+                "fornecedor_product_id": produto_fornecedor.get("id", ""),
+                "status": StatusProduto.ATIVO
+            })
+            
+            logger.info(f"Anúncio criado com sucesso: {resultado['id']}")
+            return produto_db
+        
+        except Exception as e:
+            # Desfaz a transação para a sessão continuar utilizável
+            self.db.rollback()
+            logger.error(f"Erro ao salvar produto do anúncio {resultado.get('id')}: {str(e)}")
+            return None
+    
+    def buscar_candidatos(self, keyword: str, tipos: List[str], executor: ThreadPoolExecutor) -> Dict[str, Any]:
+        """Dispara a busca da keyword em todos os fornecedores ao mesmo tempo
+        
+        Returns:
+            Futures com a lista de produtos de cada fornecedor
+        """
+        futuros = {}
+        for tipo in tipos:
+            # Fornecedor degradado: nem chega a ser consultado
+            if not self.fornecedor_apis[tipo].is_available(tipo):
+                logger.warning(f"Fornecedor {tipo} indisponível (circuito aberto), pulando")
+                continue
+            futuros[tipo] = executor.submit(self.buscar_produtos_fornecedor, keyword, tipo)
+        return futuros
+    
+    def ordenar_candidatos(self, resultados: Dict[str, List[SupplierCandidate]],
+                           preco_referencia: Optional[float] = None) -> List[Tuple[str, SupplierCandidate]]:
+        """Melhor produto de cada fornecedor, do maior para o menor score
+        
+        Os candidatos de todos os fornecedores são pontuados juntos, em uma
+        única passada, para que o preço seja comparado entre fornecedores.
+        """
+        todos = []
+        tipos = {}
+        for tipo, produtos in resultados.items():
+            for produto in produtos:
+                todos.append(produto)
+                tipos[id(produto)] = tipo
+        melhores = self.motor_pontuacao.melhores(
+            todos, len(todos), preco_referencia, self.confiabilidade_fornecedores()
+        )
+        
+        candidatos = []
+        vistos = set()
+        for _, produto in melhores:
+            tipo = tipos[id(produto)]
+            if tipo not in vistos:
+                vistos.add(tipo)
+                candidatos.append((tipo, produto))
+        
+        for tipo in resultados:
+            if tipo not in vistos:
+                logger.info(f"Nenhum produto adequado no fornecedor {tipo}")
+        return candidatos
+    
+    def criar_anuncios_diarios(self) -> int:
+        """Cria anúncios diários com base nas tendências e configurações
+        
+        O fluxo roda como um pipeline de estágios ligados por filas
+        limitadas (LISTING_QUEUE_SIZE), cada um com seus workers:
+        
+            busca: LISTING_PARALLEL_KEYWORDS tendências ao mesmo tempo, cada
+                uma consultando todos os fornecedores (limitados por
+                SUPPLIER_MAX_CONCURRENCY)
+            pontuação: ordena os candidatos dos fornecedores
+            publicação: LISTING_PUBLISH_WORKERS anúncios criados no ML ao mesmo tempo
+            gravação: na thread de quem chama, pois a sessão do banco não é thread-safe
+        
+        A publicação de uma tendência acontece enquanto as próximas ainda
+        estão em busca. Nunca há mais publicações em andamento que anúncios
+        faltando para a meta; ao atingi-la o pipeline é encerrado. Produtos
+        já anunciados ou com título quase igual ao de um anunciado (índices
+        carregados do banco no início) são descartados antes de qualquer
+        chamada de rede.
+        """
+        logger.info("Iniciando criação de anúncios diários")
+        
+        # Quantidade de anúncios a serem criados
+        quantidade = ML_ITEMS_PER_DAY
+        
+        # Busca tendências
+        tendencias = self.buscar_tendencias(limit=quantidade * 2)  # Busca o dobro para ter margem
+        
+        if not tendencias:
+            logger.warning("Sem tendências para criar anúncios")
+            return 0
+        
+        # Obtém fornecedores
+        fornecedores = self.fornecedor_repo.list_all()
+        if not fornecedores:
+            logger.error("Nenhum fornecedor cadastrado")
+            return 0
+        
+        # Id de cada fornecedor por tipo de API, copiado antes do pipeline: os objetos ORM
+        # expiram a cada commit da gravação e recarregá-los em uma thread dos estágios
+        # usaria a sessão fora da sua thread
+        ids_fornecedores = {f.api_type: f.id for f in fornecedores}
+        
+        # Fornecedores registrados que estão cadastrados
+        tipos_fornecedores = []
+        for tipo_fornecedor in self.tipos_fornecedores:
+            if tipo_fornecedor not in ids_fornecedores:
+                logger.warning(f"Fornecedor {tipo_fornecedor} não cadastrado")
+                continue
+            tipos_fornecedores.append(tipo_fornecedor)
+        
+        if not tipos_fornecedores:
+            logger.error("Nenhum fornecedor suportado cadastrado")
+            return 0
+        
+        keywords = [t.get("keyword", "") for t in tendencias if t.get("keyword", "")]
+        # Preço da tendência no Mercado Livre, referência para a margem
+        precos_referencia = {t.get("keyword", ""): t.get("price") for t in tendencias}
+        
+        # Produtos já anunciados e seus títulos, lidos uma vez do banco no início da execução
+        self.carregar_indice_anunciados()
+        
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, SUPPLIER_MAX_CONCURRENCY * len(tipos_fornecedores)),
+            thread_name_prefix="busca-fornecedor"
+        )
+        # Uma vaga por anúncio que falta; publicar reserva uma vaga, falhar a devolve
+        vagas = threading.Semaphore(quantidade)
+        criados = []
+        
+        def buscar(keyword):
+            logger.info(f"Processando tendência: {keyword}")
+            futuros = self.buscar_candidatos(keyword, tipos_fornecedores, executor)
+            return keyword, {tipo: futuro.result() for tipo, futuro in futuros.items()}
+        
+        def pontuar(entrada):
+            keyword, resultados = entrada
+            resultados = self.filtrar_anunciados(resultados, ids_fornecedores)
+            candidatos = self.ordenar_candidatos(resultados, precos_referencia.get(keyword))
+            if not candidatos:
+                logger.info(f"Nenhum produto adequado para '{keyword}' nos fornecedores")
+                return None
+            return keyword, resultados, candidatos
+        
+        def publicar(entrada):
+            keyword, resultados, candidatos = entrada
+            while not vagas.acquire(timeout=0.1):
+                if pipeline.parado:
+                    return None
+            
+            # A vaga volta se nada for entregue para a gravação, inclusive quando uma etapa falha
+            publicacao = None
+            try:
+                publicacao = tentar_candidatos(keyword, resultados, candidatos)
+                return publicacao
+            finally:
+                if publicacao is None:
+                    vagas.release()
+        
+        def tentar_candidatos(keyword, resultados, candidatos):
+            # Tenta o melhor candidato entre todos os fornecedores; se falhar, o do próximo fornecedor
+            tentados = set()
+            while candidatos:
+                tipo_fornecedor, melhor_produto = candidatos[0]
+                # Sem o Mercado Livre não há como publicar; encerra em vez de insistir
+                if not self.ml_api.is_available():
+                    logger.warning("Mercado Livre indisponível (circuito aberto), encerrando criação de anúncios")
+                    pipeline.parar()
+                    return None
+                
+                # Reserva o produto antes de qualquer chamada de rede. Se outra tendência o reservou
+                # (ou um quase igual) depois da pontuação, repontua sem ele: o próximo melhor do
+                # mesmo fornecedor ainda pode vencer
+                fornecedor_id = ids_fornecedores[tipo_fornecedor]
+                if not self.reservar_produto(fornecedor_id, melhor_produto):
+                    resultados = self.filtrar_anunciados({
+                        tipo: [produto for produto in produtos if produto is not melhor_produto]
+                        for tipo, produtos in resultados.items()
+                    }, ids_fornecedores)
+                    candidatos = [
+                        (tipo, produto)
+                        for tipo, produto in self.ordenar_candidatos(resultados, precos_referencia.get(keyword))
+                        if tipo not in tentados
+                    ]
+                    continue
+                
+                # Candidatos do catálogo local são confirmados na API antes de anunciar
+                tentados.add(tipo_fornecedor)
+                publicado = None
+                try:
+                    verificado = self.verificar_produto(melhor_produto, tipo_fornecedor)
+                    publicado = self.publicar_anuncio_ml(verificado) if verificado else None
+                finally:
+                    # Mesmo que a gravação falhe, o anúncio já existe no ML e a reserva fica
+                    if not publicado:
+                        self.liberar_produto(fornecedor_id, melhor_produto)
+                if publicado:
+                    return tipo_fornecedor, verificado, publicado
+                candidatos = [(tipo, produto) for tipo, produto in candidatos[1:] if tipo not in tentados]
+            return None
+        
+        def gravar(entrada):
+            tipo_fornecedor, produto, (item_data, resultado) = entrada
+            produto_db = None
+            try:
+                produto_db = self.registrar_produto(produto, ids_fornecedores[tipo_fornecedor], item_data, resultado)
+            finally:
+                # Anúncio não gravado não conta para a meta
+                if produto_db is None:
+                    vagas.release()
+            if produto_db is None:
+                return None
+            
+            criados.append(resultado)
+            logger.info(f"Anúncio {len(criados)}/{quantidade} criado com sucesso ({tipo_fornecedor})")
+            if len(criados) >= quantidade:
+                pipeline.parar()
+            return resultado
+        
+        pipeline = Pipeline([
+            Estagio("busca", buscar, workers=LISTING_PARALLEL_KEYWORDS, tamanho_fila=LISTING_QUEUE_SIZE),
+            Estagio("pontuacao", pontuar, workers=1, tamanho_fila=LISTING_QUEUE_SIZE),
+            Estagio("publicacao", publicar, workers=LISTING_PUBLISH_WORKERS, tamanho_fila=LISTING_QUEUE_SIZE),
+            Estagio("gravacao", gravar, tamanho_fila=LISTING_QUEUE_SIZE, finalizar_pendentes=True, na_thread_chamadora=True),
+        ], nome="listagem diária")
+        
+        try:
+            pipeline.executar(keywords)
+        finally:
+            # Buscas de tendências que não serão mais usadas são descartadas
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        self.estatisticas_pipeline = pipeline.stats()
+        anuncios_criados = len(criados)
+        logger.info(f"Processo concluído. {anuncios_criados} anúncios criados.")
+        return anuncios_criados
+    
+    def sincronizar_catalogo(self, keywords: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Copia para o catálogo local os produtos das palavras-chave (por padrão, as tendências)
+        
+        Os fornecedores são sincronizados em paralelo; palavras-chave
+        sincronizadas recentemente são puladas. Ao final, saem do catálogo
+        os produtos não vistos há SUPPLIER_CATALOG_RETENTION_HOURS.
+        """
+        if self.catalogo is None:
+            logger.warning("Catálogo local de fornecedores desativado")
+            return {}
+        
+        if keywords is None:
+            keywords = [t.get("keyword", "") for t in self.buscar_tendencias(limit=ML_ITEMS_PER_DAY * 2)]
+        keywords = [k for k in keywords if k]
+        
+        tipos = [tipo for tipo in self.tipos_fornecedores if self.fornecedor_apis[tipo].is_available(tipo)]
+        if not keywords or not tipos:
+            return {}
+        
+        logger.info(f"Sincronizando catálogo local: {len(keywords)} palavras-chave, {len(tipos)} fornecedores")
+        
+        with ThreadPoolExecutor(max_workers=len(tipos), thread_name_prefix="sincroniza-catalogo") as executor:
+            futuros = {
+                tipo: executor.submit(self.catalogo.sincronizar, self.fornecedor_apis[tipo], tipo, keywords)
+                for tipo in tipos
+            }
+            resultado = {tipo: futuro.result() for tipo, futuro in futuros.items()}
+        
+        # Produtos que nenhuma sincronização ou busca vê há muito tempo saíram do fornecedor
+        removidos = self.catalogo.remover_antigos(SUPPLIER_CATALOG_RETENTION_HOURS)
+        if removidos:
+            logger.info(f"{removidos} produtos antigos removidos do catálogo local")
+        return resultado
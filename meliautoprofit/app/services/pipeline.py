@@ -0,0 +1,206 @@
+"""
+Pipeline em estágios ligados por filas limitadas
+"""
+import time
+import queue
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..config import setup_logger
+
+# Configuração de logger
+logger = setup_logger(__name__)
+
+# Marca de fim da entrada de um estágio
+_FIM = object()
+
+class Estagio:
+    """Um estágio do pipeline: função aplicada por um grupo próprio de workers
+
+    `funcao(item)` devolve o item do próximo estágio, ou None para
+    descartá-lo. Exceções são contadas como erro e o item é descartado.
+    A fila de entrada tem `tamanho_fila` posições: quando enche, o estágio
+    anterior espera (backpressure). Com `finalizar_pendentes`, os itens que
+    chegam ao estágio são processados mesmo depois de o pipeline ser
+    encerrado (ex.: gravar no banco o que já foi publicado). Com
+    `na_thread_chamadora`, o estágio roda com um único worker na thread que
+    chamou `Pipeline.executar` (para objetos que não podem ser usados em
+    outras threads, como a sessão do banco).
+    """
+
+    def __init__(self, nome: str, funcao: Callable[[Any], Any], workers: int = 1, tamanho_fila: int = 10,
+                 finalizar_pendentes: bool = False, na_thread_chamadora: bool = False):
+        self.nome = nome
+        self.funcao = funcao
+        self.workers = 1 if na_thread_chamadora else max(1, workers)
+        self.fila = queue.Queue(maxsize=max(1, tamanho_fila))
+        self.finalizar_pendentes = finalizar_pendentes
+        self.na_thread_chamadora = na_thread_chamadora
+
+        self.recebidos = 0
+        self.processados = 0
+        self.descartados = 0
+        self.erros = 0
+        self.tempo_processando = 0.0
+        self.latencia_maxima = 0.0
+        self.espera_fila = 0.0
+        self.fila_maxima = 0
+        self._inicio = None
+        self._fim = None
+        self._ativos = self.workers
+        self._lock = threading.Lock()
+
+    def _registrar(self, espera, duracao, resultado, erro):
+        """Atualiza os contadores após um item"""
+        agora = time.monotonic()
+        with self._lock:
+            self.recebidos += 1
+            self.espera_fila += espera
+            self.tempo_processando += duracao
+            self.latencia_maxima = max(self.latencia_maxima, duracao)
+            self.fila_maxima = max(self.fila_maxima, self.fila.qsize())
+            if self._inicio is None:
+                self._inicio = agora - duracao
+            self._fim = agora
+            if erro:
+                self.erros += 1
+            elif resultado is None:
+                self.descartados += 1
+            else:
+                self.processados += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Vazão e latência do estágio"""
+        with self._lock:
+            executados = self.recebidos - self.erros
+            duracao = (self._fim - self._inicio) if self._inicio is not None else 0.0
+            return {
+                "workers": self.workers,
+                "recebidos": self.recebidos,
+                "processados": self.processados,
+                "descartados": self.descartados,
+                "erros": self.erros,
+                "latencia_media_ms": round(1000 * self.tempo_processando / self.recebidos, 1) if self.recebidos else 0.0,
+                "latencia_maxima_ms": round(1000 * self.latencia_maxima, 1),
+                "espera_fila_media_ms": round(1000 * self.espera_fila / self.recebidos, 1) if self.recebidos else 0.0,
+                "vazao_por_segundo": round(executados / duracao, 2) if duracao > 0 else 0.0,
+                "fila_maxima": self.fila_maxima,
+            }
+
+class Pipeline:
+    """Executa estágios em sequência, cada um com seus workers, ligados por filas limitadas
+
+    Os estágios trabalham ao mesmo tempo: enquanto um item está no último
+    estágio, os seguintes já estão nos anteriores. `parar()` encerra cedo
+    (ex.: meta atingida): a entrada deixa de ser lida e os itens ainda
+    não processados são descartados, exceto nos estágios com
+    `finalizar_pendentes`. Cada instância executa uma única vez.
+    """
+
+    def __init__(self, estagios: List[Estagio], nome: str = "pipeline"):
+        if not estagios:
+            raise ValueError("O pipeline precisa de ao menos um estágio")
+        self.estagios = estagios
+        self.nome = nome
+        self.resultados = []
+        self.duracao = 0.0
+        self._parado = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def parado(self) -> bool:
+        """Indica se o pipeline foi encerrado antes do fim da entrada"""
+        return self._parado.is_set()
+
+    def parar(self):
+        """Encerra o pipeline (os itens ainda não processados são descartados)"""
+        if not self._parado.is_set():
+            logger.info(f"Encerrando {self.nome}")
+        self._parado.set()
+
+    def executar(self, entradas: Iterable[Any]) -> List[Any]:
+        """Processa as entradas e espera todos os estágios terminarem
+
+        Returns:
+            Itens que saíram do último estágio
+        """
+        inicio = time.monotonic()
+        threads = [threading.Thread(
+            target=self._alimentar, args=(entradas,), name=f"{self.nome}-entrada", daemon=True
+        )]
+        locais = []
+        for indice, estagio in enumerate(self.estagios):
+            seguinte = self.estagios[indice + 1] if indice + 1 < len(self.estagios) else None
+            if estagio.na_thread_chamadora:
+                locais.append((estagio, seguinte))
+                continue
+            for numero in range(estagio.workers):
+                threads.append(threading.Thread(
+                    target=self._worker, args=(estagio, seguinte),
+                    name=f"{self.nome}-{estagio.nome}-{numero}", daemon=True
+                ))
+
+        for thread in threads:
+            thread.start()
+        for estagio, seguinte in locais:
+            self._worker(estagio, seguinte)
+        for thread in threads:
+            thread.join()
+
+        self.duracao = time.monotonic() - inicio
+        logger.info(f"{self.nome} concluído em {self.duracao:.1f}s: {self.stats()}")
+        return self.resultados
+
+    def _alimentar(self, entradas: Iterable[Any]):
+        """Coloca as entradas na fila do primeiro estágio (espera quando ela enche)"""
+        primeiro = self.estagios[0]
+        try:
+            for item in entradas:
+                if self._parado.is_set():
+                    break
+                primeiro.fila.put((time.monotonic(), item))
+        except Exception as e:
+            logger.error(f"Erro ao ler as entradas de {self.nome}: {str(e)}")
+        finally:
+            for _ in range(primeiro.workers):
+                primeiro.fila.put(_FIM)
+
+    def _worker(self, estagio: Estagio, seguinte: Optional[Estagio]):
+        """Laço de um worker: lê da fila do estágio e entrega ao seguinte"""
+        while True:
+            entrada = estagio.fila.get()
+            if entrada is _FIM:
+                break
+            if self._parado.is_set() and not estagio.finalizar_pendentes:
+                continue
+
+            enfileirado, item = entrada
+            comeco = time.monotonic()
+            resultado, erro = None, False
+            try:
+                resultado = estagio.funcao(item)
+            except Exception as e:
+                erro = True
+                logger.error(f"Erro no estágio {estagio.nome} de {self.nome}: {str(e)}")
+            estagio._registrar(comeco - enfileirado, time.monotonic() - comeco, resultado, erro)
+
+            if resultado is None:
+                continue
+            if seguinte is not None:
+                seguinte.fila.put((time.monotonic(), resultado))
+            else:
+                with self._lock:
+                    self.resultados.append(resultado)
+
+        # O último worker do estágio avisa o estágio seguinte que a entrada acabou
+        with estagio._lock:
+            estagio._ativos -= 1
+            ultimo = estagio._ativos == 0
+        if ultimo and seguinte is not None:
+            for _ in range(seguinte.workers):
+                seguinte.fila.put(_FIM)
+
+    def stats(self) -> Dict[str, Any]:
+        """Contadores de cada estágio"""
+        return {estagio.nome: estagio.stats() for estagio in self.estagios}
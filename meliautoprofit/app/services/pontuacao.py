@@ -0,0 +1,174 @@
+"""
+Pontuação vetorizada dos candidatos dos fornecedores
+"""
+import math
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config import (
+    setup_logger, SCORE_WEIGHTS, SCORE_STOCK_REFERENCE, SCORE_MAX_SHIPPING_DAYS
+)
+
+# Configuração de logger
+logger = setup_logger(__name__)
+
+# Critérios, na ordem das colunas da matriz de critérios
+CRITERIOS = ("avaliacao", "estoque", "preco", "margem", "prazo", "confiabilidade")
+
+# Valor usado quando o critério não pode ser calculado (não favorece nem prejudica)
+NEUTRO = 0.5
+
+def ler_pesos(texto: str) -> Dict[str, float]:
+    """Converte "avaliacao=0.3,estoque=0.2,..." em pesos (critérios omitidos ficam com 0)"""
+    pesos = dict.fromkeys(CRITERIOS, 0.0)
+    for parte in (texto or "").split(","):
+        if "=" not in parte:
+            continue
+        nome, valor = (item.strip() for item in parte.split("=", 1))
+        if nome not in pesos:
+            logger.warning(f"Critério de pontuação desconhecido ignorado: {nome}")
+            continue
+        try:
+            pesos[nome] = max(0.0, float(valor))
+        except ValueError:
+            logger.warning(f"Peso inválido para {nome}: {valor}")
+    return pesos
+
+def _valores(candidatos, campo) -> list:
+    """Valores de um campo (atributos do SupplierCandidate ou chaves de dicionário)"""
+    try:
+        return list(map(attrgetter(campo), candidatos))
+    except AttributeError:
+        return [candidato.get(campo) for candidato in candidatos]
+
+def _coluna(candidatos, campo) -> np.ndarray:
+    """Coluna numérica de um campo (valores ausentes viram NaN)"""
+    return np.array(_valores(candidatos, campo), dtype=np.float64)
+
+class ColunasCandidatos:
+    """Candidatos em colunas (um array por campo), prontos para a pontuação
+
+    Pode ser montado uma vez e pontuado várias vezes (pesos ou preço de
+    referência diferentes) sem percorrer os objetos de novo.
+    """
+
+    __slots__ = ("candidatos", "preco", "estoque", "avaliacao", "prazo", "fornecedores", "codigo_fornecedor")
+
+    def __init__(self, candidatos: Sequence[Any]):
+        self.candidatos = candidatos
+        self.preco = _coluna(candidatos, "price")
+        self.estoque = _coluna(candidatos, "stock")
+        self.avaliacao = _coluna(candidatos, "rating")
+        self.prazo = _coluna(candidatos, "shipping_days")
+
+        # Fornecedor como código inteiro, para mapear a confiabilidade sem laço
+        codigos = {}
+        self.codigo_fornecedor = np.fromiter(
+            (codigos.setdefault(f, len(codigos)) for f in _valores(candidatos, "fornecedor")),
+            dtype=np.int64, count=len(candidatos)
+        )
+        self.fornecedores = list(codigos)
+
+    def __len__(self):
+        return len(self.candidatos)
+
+class MotorPontuacao:
+    """Score ponderado de 0 a 1 sobre critérios normalizados
+
+    Critérios (todos de 0 a 1, maior é melhor):
+        avaliacao: nota / 5
+        estoque: log do estoque, saturando em `estoque_referencia` unidades
+        preco: custo relativo ao grupo (o mais barato vale 1, o mais caro 0)
+        margem: fração do preço de referência (ex.: preço da tendência no
+            Mercado Livre) que sobra sobre o custo
+        prazo: 1 para envio imediato, 0 a partir de `prazo_maximo` dias
+        confiabilidade: informada por fornecedor (ver FornecedorAPI.reliability)
+
+    Candidatos sem preço ou com estoque zerado não podem ser anunciados e
+    ficam com score NaN. Critérios desconhecidos (ex.: avaliação, estoque
+    ou prazo não informados) valem NEUTRO.
+    """
+
+    def __init__(self, pesos: Optional[Dict[str, float]] = None,
+                 estoque_referencia: float = SCORE_STOCK_REFERENCE,
+                 prazo_maximo: float = SCORE_MAX_SHIPPING_DAYS):
+        pesos = ler_pesos(SCORE_WEIGHTS) if pesos is None else dict(dict.fromkeys(CRITERIOS, 0.0), **pesos)
+        total = sum(pesos[criterio] for criterio in CRITERIOS)
+        if total <= 0:
+            raise ValueError("Ao menos um critério de pontuação deve ter peso positivo")
+        self.pesos = pesos
+        self._vetor_pesos = np.array([pesos[criterio] for criterio in CRITERIOS]) / total
+        self.estoque_referencia = max(1.0, estoque_referencia)
+        self.prazo_maximo = max(1.0, prazo_maximo)
+
+    def criterios(self, colunas: ColunasCandidatos, preco_referencia: Optional[float] = None,
+                  confiabilidade: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """Matriz (candidatos x critérios) normalizada de 0 a 1"""
+        n = len(colunas)
+        matriz = np.full((n, len(CRITERIOS)), NEUTRO)
+        if n == 0:
+            return matriz
+
+        preco = colunas.preco
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avaliacao = colunas.avaliacao
+            matriz[:, 0] = np.where(np.isfinite(avaliacao), np.clip(avaliacao / 5.0, 0.0, 1.0), NEUTRO)
+            estoque = colunas.estoque
+            matriz[:, 1] = np.where(
+                np.isfinite(estoque),
+                np.clip(np.log1p(np.clip(estoque, 0.0, None)) / math.log1p(self.estoque_referencia), 0.0, 1.0),
+                NEUTRO
+            )
+
+            validos = np.isfinite(preco) & (preco > 0)
+            if validos.any():
+                minimo, maximo = preco[validos].min(), preco[validos].max()
+                if maximo > minimo:
+                    matriz[:, 2] = np.clip((maximo - preco) / (maximo - minimo), 0.0, 1.0)
+                else:
+                    matriz[:, 2] = 1.0
+
+            if preco_referencia:
+                matriz[:, 3] = np.clip((preco_referencia - preco) / preco_referencia, 0.0, 1.0)
+
+            prazo = colunas.prazo
+            matriz[:, 4] = np.where(
+                np.isfinite(prazo), np.clip(1.0 - prazo / self.prazo_maximo, 0.0, 1.0), NEUTRO
+            )
+
+        if confiabilidade:
+            por_codigo = np.array([confiabilidade.get(f, 1.0) for f in colunas.fornecedores], dtype=np.float64)
+            matriz[:, 5] = por_codigo[colunas.codigo_fornecedor]
+        else:
+            matriz[:, 5] = 1.0
+
+        # Sem preço ou com estoque zerado: não pode ser anunciado (estoque desconhecido não exclui)
+        with np.errstate(invalid="ignore"):
+            matriz[~(np.nan_to_num(preco) > 0) | (colunas.estoque <= 0)] = np.nan
+        return matriz
+
+    def pontuar(self, candidatos, preco_referencia: Optional[float] = None,
+                confiabilidade: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """Scores dos candidatos (lista ou ColunasCandidatos), NaN para os que não podem ser anunciados"""
+        colunas = candidatos if isinstance(candidatos, ColunasCandidatos) else ColunasCandidatos(candidatos)
+        return self.criterios(colunas, preco_referencia, confiabilidade) @ self._vetor_pesos
+
+    def melhores(self, candidatos, k: int = 1, preco_referencia: Optional[float] = None,
+                 confiabilidade: Optional[Dict[str, float]] = None) -> List[Tuple[float, Any]]:
+        """Os `k` candidatos de maior score, do melhor para o pior"""
+        colunas = candidatos if isinstance(candidatos, ColunasCandidatos) else ColunasCandidatos(candidatos)
+        scores = self.pontuar(colunas, preco_referencia, confiabilidade)
+        indices = np.flatnonzero(np.isfinite(scores))
+        if indices.size == 0 or k <= 0:
+            return []
+
+        if k == 1:
+            melhor = indices[np.argmax(scores[indices])]
+            return [(float(scores[melhor]), colunas.candidatos[melhor])]
+        if indices.size > k:
+            # Seleção parcial: só os k melhores são ordenados
+            indices = indices[np.argpartition(-scores[indices], k - 1)[:k]]
+        indices = indices[np.argsort(-scores[indices], kind="stable")]
+        return [(float(scores[i]), colunas.candidatos[i]) for i in indices]
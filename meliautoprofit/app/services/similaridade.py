@@ -0,0 +1,173 @@
+"""
+Detecção de títulos quase iguais com MinHash e LSH
+"""
+import re
+import zlib
+import threading
+import unicodedata
+from typing import Any, Dict, FrozenSet, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from ..config import setup_logger, TITLE_DEDUP_THRESHOLD, TITLE_MINHASH_PERMUTATIONS, TITLE_LSH_BANDS
+from .deduplicacao import chave_produto
+from database.models import StatusProduto
+
+# Configuração de logger
+logger = setup_logger(__name__)
+
+# Primo de Mersenne 2^31 - 1: a * x + b cabe em int64 sem estourar
+_PRIMO = (1 << 31) - 1
+
+# Palavras que não distinguem um produto de outro
+STOPWORDS = frozenset({
+    "a", "o", "as", "os", "de", "da", "do", "das", "dos", "e", "em", "na", "no", "nas", "nos",
+    "com", "para", "por", "p", "c", "um", "uma", "the", "and", "for", "with", "of",
+})
+
+def tokens_titulo(titulo: str) -> FrozenSet[str]:
+    """Palavras do título sem acentos, pontuação e stopwords (a ordem não importa)"""
+    texto = unicodedata.normalize("NFKD", (titulo or "").lower())
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    return frozenset(t for t in re.findall(r"[a-z0-9]+", texto) if t not in STOPWORDS)
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Similaridade de Jaccard entre dois conjuntos de palavras"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+class IndiceTitulos:
+    """Índice de títulos para encontrar produtos quase iguais em tempo sublinear
+
+    Cada título vira um conjunto de palavras e uma assinatura MinHash de
+    `permutacoes` valores. A assinatura é dividida em `bandas`; títulos
+    que coincidem em ao menos uma banda caem no mesmo balde do LSH e só
+    esses candidatos têm a similaridade de Jaccard calculada. A consulta
+    custa uma assinatura e `bandas` acessos a dicionário, independente do
+    tamanho do índice.
+
+    Títulos são adicionados e removidos um a um (`adicionar`/`remover`),
+    por uma chave qualquer (ex.: fornecedor e produto no fornecedor).
+    Seguro para uso por várias threads.
+    """
+
+    def __init__(self, limiar: float = TITLE_DEDUP_THRESHOLD, permutacoes: int = TITLE_MINHASH_PERMUTATIONS,
+                 bandas: int = TITLE_LSH_BANDS, semente: int = 1):
+        bandas = max(1, min(bandas, permutacoes))
+        self.limiar = limiar
+        self.bandas = bandas
+        self.linhas = max(1, permutacoes // bandas)
+        # Funções de hash h(x) = (a * x + b) mod primo, uma por linha da assinatura
+        aleatorio = np.random.default_rng(semente)
+        tamanho = self.bandas * self.linhas
+        self._a = aleatorio.integers(1, _PRIMO, size=(tamanho, 1), dtype=np.int64)
+        self._b = aleatorio.integers(0, _PRIMO, size=(tamanho, 1), dtype=np.int64)
+
+        self._titulos: Dict[Hashable, Tuple[FrozenSet[str], Tuple[bytes, ...]]] = {}
+        self._baldes: List[Dict[bytes, set]] = [{} for _ in range(self.bandas)]
+        self._lock = threading.Lock()
+
+    @classmethod
+    def do_banco(cls, produto_repo, **opcoes) -> "IndiceTitulos":
+        """Monta o índice com os títulos dos produtos gravados (exceto os inativos)"""
+        indice = cls(**opcoes)
+        for produto_id, fornecedor_id, product_id, titulo in produto_repo.list_titles(StatusProduto.INATIVO):
+            chave = chave_produto(fornecedor_id, product_id) or ("produto", produto_id)
+            indice._adicionar(chave, titulo)
+        logger.info(f"Índice de títulos carregado: {len(indice)} produtos")
+        return indice
+
+    def __len__(self):
+        return len(self._titulos)
+
+    def __contains__(self, chave):
+        return chave in self._titulos
+
+    def _assinatura(self, tokens: FrozenSet[str]) -> Tuple[bytes, ...]:
+        """Assinatura MinHash, já separada nas chaves das bandas"""
+        hashes = np.fromiter((zlib.crc32(t.encode("utf-8")) for t in tokens), dtype=np.int64, count=len(tokens))
+        assinatura = ((self._a * (hashes % _PRIMO) + self._b) % _PRIMO).min(axis=1)
+        return tuple(
+            assinatura[i * self.linhas:(i + 1) * self.linhas].tobytes() for i in range(self.bandas)
+        )
+
+    def _candidatos(self, bandas: Tuple[bytes, ...]) -> set:
+        """Chaves que coincidem com a assinatura em ao menos uma banda"""
+        candidatos = set()
+        for balde, banda in zip(self._baldes, bandas):
+            candidatos.update(balde.get(banda, ()))
+        return candidatos
+
+    def _adicionar(self, chave, titulo):
+        tokens = tokens_titulo(titulo)
+        if tokens:
+            self._indexar(chave, tokens, self._assinatura(tokens))
+
+    def _indexar(self, chave, tokens, bandas):
+        self._remover(chave)
+        self._titulos[chave] = (tokens, bandas)
+        for balde, banda in zip(self._baldes, bandas):
+            balde.setdefault(banda, set()).add(chave)
+
+    def _remover(self, chave):
+        registro = self._titulos.pop(chave, None)
+        if registro is None:
+            return
+        for balde, banda in zip(self._baldes, registro[1]):
+            chaves = balde.get(banda)
+            if chaves is not None:
+                chaves.discard(chave)
+                if not chaves:
+                    del balde[banda]
+
+    def _duplicado(self, tokens, bandas, ignorar=None) -> Optional[Tuple[Any, float]]:
+        melhor = None
+        for chave in self._candidatos(bandas):
+            if chave == ignorar:
+                continue
+            similaridade = jaccard(tokens, self._titulos[chave][0])
+            if similaridade >= self.limiar and (melhor is None or similaridade > melhor[1]):
+                melhor = (chave, similaridade)
+        return melhor
+
+    def adicionar(self, chave, titulo: str):
+        """Indexa (ou reindexa) o título de um produto"""
+        with self._lock:
+            self._adicionar(chave, titulo)
+
+    def remover(self, chave):
+        """Retira um produto do índice"""
+        with self._lock:
+            self._remover(chave)
+
+    def duplicado(self, titulo: str, ignorar=None) -> Optional[Tuple[Any, float]]:
+        """Produto indexado mais parecido com o título, se a similaridade passar do limiar
+
+        Returns:
+            (chave, similaridade de Jaccard) ou None
+        """
+        if self.limiar <= 0:
+            return None
+        tokens = tokens_titulo(titulo)
+        if not tokens:
+            return None
+        bandas = self._assinatura(tokens)
+        with self._lock:
+            return self._duplicado(tokens, bandas, ignorar)
+
+    def reservar(self, chave, titulo: str) -> bool:
+        """Indexa o título se não houver outro quase igual (verificação e registro atômicos)
+
+        Returns:
+            False se já havia um título quase igual indexado
+        """
+        tokens = tokens_titulo(titulo)
+        if not tokens:
+            return True
+        bandas = self._assinatura(tokens)
+        with self._lock:
+            if self.limiar > 0 and self._duplicado(tokens, bandas, ignorar=chave) is not None:
+                return False
+            self._indexar(chave, tokens, bandas)
+            return True
@@ -0,0 +1,133 @@
+"""
+Serviço de sincronização de preço e estoque dos produtos ativos
+"""
+import logging
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+from sqlalchemy.orm import Session
+
+from ..config import setup_logger, PRODUCT_SYNC_BATCH_SIZE, PRODUCT_SYNC_WORKERS
+from ..api.fornecedor import FornecedorAPI
+from ..api.adaptadores_fornecedor import SupplierCandidate, registered_types
+from database.models import StatusProduto
+from database.repository import ProdutoRepository
+
+# Configuração de logger
+logger = setup_logger(__name__)
+
+# Diferença de preço abaixo da qual o custo é considerado igual
+TOLERANCIA_PRECO = 0.005
+
+class SincronizacaoService:
+    """Atualiza o preço de custo e o estoque dos produtos ativos com os dados dos fornecedores
+
+    Os produtos ativos são percorridos em lotes (paginação por id). Para
+    cada lote, os detalhes são consultados em paralelo em cada fornecedor
+    (no máximo `workers` consultas simultâneas) e só as linhas cujo custo
+    ou estoque mudou são gravadas, em uma única transação por lote.
+    """
+
+    def __init__(self, db: Session, tamanho_lote: int = PRODUCT_SYNC_BATCH_SIZE,
+                 workers: int = PRODUCT_SYNC_WORKERS):
+        """Inicializa o serviço de sincronização"""
+        self.db = db
+        self.tamanho_lote = max(1, tamanho_lote)
+        self.workers = max(1, workers)
+        self.produto_repo = ProdutoRepository(db)
+        self.fornecedor_apis = {tipo: FornecedorAPI(tipo) for tipo in registered_types()}
+
+    def buscar_atuais(self, lote: List[Any]) -> Dict[Any, Optional[SupplierCandidate]]:
+        """Consulta preço e estoque atuais dos produtos do lote, agrupados por fornecedor
+
+        Returns:
+            Dicionário {(tipo de API, id no fornecedor): candidato ou None}
+        """
+        por_fornecedor = {}
+        for linha in lote:
+            if linha.fornecedor_product_id:
+                por_fornecedor.setdefault(linha.api_type, []).append(linha.fornecedor_product_id)
+
+        atuais = {}
+        for tipo, ids in por_fornecedor.items():
+            fornecedor_api = self.fornecedor_apis.get(tipo)
+            if fornecedor_api is None:
+                logger.warning(f"Fornecedor {tipo} não registrado, {len(ids)} produtos ignorados")
+                continue
+            if not fornecedor_api.is_available():
+                logger.warning(f"Fornecedor {tipo} indisponível (circuito aberto), {len(ids)} produtos ignorados")
+                continue
+
+            try:
+                detalhes = fornecedor_api.get_candidates_details(ids, max_workers=self.workers)
+            except Exception as e:
+                logger.error(f"Erro ao consultar produtos do fornecedor {tipo}: {str(e)}")
+                continue
+
+            for product_id, candidato in detalhes.items():
+                atuais[(tipo, product_id)] = candidato
+        return atuais
+
+    def calcular_alteracoes(self, lote: List[Any], atuais: Dict[Any, Optional[SupplierCandidate]]) -> List[Dict[str, Any]]:
+        """Compara o lote com os dados atuais e devolve só as linhas alteradas
+
+        Quando o custo muda, a margem é recalculada na mesma linha sobre o
+        preço de venda atual, para custo e margem não ficarem inconsistentes.
+        """
+        agora = datetime.utcnow()
+        alteracoes = []
+        for linha in lote:
+            atual = atuais.get((linha.api_type, linha.fornecedor_product_id))
+            if atual is None:
+                continue
+
+            alteracao = {}
+            if atual.price is not None and atual.price > 0 and abs(atual.price - (linha.preco_custo or 0)) > TOLERANCIA_PRECO:
+                alteracao["preco_custo"] = atual.price
+                # O preço de venda anunciado não muda: a margem passa a ser a do novo custo
+                if linha.preco_venda:
+                    alteracao["margem"] = (linha.preco_venda - atual.price) / atual.price
+            if atual.stock is not None and atual.stock != linha.estoque:
+                alteracao["estoque"] = atual.stock
+
+            if alteracao:
+                alteracao["id"] = linha.id
+                alteracao["updated_at"] = agora
+                alteracoes.append(alteracao)
+        return alteracoes
+
+    def sincronizar(self) -> Dict[str, int]:
+        """Sincroniza todos os produtos ativos
+
+        Returns:
+            Totais: lotes, produtos verificados, sem dados do fornecedor, alterados e erros de gravação
+        """
+        logger.info("Iniciando sincronização de preço e estoque dos produtos ativos")
+        totais = {"lotes": 0, "verificados": 0, "sem_dados": 0, "alterados": 0, "erros": 0}
+
+        ultimo_id = 0
+        while True:
+            lote = self.produto_repo.list_sync_batch(StatusProduto.ATIVO, ultimo_id, self.tamanho_lote)
+            if not lote:
+                break
+            ultimo_id = lote[-1].id
+
+            atuais = self.buscar_atuais(lote)
+            alteracoes = self.calcular_alteracoes(lote, atuais)
+
+            try:
+                totais["alterados"] += self.produto_repo.bulk_update(alteracoes)
+            except Exception as e:
+                logger.error(f"Erro ao gravar o lote até o produto {ultimo_id}: {str(e)}")
+                totais["erros"] += len(alteracoes)
+
+            totais["lotes"] += 1
+            totais["verificados"] += len(lote)
+            totais["sem_dados"] += sum(
+                1 for linha in lote if atuais.get((linha.api_type, linha.fornecedor_product_id)) is None
+            )
+
+            if len(lote) < self.tamanho_lote:
+                break
+
+        logger.info(f"Sincronização de produtos concluída: {totais}")
+        return totais
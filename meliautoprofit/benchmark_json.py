@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Compara o json padrão com o orjson em payloads realistas
+
+Usa os pedidos, o multiget de itens e as páginas de catálogo gerados
+pelo simulador_apis.py (mesmo formato das APIs reais) e mede o tempo
+de decodificação, de codificação e do log indentado dos webhooks.
+
+Uso:
+    python benchmark_json.py --repeticoes 200
+"""
+import sys
+import json
+import timeit
+import argparse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from simulador_apis import SimulacaoConfig, Catalogo
+
+def montar_payloads(tamanho_catalogo):
+    """Payloads típicos: webhook, página de pedidos, multiget e catálogo"""
+    catalogo = Catalogo(SimulacaoConfig(tamanho_catalogo=tamanho_catalogo))
+    return {
+        "webhook de pedido": {
+            "resource": "/orders/2000000042", "user_id": 123456, "topic": "orders_v2",
+            "application_id": 987654, "attempts": 1, "sent": "2025-01-01T10:00:00.000Z",
+            "received": "2025-01-01T10:00:00.000Z",
+        },
+        "página de pedidos (50)": {
+            "results": [catalogo.pedido(i) for i in range(50)],
+            "paging": {"total": tamanho_catalogo, "offset": 0, "limit": 50},
+        },
+        "multiget de itens (20)": [
+            {"code": 200, "body": catalogo.item_ml(f"MLB{i}")} for i in range(20)
+        ],
+        "página de catálogo (100)": {
+            "code": 200,
+            "data": {"list": [catalogo.produto(i, "CJ") for i in range(100)], "total": tamanho_catalogo},
+        },
+    }
+
+def medir(funcao, repeticoes):
+    """Melhor tempo médio por chamada, em microssegundos"""
+    tempos = timeit.repeat(funcao, number=repeticoes, repeat=5)
+    return min(tempos) / repeticoes * 1e6
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de codificação JSON")
+    parser.add_argument("-n", "--repeticoes", type=int, default=200, help="Chamadas por medição")
+    parser.add_argument("--catalogo", type=int, default=1000, help="Tamanho do catálogo simulado")
+    args = parser.parse_args()
+
+    if orjson is None:
+        print("orjson não está instalado; instale com 'pip install orjson' para comparar")
+        sys.exit(1)
+
+    print(f"{'payload':<26} {'operação':<14} {'json (µs)':>10} {'orjson (µs)':>12} {'ganho':>7}")
+    for nome, payload in montar_payloads(args.catalogo).items():
+        texto = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        operacoes = {
+            "decodificar": (lambda: json.loads(texto), lambda: orjson.loads(texto)),
+            "codificar": (
+                lambda: json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+                lambda: orjson.dumps(payload),
+            ),
+            "log indentado": (
+                lambda: json.dumps(payload, indent=2),
+                lambda: orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"),
+            ),
+        }
+        for operacao, (padrao, rapido) in operacoes.items():
+            t_padrao = medir(padrao, args.repeticoes)
+            t_rapido = medir(rapido, args.repeticoes)
+            print(f"{nome:<26} {operacao:<14} {t_padrao:>10.1f} {t_rapido:>12.1f} {t_padrao / t_rapido:>6.1f}x")
+        print(f"{'':<26} {'tamanho':<14} {len(texto):>10} bytes")
+
+if __name__ == "__main__":
+    main()
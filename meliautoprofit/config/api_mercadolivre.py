@@ -1,63 +1,114 @@
-"""
-Configuração da API do Mercado Livre
-"""
-import requests
-import os
-from dotenv import load_dotenv
-
-# Carrega variáveis de ambiente
-load_dotenv()
-
-# Credenciais
-ML_CLIENT_ID = os.getenv("ML_CLIENT_ID")
-ML_CLIENT_SECRET = os.getenv("ML_CLIENT_SECRET")
-ML_USER_ID = os.getenv("ML_USER_ID")
-
-# URLs da API
-ML_API_BASE_URL = "https://api.mercadolibre.com"
-ML_AUTH_URL = f"{ML_API_BASE_URL}/oauth/token"
-ML_ITEMS_URL = f"{ML_API_BASE_URL}/items"
-ML_ORDERS_URL = f"{ML_API_BASE_URL}/orders"
-ML_TRENDS_URL = f"{ML_API_BASE_URL}/trends/MLB"
-
-def get_access_token():
-    """Obtém token de acesso via OAuth"""
-    print("DEBUG: Obtendo token do Mercado Livre")
-    data = {
-        "grant_type": "client_credentials",
-        "client_id": ML_CLIENT_ID,
-        "client_secret": ML_CLIENT_SECRET
-    }
-    
-    response = requests.post(ML_AUTH_URL, data=data)
-    if response.status_code == 200:
-        return response.json()["access_token"]
-    else:
-        print(f"DEBUG: Erro ao obter token: {response.text}")
-        return None
-
-def get_trends():
-    """Obtém tendências de produtos"""
-    token = get_access_token()
-    if not token:
-        return []
-    
-    headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(ML_TRENDS_URL, headers=headers)
-    
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"DEBUG: Erro ao obter tendências: {response.text}")
-        return []
-
-# Exemplo de teste da API
-if __name__ == "__main__":
-    token = get_access_token()
-    print(f"DEBUG: Token obtido: {token[:10]}...")
-    
-    trends = get_trends()
-    if trends:
-        print(f"DEBUG: {len(trends)} tendências encontradas")
-        for i, trend in enumerate(trends[:3]):
+"""
+Configuração da API do Mercado Livre
+"""
+from config import http_client, rate_limit, circuit_breaker, json_codec
+from config.cache import HTTPCache
+from config.token_cache import AutoRefreshTokenCache
+import os
+import time
+from dotenv import load_dotenv
+
+# Carrega variáveis de ambiente
+load_dotenv()
+
+# Credenciais
+ML_CLIENT_ID = os.getenv("ML_CLIENT_ID")
+ML_CLIENT_SECRET = os.getenv("ML_CLIENT_SECRET")
+ML_USER_ID = os.getenv("ML_USER_ID")
+ML_REFRESH_TOKEN = os.getenv("ML_REFRESH_TOKEN")
+
+# URLs da API
+ML_API_BASE_URL = os.getenv("ML_API_BASE_URL", "https://api.mercadolibre.com")
+ML_AUTH_URL = f"{ML_API_BASE_URL}/oauth/token"
+ML_ITEMS_URL = f"{ML_API_BASE_URL}/items"
+ML_ORDERS_URL = f"{ML_API_BASE_URL}/orders"
+ML_TRENDS_URL = f"{ML_API_BASE_URL}/trends/MLB"
+
+# Limite de requisições por segundo (0 desativa)
+ML_RATE_LIMIT = float(os.getenv("ML_RATE_LIMIT", "10"))
+rate_limit.configure(ML_API_BASE_URL, ML_RATE_LIMIT, name="Mercado Livre")
+
+# Circuit breaker (limites em CIRCUIT_*)
+circuit_breaker.configure(ML_API_BASE_URL, name="Mercado Livre")
+
+# Cache de itens e entregas (segundos)
+ML_ITEM_CACHE_TTL = int(os.getenv("ML_ITEM_CACHE_TTL", "60"))
+ML_SHIPMENT_CACHE_TTL = int(os.getenv("ML_SHIPMENT_CACHE_TTL", "60"))
+item_cache = HTTPCache.from_env("ml_itens", ttl=ML_ITEM_CACHE_TTL)
+shipment_cache = HTTPCache.from_env("ml_entregas", ttl=ML_SHIPMENT_CACHE_TTL)
+
+# Gerenciamento do token (arquivo opcional para reaproveitar entre reinícios)
+ML_TOKEN_CACHE_FILE = os.getenv("ML_TOKEN_CACHE_FILE")
+ML_TOKEN_REFRESH_MARGIN = int(os.getenv("ML_TOKEN_REFRESH_MARGIN", "300"))
+
+def _fetch_access_token():
+    """Solicita um novo token via OAuth
+
+    Usa o refresh token vigente quando houver um; caso contrário, o fluxo
+    client_credentials.
+    """
+    print("DEBUG: Obtendo token do Mercado Livre")
+    refresh_token = token_manager.data.get("refresh_token") or ML_REFRESH_TOKEN
+    data = {
+        "client_id": ML_CLIENT_ID,
+        "client_secret": ML_CLIENT_SECRET
+    }
+    if refresh_token:
+        data["grant_type"] = "refresh_token"
+        data["refresh_token"] = refresh_token
+    else:
+        data["grant_type"] = "client_credentials"
+    
+    response = http_client.post(ML_AUTH_URL, data=data)
+    if response.status_code == 200:
+        result = json_codec.response_json(response)
+        return {
+            "access_token": result["access_token"],
+            "refresh_token": result.get("refresh_token", refresh_token),
+            "expires_in": result.get("expires_in", 21600),
+            "expires_at": time.time() + result.get("expires_in", 21600)
+        }
+    else:
+        print(f"DEBUG: Erro ao obter token: {response.text}")
+        return None
+
+# Gerenciador único do processo, renovado em segundo plano
+token_manager = AutoRefreshTokenCache(
+    _fetch_access_token,
+    refresh_margin=ML_TOKEN_REFRESH_MARGIN,
+    persist_path=ML_TOKEN_CACHE_FILE,
+    name="token do Mercado Livre"
+)
+
+def get_access_token():
+    """Obtém o token de acesso atual (renovado só quando necessário)"""
+    return token_manager.get_token()
+
+def get_trends():
+    """Obtém tendências de produtos"""
+    token = get_access_token()
+    if not token:
+        return []
+    
+    headers = {"Authorization": f"Bearer {token}"}
+    response = http_client.get(ML_TRENDS_URL, headers=headers)
+    if response.status_code == 401 and token_manager.refresh_if_stale(token):
+        headers = {"Authorization": f"Bearer {token_manager.access_token}"}
+        response = http_client.get(ML_TRENDS_URL, headers=headers)
+    
+    if response.status_code == 200:
+        return json_codec.response_json(response)
+    else:
+        print(f"DEBUG: Erro ao obter tendências: {response.text}")
+        return []
+
+# Exemplo de teste da API
+if __name__ == "__main__":
+    token = get_access_token()
+    print(f"DEBUG: Token obtido: {token[:10]}...")
+    
+    trends = get_trends()
+    if trends:
+        print(f"DEBUG: {len(trends)} tendências encontradas")
+        for i, trend in enumerate(trends[:3]):
             print(f"DEBUG: Tendência {i+1}: {trend.get('keyword')}") 
\ No newline at end of file
@@ -0,0 +1,194 @@
+"""
+Limitador de requisições por host (token bucket)
+"""
+import time
+import asyncio
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+# Configuração de logging
+logger = logging.getLogger(__name__)
+
+# Limites de ajuste dinâmico
+MIN_RATE_FACTOR = 0.1      # taxa mínima como fração da taxa configurada
+RECOVERY_STEP = 0.05       # recuperação da taxa por resposta bem-sucedida
+MAX_PENALTY = 60.0         # espera máxima após 429 sem Retry-After
+
+def _parse_retry_after(value, now):
+    """Converte Retry-After (segundos ou data HTTP) em segundos de espera"""
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - now, 0.0)
+    except (TypeError, ValueError):
+        return None
+
+def _parse_reset(value, now):
+    """Converte X-RateLimit-Reset (epoch ou segundos restantes) em segundos"""
+    if value is None:
+        return None
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    # Valores grandes são timestamps absolutos
+    return max(reset - now, 0.0) if reset > 1e9 else max(reset, 0.0)
+
+def retry_delay(headers):
+    """Segundos de espera pedidos pelo servidor (Retry-After ou X-RateLimit-Reset), se informados"""
+    now = time.time()
+    retry_after = _parse_retry_after(headers.get("Retry-After"), now)
+    if retry_after is None:
+        retry_after = _parse_reset(headers.get("X-RateLimit-Reset"), now)
+    return retry_after
+
+class TokenBucket:
+    """Token bucket com ajuste de taxa a partir das respostas do servidor"""
+
+    def __init__(self, rate, burst=None, name=""):
+        self.name = name
+        self.configured_rate = float(rate)
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(rate, 1))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.penalty = 1.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        """Repõe fichas proporcionalmente ao tempo decorrido"""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def reserve(self):
+        """Reserva uma ficha e retorna quantos segundos esperar antes de usá-la"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            delay = max(self.blocked_until - now, 0.0)
+            if self.tokens < 0:
+                delay += -self.tokens / self.rate
+            return delay
+
+    def acquire(self):
+        """Bloqueia a thread até a requisição ser permitida"""
+        delay = self.reserve()
+        if delay > 0:
+            logger.debug(f"Aguardando {delay:.2f}s pelo limite de {self.name}")
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """Versão assíncrona de `acquire`"""
+        delay = self.reserve()
+        if delay > 0:
+            logger.debug(f"Aguardando {delay:.2f}s pelo limite de {self.name}")
+            await asyncio.sleep(delay)
+
+    def block_for(self, seconds):
+        """Impede novas requisições pelos próximos `seconds` segundos"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def observe(self, status_code, headers):
+        """Ajusta a taxa a partir do status e dos cabeçalhos de limite"""
+        now = time.time()
+        retry_after = _parse_retry_after(headers.get("Retry-After"), now)
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = _parse_reset(headers.get("X-RateLimit-Reset"), now)
+
+        with self._lock:
+            if status_code == 429:
+                # Reduz a taxa pela metade e respeita o tempo pedido pelo servidor
+                self.rate = max(self.rate / 2, self.configured_rate * MIN_RATE_FACTOR)
+                if retry_after is None:
+                    retry_after = reset if reset is not None else self.penalty
+                    self.penalty = min(self.penalty * 2, MAX_PENALTY)
+                self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+                self.tokens = min(self.tokens, 0.0)
+                logger.warning(
+                    f"Limite de {self.name} atingido: aguardando {retry_after:.1f}s, "
+                    f"taxa reduzida para {self.rate:.2f} req/s"
+                )
+                return
+
+            self.penalty = 1.0
+            if remaining is not None and reset:
+                try:
+                    remaining = float(remaining)
+                except ValueError:
+                    remaining = None
+                if remaining is not None:
+                    # Distribui a cota restante até o fim da janela
+                    if remaining <= 0:
+                        self.blocked_until = max(self.blocked_until, time.monotonic() + reset)
+                    self.rate = min(
+                        self.configured_rate,
+                        max(remaining / reset, self.configured_rate * MIN_RATE_FACTOR)
+                    )
+                    return
+
+            if self.rate < self.configured_rate:
+                self.rate = min(self.configured_rate, self.rate + self.configured_rate * RECOVERY_STEP)
+
+    def stats(self):
+        """Estado atual do limitador"""
+        return {
+            "name": self.name,
+            "rate": self.rate,
+            "configured_rate": self.configured_rate,
+            "tokens": self.tokens,
+            "blocked_for": max(self.blocked_until - time.monotonic(), 0.0),
+        }
+
+# Limitadores registrados por host
+_buckets = {}
+
+def _host_of(url):
+    """Extrai o host de uma URL (ou retorna o próprio host)"""
+    return (urlsplit(url).netloc or url).lower()
+
+def configure(url, rate, burst=None, name=None):
+    """Registra o limite de requisições por segundo de um host"""
+    host = _host_of(url)
+    if not rate or rate <= 0:
+        _buckets.pop(host, None)
+        return None
+    bucket = TokenBucket(rate, burst, name=name or host)
+    _buckets[host] = bucket
+    return bucket
+
+def get_bucket(url):
+    """Retorna o limitador do host da URL, se houver"""
+    return _buckets.get(_host_of(url))
+
+def acquire(url):
+    """Aguarda a vez de fazer uma requisição para a URL"""
+    bucket = get_bucket(url)
+    if bucket is not None:
+        bucket.acquire()
+
+async def acquire_async(url):
+    """Versão assíncrona de `acquire`"""
+    bucket = get_bucket(url)
+    if bucket is not None:
+        await bucket.acquire_async()
+
+def observe(url, response):
+    """Repassa status e cabeçalhos da resposta ao limitador do host"""
+    bucket = get_bucket(url)
+    if bucket is not None:
+        bucket.observe(response.status_code, response.headers)
+
+def stats():
+    """Estado de todos os limitadores"""
+    return {host: bucket.stats() for host, bucket in _buckets.items()}
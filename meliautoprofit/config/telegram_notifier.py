@@ -0,0 +1,270 @@
+"""
+Fila de envio de mensagens do Telegram em segundo plano
+"""
+import time
+import queue
+import atexit
+import logging
+import threading
+import itertools
+
+from config.rate_limit import TokenBucket
+
+# Configuração de logging
+logger = logging.getLogger(__name__)
+
+# Prioridades (menor valor sai primeiro)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+# Tamanho máximo de uma mensagem do Telegram
+TELEGRAM_MAX_LENGTH = 4096
+
+# Cabeçalho do resumo por modo de formatação
+_DIGEST_HEADERS = {
+    "HTML": "<b>📬 {n} notificações</b>",
+    "Markdown": "*📬 {n} notificações*",
+}
+_DIGEST_SEPARATOR = "\n\n───\n\n"
+
+class _Message:
+    """Mensagem na fila"""
+
+    __slots__ = ("text", "chat_id", "parse_mode", "priority", "attempts")
+
+    def __init__(self, text, chat_id, parse_mode, priority):
+        self.text = text
+        self.chat_id = chat_id
+        self.parse_mode = parse_mode
+        self.priority = priority
+        self.attempts = 0
+
+class TelegramNotifier:
+    """Envia mensagens por uma thread própria, sem bloquear quem chama
+
+    `notify` só coloca a mensagem na fila (limitada) e retorna. A thread de
+    envio respeita o limite por chat (grupos têm limite menor); o limite
+    global fica com o limitador do host do transporte HTTP. Mensagens de
+    baixa prioridade para o mesmo chat que chegam dentro de
+    `digest_window` segundos são reunidas em uma única mensagem.
+    """
+
+    def __init__(
+        self,
+        send,
+        max_queue=1000,
+        chat_rate=1.0,
+        group_rate=20 / 60,
+        digest_window=5.0,
+        digest_max=20,
+        retries=2,
+        name="Telegram",
+    ):
+        self.send = send
+        self.chat_rate = chat_rate
+        self.group_rate = group_rate
+        self.digest_window = digest_window
+        self.digest_max = digest_max
+        self.retries = retries
+        self.name = name
+
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.merged = 0
+
+        self._queue = queue.PriorityQueue(maxsize=max_queue)
+        self._seq = itertools.count()
+        self._digests = {}
+        self._chat_buckets = {}
+        self._busy = False
+        self._stopping = False
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Inicia a thread de envio (chamado automaticamente no primeiro envio)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name=f"notifier-{self.name}", daemon=True)
+            self._thread.start()
+
+    def notify(self, text, chat_id, priority=PRIORITY_NORMAL, parse_mode="HTML"):
+        """Agenda o envio de uma mensagem
+
+        Returns:
+            True se a mensagem entrou na fila, False se foi descartada
+        """
+        if not text or not chat_id:
+            logger.warning(f"Mensagem para {self.name} descartada: texto ou chat ausente")
+            self.dropped += 1
+            return False
+
+        self.start()
+        message = _Message(text, str(chat_id), parse_mode, priority)
+        try:
+            self._queue.put_nowait((priority, next(self._seq), message))
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(f"Fila de {self.name} cheia, mensagem descartada")
+            return False
+        return True
+
+    def flush(self, timeout=10.0):
+        """Espera a fila e os resumos pendentes serem enviados
+
+        Returns:
+            True se tudo foi enviado dentro do prazo
+        """
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            for digest in self._digests.values():
+                digest["deadline"] = 0
+        while time.monotonic() < deadline:
+            if self._queue.unfinished_tasks == 0 and not self._digests and not self._busy:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def stop(self, timeout=5.0):
+        """Envia o que estiver pendente e encerra a thread"""
+        if self._thread is None:
+            return
+        self.flush(timeout)
+        self._stopping = True
+        self._thread.join(timeout)
+        self._thread = None
+
+    def stats(self):
+        """Contadores da fila"""
+        return {
+            "name": self.name,
+            "queued": self._queue.qsize(),
+            "pending_digests": sum(len(d["messages"]) for d in list(self._digests.values())),
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "merged": self.merged,
+        }
+
+    def _run(self):
+        """Laço da thread de envio"""
+        while not self._stopping:
+            try:
+                _, _, message = self._queue.get(timeout=self._wait_time())
+            except queue.Empty:
+                message = None
+
+            if message is not None:
+                self._busy = True
+                try:
+                    if message.priority >= PRIORITY_LOW:
+                        self._add_to_digest(message)
+                    else:
+                        self._deliver(message)
+                finally:
+                    self._busy = False
+                    self._queue.task_done()
+
+            self._flush_due_digests()
+
+    def _wait_time(self):
+        """Tempo máximo de espera por novas mensagens"""
+        with self._lock:
+            if not self._digests:
+                return 0.5
+            next_deadline = min(d["deadline"] for d in self._digests.values())
+        return min(max(next_deadline - time.monotonic(), 0.0), 0.5)
+
+    def _add_to_digest(self, message):
+        """Acumula uma mensagem de baixa prioridade no resumo do chat"""
+        key = (message.chat_id, message.parse_mode)
+        with self._lock:
+            digest = self._digests.get(key)
+            if digest is None:
+                digest = {"messages": [], "deadline": time.monotonic() + self.digest_window}
+                self._digests[key] = digest
+            digest["messages"].append(message.text)
+            full = len(digest["messages"]) >= self.digest_max
+        if full:
+            self._flush_digest(key)
+
+    def _flush_due_digests(self):
+        """Envia os resumos cujo prazo terminou"""
+        now = time.monotonic()
+        with self._lock:
+            due = [key for key, digest in self._digests.items() if digest["deadline"] <= now]
+        for key in due:
+            self._flush_digest(key)
+
+    def _flush_digest(self, key):
+        """Envia um resumo, dividido se passar do tamanho máximo"""
+        self._busy = True
+        with self._lock:
+            digest = self._digests.pop(key, None)
+        if not digest:
+            self._busy = False
+            return
+
+        chat_id, parse_mode = key
+        try:
+            for text in self._format_digest(digest["messages"], parse_mode):
+                self._deliver(_Message(text, chat_id, parse_mode, PRIORITY_LOW))
+        finally:
+            self._busy = False
+
+    def _format_digest(self, messages, parse_mode):
+        """Monta o texto do resumo (uma ou mais mensagens)"""
+        if len(messages) == 1:
+            return [messages[0]]
+
+        self.merged += len(messages)
+        header = _DIGEST_HEADERS.get(parse_mode, "📬 {n} notificações")
+        parts = []
+        current = []
+        size = 0
+        for text in messages:
+            added = len(text) + len(_DIGEST_SEPARATOR)
+            if current and size + added > TELEGRAM_MAX_LENGTH - 100:
+                parts.append(current)
+                current, size = [], 0
+            current.append(text[:TELEGRAM_MAX_LENGTH - 100])
+            size += added
+        parts.append(current)
+        return [header.format(n=len(part)) + "\n\n" + _DIGEST_SEPARATOR.join(part) for part in parts]
+
+    def _chat_bucket(self, chat_id):
+        """Limitador do chat (grupos e canais têm IDs negativos)"""
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            rate = self.group_rate if chat_id.startswith("-") else self.chat_rate
+            bucket = TokenBucket(rate, burst=1, name=f"{self.name} chat {chat_id}")
+            self._chat_buckets[chat_id] = bucket
+        return bucket
+
+    def _deliver(self, message):
+        """Envia respeitando o limite do chat, com novas tentativas"""
+        while True:
+            self._chat_bucket(message.chat_id).acquire()
+            try:
+                result = self.send(message.text, message.chat_id, message.parse_mode)
+            except Exception as e:
+                logger.error(f"Erro ao enviar mensagem para {self.name}: {str(e)}")
+                result = None
+
+            if result:
+                self.sent += 1
+                return True
+
+            message.attempts += 1
+            if message.attempts > self.retries:
+                self.failed += 1
+                logger.error(f"Mensagem para {self.name} descartada após {message.attempts} tentativas")
+                return False
+
+def register_shutdown(notifier, timeout=5.0):
+    """Tenta enviar as mensagens pendentes ao encerrar o processo"""
+    atexit.register(notifier.stop, timeout)
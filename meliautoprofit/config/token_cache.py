@@ -0,0 +1,215 @@
+"""
+Cache de tokens de acesso com controle de expiração
+"""
+import os
+import json
+import time
+import logging
+import threading
+
+# Configuração de logging
+logger = logging.getLogger(__name__)
+
+class TokenCache:
+    """Mantém um token de acesso válido e o renova antes de expirar
+
+    O `fetcher` é chamado sem argumentos e deve retornar um dicionário com
+    `access_token` e `expires_at` (timestamp) ou None em caso de falha.
+    Campos extras (ex.: `refresh_token`) são preservados em `data`.
+    """
+
+    def __init__(self, fetcher, refresh_margin=300, persist_path=None, name="token"):
+        self.fetcher = fetcher
+        self.refresh_margin = refresh_margin
+        self.persist_path = persist_path
+        self.name = name
+        self.data = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def access_token(self):
+        """Token atual (pode estar expirado)"""
+        return self.data.get("access_token")
+
+    @property
+    def expires_at(self):
+        """Momento de expiração do token atual"""
+        return self.data.get("expires_at", 0)
+
+    def is_valid(self, now=None):
+        """Indica se há um token ainda não expirado"""
+        now = time.time() if now is None else now
+        return bool(self.access_token) and now < self.expires_at
+
+    def needs_refresh(self, now=None):
+        """Indica se o token entrou na janela de renovação antecipada"""
+        now = time.time() if now is None else now
+        return not self.is_valid(now) or now >= self.expires_at - self.refresh_margin
+
+    def get_token(self):
+        """Retorna um token válido, renovando se necessário
+
+        Apenas uma thread faz a renovação; as demais aguardam o resultado
+        ou, se o token atual ainda for válido, seguem usando-o.
+        """
+        if not self.needs_refresh():
+            return self.access_token
+
+        if self.is_valid():
+            # Renovação antecipada: quem não conseguir o lock usa o token atual
+            if not self._lock.acquire(blocking=False):
+                return self.access_token
+        else:
+            self._lock.acquire()
+
+        try:
+            if self.needs_refresh():
+                self._refresh()
+            return self.access_token if self.is_valid() else None
+        finally:
+            self._lock.release()
+
+    def force_refresh(self):
+        """Renova o token imediatamente"""
+        with self._lock:
+            self._refresh()
+            return self.access_token if self.is_valid() else None
+
+    def refresh_if_stale(self, stale_token):
+        """Renova apenas se `stale_token` ainda for o token atual
+
+        Evita que vários chamadores que receberam 401 com o mesmo token
+        disparem uma renovação cada.
+        """
+        with self._lock:
+            if not stale_token or self.access_token == stale_token or not self.is_valid():
+                self._refresh()
+            return self.access_token if self.is_valid() else None
+
+    def invalidate(self):
+        """Descarta o token atual (ex.: após resposta 401)"""
+        with self._lock:
+            self.data = {}
+            self._remove_persisted()
+
+    def set_token(self, data):
+        """Armazena um token obtido externamente"""
+        with self._lock:
+            self._store(data)
+
+    def _refresh(self):
+        """Busca um novo token pelo fetcher (chamado com o lock adquirido)"""
+        logger.debug(f"Renovando {self.name}")
+        try:
+            data = self.fetcher()
+        except Exception as e:
+            logger.error(f"Erro ao renovar {self.name}: {str(e)}")
+            data = None
+
+        if data and data.get("access_token"):
+            self._store(data)
+        else:
+            logger.warning(f"Não foi possível renovar {self.name}")
+
+    def _store(self, data):
+        """Atualiza o token em memória e no disco"""
+        self.data = dict(data)
+        self._save()
+
+    def _load(self):
+        """Carrega um token persistido ainda válido"""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+
+        try:
+            with open(self.persist_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cache de {self.name} ilegível em {self.persist_path}: {str(e)}")
+            return
+
+        if data.get("access_token") and time.time() < data.get("expires_at", 0):
+            self.data = data
+            logger.debug(f"{self.name} reaproveitado de {self.persist_path}")
+
+    def _save(self):
+        """Grava o token de forma atômica, se houver arquivo configurado"""
+        if not self.persist_path:
+            return
+
+        tmp_path = f"{self.persist_path}.tmp"
+        try:
+            diretorio = os.path.dirname(self.persist_path)
+            if diretorio:
+                os.makedirs(diretorio, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.data, f)
+            os.replace(tmp_path, self.persist_path)
+        except OSError as e:
+            logger.warning(f"Não foi possível persistir {self.name}: {str(e)}")
+
+    def _remove_persisted(self):
+        """Remove o arquivo de persistência"""
+        if self.persist_path and os.path.exists(self.persist_path):
+            try:
+                os.remove(self.persist_path)
+            except OSError as e:
+                logger.warning(f"Não foi possível remover {self.persist_path}: {str(e)}")
+
+class AutoRefreshTokenCache(TokenCache):
+    """TokenCache que renova o token em segundo plano antes de expirar
+
+    A renovação é agendada para `expires_at - 2 * refresh_margin` (no
+    mínimo `retry_interval` ou metade da vida restante do token), de modo
+    que os chamadores só renovam de forma síncrona se a renovação em
+    segundo plano falhar.
+    """
+
+    def __init__(self, fetcher, refresh_margin=300, persist_path=None, name="token", retry_interval=30):
+        self.retry_interval = retry_interval
+        self._timer = None
+        self._timer_lock = threading.Lock()
+        super().__init__(fetcher, refresh_margin=refresh_margin, persist_path=persist_path, name=name)
+        if self.is_valid():
+            self._schedule()
+
+    def _store(self, data):
+        """Armazena o token e agenda a próxima renovação"""
+        super()._store(data)
+        self._schedule()
+
+    def _refresh(self):
+        """Renova e, em caso de falha, agenda nova tentativa"""
+        super()._refresh()
+        if not self.is_valid() or self.needs_refresh():
+            self._schedule(self.retry_interval)
+
+    def _schedule(self, delay=None):
+        """Agenda a renovação em segundo plano"""
+        if delay is None:
+            restante = self.expires_at - time.time()
+            # Com token de vida curta (ou margem grande) a espera seria zero e as renovações
+            # entrariam em laço; o piso é o intervalo de nova tentativa ou metade da vida restante
+            delay = max(restante - 2 * self.refresh_margin, min(self.retry_interval, restante / 2), 0)
+
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(delay, self._background_refresh)
+            self._timer.daemon = True
+            self._timer.start()
+        logger.debug(f"Renovação de {self.name} agendada em {delay:.0f}s")
+
+    def _background_refresh(self):
+        """Executado pelo timer"""
+        with self._lock:
+            self._refresh()
+
+    def stop(self):
+        """Cancela a renovação agendada"""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
@@ -0,0 +1,509 @@
+#!/usr/bin/env python
+"""
+Servidores locais que imitam as APIs externas do MeliAutoProfit
+
+Sobe um servidor HTTP por provedor (Mercado Livre, CJ Dropshipping,
+Spocket, Mercado Pago e Telegram), cada um em sua porta, para que o
+limitador e o circuit breaker por host tratem cada API separadamente.
+Latência, taxa de erros, respostas 429 e tamanho do catálogo são
+configuráveis pela linha de comando ou pelas variáveis SIM_*.
+
+Uso:
+    python simulador_apis.py --latencia 80 --erro 0.02 --taxa-429 0.01
+
+Depois aponte a aplicação para o simulador com as variáveis de URL
+exibidas na inicialização (ML_API_BASE_URL, CJ_API_BASE_URL, ...).
+"""
+import os
+import json
+import time
+import random
+import asyncio
+import hashlib
+import argparse
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+# Vocabulário usado para gerar o catálogo
+ADJETIVOS = ["Portátil", "Sem Fio", "Inteligente", "Compacto", "Profissional", "Premium", "Digital", "Recarregável"]
+PRODUTOS = [
+    "Fone de Ouvido", "Caixa de Som", "Smartwatch", "Carregador", "Luminária", "Mouse", "Teclado",
+    "Câmera", "Garrafa Térmica", "Mochila", "Suporte Celular", "Ring Light", "Power Bank", "Relógio"
+]
+CATEGORIAS = ["Eletrônicos", "Acessórios", "Casa", "Esporte", "Informática"]
+
+class SimulacaoConfig:
+    """Parâmetros de injeção de latência e falhas"""
+
+    def __init__(self, latencia_ms=50, variacao_ms=20, taxa_erro=0.0, taxa_429=0.0,
+                 retry_after=1, tamanho_catalogo=1000, seed=42):
+        self.latencia_ms = latencia_ms
+        self.variacao_ms = variacao_ms
+        self.taxa_erro = taxa_erro
+        self.taxa_429 = taxa_429
+        self.retry_after = retry_after
+        self.tamanho_catalogo = tamanho_catalogo
+        self.seed = seed
+        self.random = random.Random(seed)
+
+    @classmethod
+    def from_env(cls):
+        """Cria a configuração a partir das variáveis SIM_*"""
+        return cls(
+            latencia_ms=float(os.getenv("SIM_LATENCY_MS", "50")),
+            variacao_ms=float(os.getenv("SIM_LATENCY_JITTER_MS", "20")),
+            taxa_erro=float(os.getenv("SIM_ERROR_RATE", "0")),
+            taxa_429=float(os.getenv("SIM_429_RATE", "0")),
+            retry_after=int(os.getenv("SIM_RETRY_AFTER", "1")),
+            tamanho_catalogo=int(os.getenv("SIM_CATALOG_SIZE", "1000")),
+            seed=int(os.getenv("SIM_SEED", "42")),
+        )
+
+    def sortear_latencia(self):
+        """Latência da próxima resposta, em segundos"""
+        return max(self.random.gauss(self.latencia_ms, self.variacao_ms), 0.0) / 1000
+
+class Catalogo:
+    """Catálogo determinístico gerado a partir da seed
+
+    Produto, item e pedido de mesmo índice são sempre iguais entre
+    execuções com a mesma seed, então testes de carga são repetíveis.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.nomes = [self._nome(i) for i in range(config.tamanho_catalogo)]
+        self.itens_criados = {}
+        self.inicio = datetime(2025, 1, 1)
+
+    def _random(self, indice):
+        """Gerador próprio de cada índice"""
+        return random.Random(self.config.seed * 1000003 + indice)
+
+    def _nome(self, indice):
+        """Nome do produto de um índice"""
+        rnd = self._random(indice)
+        return f"{rnd.choice(PRODUTOS)} {rnd.choice(ADJETIVOS)} {indice}"
+
+    def produto(self, indice, prefixo):
+        """Produto de fornecedor no formato consumido pela aplicação"""
+        rnd = self._random(indice)
+        preco = round(rnd.uniform(15, 400), 2)
+        estoque = rnd.randint(0, 500)
+        return {
+            "id": f"{prefixo}-{indice}",
+            "name": self.nomes[indice],
+            "title": self.nomes[indice],
+            "description": f"Descrição de {self.nomes[indice]}",
+            "price": preco,
+            "stock": estoque,
+            "inventory_quantity": estoque,
+            "rating": round(rnd.uniform(3, 5), 1),
+            "category": rnd.choice(CATEGORIAS),
+            "sku": f"SKU-{prefixo}-{indice}",
+            "images": [f"https://imagens.simulador.local/{prefixo}/{indice}_{n}.jpg" for n in range(2)],
+        }
+
+    def indice(self, identificador):
+        """Extrai o índice numérico de um ID (ou None se fora do catálogo)"""
+        digitos = "".join(c for c in str(identificador).rsplit("-", 1)[-1] if c.isdigit())
+        if not digitos:
+            return None
+        indice = int(digitos)
+        return indice if indice < self.config.tamanho_catalogo else None
+
+    def buscar(self, palavra_chave, pagina, por_pagina, prefixo):
+        """Busca por palavras do nome; sem correspondência, devolve uma amostra"""
+        termos = [t.lower() for t in (palavra_chave or "").split() if len(t) > 2]
+        indices = [i for i, nome in enumerate(self.nomes) if any(t in nome.lower() for t in termos)]
+        if not indices:
+            rnd = random.Random(palavra_chave)
+            indices = sorted(rnd.sample(range(len(self.nomes)), min(len(self.nomes), 100)))
+        inicio = (max(pagina, 1) - 1) * por_pagina
+        return [self.produto(i, prefixo) for i in indices[inicio:inicio + por_pagina]], len(indices)
+
+    def item_ml(self, item_id):
+        """Item do Mercado Livre (criado pela aplicação ou do catálogo)"""
+        if item_id in self.itens_criados:
+            return self.itens_criados[item_id]
+        indice = self.indice(item_id)
+        if indice is None:
+            return None
+        produto = self.produto(indice, "ML")
+        return {
+            "id": item_id,
+            "title": produto["name"],
+            "price": round(produto["price"] * 1.3, 2),
+            "currency_id": "BRL",
+            "available_quantity": produto["stock"],
+            "status": "active",
+            "category_id": "MLB1051",
+            "last_updated": self.inicio.isoformat(),
+        }
+
+    def indice_pedido_desde(self, data):
+        """Primeiro pedido criado a partir de uma data ISO (None se inválida)"""
+        try:
+            desde = datetime.fromisoformat(data.replace("Z", "+00:00")).replace(tzinfo=None)
+        except ValueError:
+            return None
+        return max(-(-(desde - self.inicio) // timedelta(minutes=30)), 0)
+
+    def pedido(self, indice):
+        """Pedido do Mercado Livre; um a cada 30 minutos a partir do início"""
+        rnd = self._random(indice + 7)
+        produto = self.produto(rnd.randrange(self.config.tamanho_catalogo), "ML")
+        quantidade = rnd.randint(1, 3)
+        criado = self.inicio + timedelta(minutes=30 * indice)
+        return {
+            "id": 2000000000 + indice,
+            "status": "paid",
+            "date_created": criado.isoformat(),
+            "last_updated": (criado + timedelta(hours=rnd.randint(0, 48))).isoformat(),
+            "order_items": [{
+                "item": {"id": f"MLB{indice}", "title": produto["name"]},
+                "quantity": quantidade,
+                "unit_price": produto["price"],
+            }],
+            "total_amount": round(produto["price"] * quantidade, 2),
+            "shipping": {"id": 4000000000 + indice},
+            "buyer": {"id": 100000 + indice, "nickname": f"COMPRADOR{indice}"},
+        }
+
+def _responder_json(request, dados, status_code=200):
+    """Responde com ETag e atende If-None-Match com 304"""
+    corpo = json.dumps(dados, ensure_ascii=False)
+    etag = '"' + hashlib.md5(corpo.encode()).hexdigest() + '"'
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(corpo, status_code=status_code, media_type="application/json", headers={"ETag": etag})
+
+def _nao_encontrado(mensagem):
+    """Erro 404 no formato do Mercado Livre"""
+    return JSONResponse({"message": mensagem, "error": "not_found", "status": 404}, status_code=404)
+
+def _criar_app(nome, config):
+    """Cria a aplicação com o middleware de latência e falhas"""
+    app = FastAPI(title=f"Simulador {nome}")
+    app.state.config = config
+    app.state.requisicoes = 0
+
+    @app.middleware("http")
+    async def injetar_falhas(request, call_next):
+        app.state.requisicoes += 1
+        await asyncio.sleep(config.sortear_latencia())
+        sorteio = config.random.random()
+        if sorteio < config.taxa_429:
+            return JSONResponse(
+                {"message": "too many requests", "status": 429},
+                status_code=429,
+                headers={"Retry-After": str(config.retry_after)}
+            )
+        if sorteio < config.taxa_429 + config.taxa_erro:
+            return JSONResponse({"message": "internal error", "status": 503}, status_code=503)
+        return await call_next(request)
+
+    @app.get("/_simulador")
+    async def estado():
+        return {"provedor": nome, "requisicoes": app.state.requisicoes}
+
+    return app
+
+def criar_app_mercado_livre(config, catalogo):
+    """Endpoints do Mercado Livre usados por config/ e app/api/"""
+    app = _criar_app("Mercado Livre", config)
+    max_offset = 10000
+    total_pedidos = config.tamanho_catalogo
+
+    @app.post("/oauth/token")
+    async def token():
+        return {
+            "access_token": f"APP_USR-SIM-{int(time.time())}",
+            "refresh_token": "TG-SIM-REFRESH",
+            "token_type": "bearer",
+            "expires_in": 21600,
+        }
+
+    @app.get("/trends/MLB")
+    async def tendencias():
+        rnd = random.Random(config.seed)
+        return [
+            {"keyword": f"{rnd.choice(PRODUTOS).lower()} {rnd.choice(ADJETIVOS).lower()}",
+             "url": "https://lista.mercadolivre.com.br/"}
+            for _ in range(50)
+        ]
+
+    @app.get("/items")
+    async def multiget(ids: str = ""):
+        resultado = []
+        for item_id in [i for i in ids.split(",") if i][:20]:
+            item = catalogo.item_ml(item_id)
+            if item is None:
+                resultado.append({"code": 404, "body": {"id": item_id, "error": "not_found"}})
+            else:
+                resultado.append({"code": 200, "body": item})
+        return resultado
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str, request: Request):
+        dados = catalogo.item_ml(item_id)
+        if dados is None:
+            return _nao_encontrado(f"Item with id {item_id} not found")
+        return _responder_json(request, dados)
+
+    @app.post("/items")
+    async def criar_item(request: Request):
+        dados = await request.json()
+        item_id = f"MLB{9000000000 + len(catalogo.itens_criados)}"
+        dados.update({"id": item_id, "status": "active", "last_updated": datetime.now().isoformat()})
+        catalogo.itens_criados[item_id] = dados
+        return JSONResponse(dados, status_code=201)
+
+    @app.put("/items/{item_id}")
+    async def atualizar_item(item_id: str, request: Request):
+        atual = catalogo.item_ml(item_id)
+        if atual is None:
+            return _nao_encontrado(f"Item with id {item_id} not found")
+        atual = dict(atual)
+        atual.update(await request.json())
+        atual["last_updated"] = datetime.now().isoformat()
+        catalogo.itens_criados[item_id] = atual
+        return atual
+
+    @app.get("/orders/search")
+    async def buscar_pedidos(request: Request, limit: int = 50, offset: int = 0):
+        if offset > max_offset:
+            return JSONResponse(
+                {"message": f"offset must be lower than {max_offset}", "error": "bad_request", "status": 400},
+                status_code=400
+            )
+        limit = min(limit, 51)
+        criado_desde = request.query_params.get("order.date_created.from")
+        atualizado_desde = request.query_params.get("order.date_last_updated.from")
+
+        # Pedidos são criados em ordem: o filtro por criação vira um índice inicial
+        inicio = 0
+        if criado_desde:
+            inicio = catalogo.indice_pedido_desde(criado_desde)
+            if inicio is None:
+                return JSONResponse({"message": "invalid date", "error": "bad_request", "status": 400}, status_code=400)
+        if not atualizado_desde:
+            indices = range(inicio + offset, min(inicio + offset + limit, total_pedidos))
+            return {
+                "results": [catalogo.pedido(i) for i in indices],
+                "paging": {"total": max(total_pedidos - inicio, 0), "offset": offset, "limit": limit},
+            }
+
+        pedidos = [
+            p for p in (catalogo.pedido(i) for i in range(inicio, total_pedidos))
+            if p["last_updated"] >= atualizado_desde
+        ]
+        return {
+            "results": pedidos[offset:offset + limit],
+            "paging": {"total": len(pedidos), "offset": offset, "limit": limit},
+        }
+
+    @app.get("/orders/{order_id}")
+    async def pedido(order_id: int):
+        indice = order_id - 2000000000
+        if not 0 <= indice < total_pedidos:
+            return _nao_encontrado(f"Order {order_id} not found")
+        return catalogo.pedido(indice)
+
+    @app.get("/shipments/{shipping_id}")
+    async def entrega(shipping_id: int, request: Request):
+        indice = shipping_id - 4000000000
+        if not 0 <= indice < total_pedidos:
+            return _nao_encontrado(f"Shipment {shipping_id} not found")
+        status = random.Random(shipping_id).choice(["ready_to_ship", "shipped", "delivered"])
+        return _responder_json(request, {"id": shipping_id, "status": status, "order_id": 2000000000 + indice})
+
+    return app
+
+def criar_app_cj(config, catalogo):
+    """Endpoints do CJ Dropshipping"""
+    app = _criar_app("CJ Dropshipping", config)
+
+    @app.post("/api/auth/token")
+    async def token():
+        expira = datetime.utcnow() + timedelta(days=15)
+        return {
+            "code": 200,
+            "data": {
+                "accessToken": f"CJ-SIM-{int(time.time())}",
+                "refreshToken": "CJ-SIM-REFRESH",
+                "accessTokenExpiryDate": expira.isoformat() + "Z",
+            },
+        }
+
+    @app.get("/api/product/list")
+    async def produtos(productNameEn: str = "", pageNum: int = 1, pageSize: int = 20):
+        lista, total = catalogo.buscar(productNameEn, pageNum, pageSize, "CJ")
+        return {"code": 200, "data": {"list": lista, "total": total, "pageNum": pageNum, "pageSize": pageSize}}
+
+    @app.get("/api/product/query")
+    async def produto(pid: str = ""):
+        indice = catalogo.indice(pid)
+        if indice is None:
+            return {"code": 404, "message": "Product not found", "data": None}
+        return {"code": 200, "data": catalogo.produto(indice, "CJ")}
+
+    @app.post("/api/order/create")
+    async def criar_pedido(request: Request):
+        dados = await request.json()
+        return {"code": 200, "data": {"orderId": f"CJ{int(time.time() * 1000)}", **dados}}
+
+    return app
+
+def criar_app_spocket(config, catalogo):
+    """Endpoints do Spocket (prefixo /v1 como na API real)"""
+    app = _criar_app("Spocket", config)
+
+    @app.get("/v1/products/search")
+    async def buscar(query: str = "", page: int = 1, per_page: int = 20):
+        lista, total = catalogo.buscar(query, page, per_page, "SP")
+        return {"products": lista, "total": total, "page": page}
+
+    @app.get("/v1/products/{product_id}")
+    async def produto(product_id: str, request: Request):
+        indice = catalogo.indice(product_id)
+        if indice is None:
+            return JSONResponse({"error": "Product not found"}, status_code=404)
+        return _responder_json(request, catalogo.produto(indice, "SP"))
+
+    @app.post("/v1/orders")
+    async def criar_pedido(request: Request):
+        dados = await request.json()
+        return JSONResponse({"id": f"SP{int(time.time() * 1000)}", "status": "pending", **dados}, status_code=201)
+
+    return app
+
+def criar_app_mercado_pago(config, catalogo):
+    """Endpoints do Mercado Pago (prefixo /v1 como na API real)"""
+    app = _criar_app("Mercado Pago", config)
+
+    def pagamento(payment_id):
+        rnd = random.Random(payment_id)
+        return {
+            "id": payment_id,
+            "status": rnd.choice(["approved", "approved", "pending"]),
+            "transaction_amount": round(rnd.uniform(20, 500), 2),
+            "currency_id": "BRL",
+            "date_created": catalogo.inicio.isoformat(),
+        }
+
+    @app.get("/v1/payments/search")
+    async def buscar(limit: int = 50, offset: int = 0):
+        return {
+            "results": [pagamento(10000 + i) for i in range(offset, offset + limit)],
+            "paging": {"total": config.tamanho_catalogo, "limit": limit, "offset": offset},
+        }
+
+    @app.get("/v1/payments/{payment_id}")
+    async def obter(payment_id: int):
+        return pagamento(payment_id)
+
+    @app.post("/v1/payments/{payment_id}/refunds")
+    async def reembolsar(payment_id: int):
+        return JSONResponse({"id": int(time.time()), "payment_id": payment_id, "status": "approved"}, status_code=201)
+
+    @app.post("/v1/transfers")
+    async def transferir(request: Request):
+        dados = await request.json()
+        return JSONResponse({"id": int(time.time()), "status": "approved", **dados}, status_code=201)
+
+    return app
+
+def criar_app_telegram(config, catalogo):
+    """Endpoints do Bot API do Telegram"""
+    app = _criar_app("Telegram", config)
+    app.state.mensagens = 0
+
+    @app.get("/{bot}/getMe")
+    async def get_me(bot: str):
+        return {"ok": True, "result": {"id": 1, "is_bot": True, "username": "meliautoprofit_sim_bot"}}
+
+    @app.post("/{bot}/sendMessage")
+    async def send_message(bot: str, request: Request):
+        dados = await request.json()
+        app.state.mensagens += 1
+        return {
+            "ok": True,
+            "result": {
+                "message_id": app.state.mensagens,
+                "chat": {"id": dados.get("chat_id")},
+                "date": int(time.time()),
+                "text": dados.get("text"),
+            },
+        }
+
+    return app
+
+# Provedor: (fábrica, variável de ambiente da URL, sufixo da URL base)
+PROVEDORES = {
+    "ml": (criar_app_mercado_livre, "ML_API_BASE_URL", ""),
+    "cj": (criar_app_cj, "CJ_API_BASE_URL", ""),
+    "spocket": (criar_app_spocket, "SPOCKET_API_BASE_URL", "/v1"),
+    "mp": (criar_app_mercado_pago, "MP_API_BASE_URL", "/v1"),
+    "telegram": (criar_app_telegram, "TELEGRAM_API_URL", ""),
+}
+
+def criar_apps(config, provedores=None):
+    """Cria as aplicações dos provedores pedidos, com um catálogo comum"""
+    catalogo = Catalogo(config)
+    return {
+        nome: PROVEDORES[nome][0](config, catalogo)
+        for nome in (provedores or PROVEDORES)
+    }
+
+async def _servir(apps, host, porta_inicial):
+    """Sobe um servidor uvicorn por provedor no mesmo event loop"""
+    import uvicorn
+
+    servidores = []
+    for deslocamento, (nome, app) in enumerate(apps.items()):
+        porta = porta_inicial + deslocamento
+        _, variavel, sufixo = PROVEDORES[nome]
+        print(f"{variavel}=http://{host}:{porta}{sufixo}")
+        servidores.append(uvicorn.Server(uvicorn.Config(app, host=host, port=porta, log_level="warning")))
+    await asyncio.gather(*(servidor.serve() for servidor in servidores))
+
+def main():
+    """Função principal do simulador"""
+    padrao = SimulacaoConfig.from_env()
+    parser = argparse.ArgumentParser(description="Simula localmente as APIs externas para testes de carga")
+    parser.add_argument("--host", default="127.0.0.1", help="Endereço de escuta (padrão: 127.0.0.1)")
+    parser.add_argument("--porta", type=int, default=int(os.getenv("SIM_PORT", "8100")),
+                        help="Porta do primeiro provedor; os demais usam as seguintes (padrão: 8100)")
+    parser.add_argument("--provedores", nargs="+", choices=list(PROVEDORES), default=list(PROVEDORES),
+                        help="Provedores a simular (padrão: todos)")
+    parser.add_argument("--latencia", type=float, default=padrao.latencia_ms, help="Latência média em ms")
+    parser.add_argument("--variacao", type=float, default=padrao.variacao_ms, help="Desvio da latência em ms")
+    parser.add_argument("--erro", type=float, default=padrao.taxa_erro, help="Fração de respostas 503")
+    parser.add_argument("--taxa-429", type=float, default=padrao.taxa_429, help="Fração de respostas 429")
+    parser.add_argument("--retry-after", type=int, default=padrao.retry_after, help="Retry-After dos 429 (s)")
+    parser.add_argument("--catalogo", type=int, default=padrao.tamanho_catalogo, help="Produtos no catálogo")
+    parser.add_argument("--seed", type=int, default=padrao.seed, help="Seed do catálogo e das falhas")
+
+    args = parser.parse_args()
+
+    config = SimulacaoConfig(
+        latencia_ms=args.latencia,
+        variacao_ms=args.variacao,
+        taxa_erro=args.erro,
+        taxa_429=args.taxa_429,
+        retry_after=args.retry_after,
+        tamanho_catalogo=args.catalogo,
+        seed=args.seed,
+    )
+
+    print("Simulador iniciado. Configure a aplicação com:")
+    try:
+        asyncio.run(_servir(criar_apps(config, args.provedores), args.host, args.porta))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
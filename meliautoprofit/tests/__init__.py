@@ -1,3 +1,3 @@
-"""
-Pacote de testes para MeliAutoProfit
+"""
+Pacote de testes para MeliAutoProfit
 """ 
\ No newline at end of file
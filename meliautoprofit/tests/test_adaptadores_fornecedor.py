@@ -0,0 +1,121 @@
+"""
+Testes para os adaptadores e o registro de fornecedores
+"""
+import sys
+import pytest
+from unittest.mock import patch
+from fastapi import HTTPException
+
+from app.api.adaptadores_fornecedor import (
+    SupplierAdapter, SupplierCandidate, get_adapter, register_adapter, registered_types, _adapters
+)
+from app.api.fornecedor import FornecedorAPI, FornecedorType, search_cache
+
+class FornecedorTeste(SupplierAdapter):
+    """Fornecedor fictício só com busca"""
+
+    tipo = "teste"
+    campos = dict(SupplierAdapter.campos, name=("titulo",), price=("valor",))
+
+    def search(self, keyword, page=1, limit=20):
+        return [{"id": 1, "titulo": keyword, "valor": "19.90"}]
+
+class TestAdaptadoresFornecedor:
+    """Testes para os adaptadores e o registro de fornecedores"""
+
+    @pytest.fixture
+    def fornecedor_teste(self):
+        """Registra o fornecedor fictício durante o teste"""
+        search_cache.clear()
+        register_adapter(FornecedorTeste())
+        yield
+        _adapters.pop("teste", None)
+        search_cache.clear()
+
+    def test_fornecedores_nativos_registrados(self):
+        """Testa o registro dos fornecedores nativos e suas capacidades"""
+        assert registered_types()[:2] == [FornecedorType.CJ_DROPSHIPPING.value, FornecedorType.SPOCKET.value]
+        assert get_adapter(FornecedorType.SPOCKET).supports_detail
+        assert get_adapter("cj_dropshipping").order_params == ("product_id", "quantity", "shipping_address")
+
+    def test_normalizar_cj(self):
+        """Testa a conversão dos campos da CJ"""
+        candidato = get_adapter("cj_dropshipping").normalize({
+            "pid": "CJ123", "productNameEn": "Phone Case", "sellPrice": "3.50-5.00",
+            "productImage": "https://cj.com/1.jpg", "productSku": "CJSKU", "categoryName": "Cases",
+        })
+
+        assert candidato.id == "CJ123"
+        assert candidato.fornecedor == "cj_dropshipping"
+        assert candidato.name == "Phone Case"
+        assert candidato.price == 3.5
+        assert candidato.images == ("https://cj.com/1.jpg",)
+        assert candidato.stock is None
+        assert candidato.get("stock", 0) == 0
+
+    def test_normalizar_spocket(self):
+        """Testa a conversão dos campos do Spocket"""
+        candidato = get_adapter("spocket").normalize({
+            "id": 7, "title": "Garrafa Térmica", "price": 45, "inventory_quantity": 12,
+            "images": ["https://spocket.co/7.jpg"],
+        })
+
+        assert candidato["id"] == "7"
+        assert candidato["name"] == "Garrafa Térmica"
+        assert candidato["stock"] == 12
+        assert "rating" not in candidato
+
+    def test_candidato_compacto(self):
+        """Testa que o candidato não tem __dict__ e ocupa menos que o dicionário"""
+        dados = {"id": "SP-1", "name": "Fone", "price": 10.0, "stock": 5, "rating": 4.5,
+                 "category": "Áudio", "sku": "SKU-1", "images": ["a.jpg"]}
+        candidato = SupplierCandidate.from_dict(dados, "spocket")
+
+        assert not hasattr(candidato, "__dict__")
+        assert sys.getsizeof(candidato) < sys.getsizeof(dados)
+
+    def test_merge_com_detalhes(self):
+        """Testa que os detalhes completam só os campos informados"""
+        busca = SupplierCandidate("SP-1", "spocket", name="Fone", price=10.0)
+        detalhes = SupplierCandidate("SP-1", "spocket", stock=8, rating=4.0)
+
+        completo = busca.merge(detalhes)
+
+        assert (completo.name, completo.price, completo.stock, completo.rating) == ("Fone", 10.0, 8, 4.0)
+        assert busca.stock is None
+
+    def test_contrato_do_adaptador(self):
+        """Testa que a busca é obrigatória e que capacidades declaradas exigem implementação"""
+        class SemBusca(SupplierAdapter):
+            tipo = "sem_busca"
+
+        with pytest.raises(TypeError):
+            SemBusca()
+
+        with pytest.raises(TypeError):
+            class DetalheSemImplementacao(FornecedorTeste):
+                supports_detail = True
+
+    def test_novo_fornecedor_sem_alterar_api(self, fornecedor_teste):
+        """Testa um fornecedor registrado fora do código da API"""
+        api = FornecedorAPI()
+        api.set_fornecedor("teste")
+
+        candidatos = api.search_candidates("caneca")
+
+        assert candidatos[0].name == "caneca"
+        assert candidatos[0].price == 19.9
+        with pytest.raises(HTTPException) as erro:
+            api.get_product_details("1")
+        assert erro.value.status_code == 400
+
+    def test_pedido_valida_parametros_do_adaptador(self):
+        """Testa a validação dos parâmetros obrigatórios declarados pelo adaptador"""
+        api = FornecedorAPI(FornecedorType.SPOCKET)
+
+        with patch("app.api.adaptadores_fornecedor.spocket_create_order") as mock_pedido:
+            with pytest.raises(HTTPException):
+                api.create_order(product_id="1", quantity=1, shipping_address={})
+            api.create_order(variant_id="V1", quantity=2, shipping_address={"city": "SP"})
+
+        mock_pedido.assert_called_once_with("V1", 2, {"city": "SP"})
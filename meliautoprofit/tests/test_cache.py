@@ -0,0 +1,85 @@
+"""
+Testes para os caches LRU/TTL e o cache HTTP condicional
+"""
+from unittest.mock import MagicMock
+
+from config.cache import TTLCache, HTTPCache
+
+class TestTTLCache:
+    """Testes para o cache LRU com TTL"""
+
+    def test_descarta_menos_usado(self):
+        """Testa o limite de entradas com política LRU"""
+        cache = TTLCache("teste_lru", max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats()["evictions"] == 1
+
+    def test_expiracao(self):
+        """Testa que entradas expiradas não são servidas como frescas"""
+        cache = TTLCache("teste_ttl")
+        cache.set("a", 1, ttl=-1)
+
+        assert cache.get("a") is None
+        assert cache.get_entry("a") == (1, False)
+
+    def test_camada_em_disco(self, tmp_path):
+        """Testa que a camada em disco sobrevive a uma nova instância"""
+        caminho = str(tmp_path / "cache.sqlite")
+        TTLCache("teste_disco", disk_path=caminho).set("a", {"x": 1})
+
+        cache = TTLCache("teste_disco", disk_path=caminho)
+
+        assert cache.get("a") == {"x": 1}
+        assert cache.stats()["hits"] == 1
+
+class TestHTTPCache:
+    """Testes para o cache HTTP condicional"""
+
+    def _resposta(self, status, texto="", headers=None):
+        """Cria uma resposta mockada"""
+        resposta = MagicMock(status_code=status, text=texto)
+        resposta.headers = headers or {}
+        return resposta
+
+    def test_serve_entrada_fresca_sem_rede(self):
+        """Testa que uma entrada fresca não gera requisição"""
+        cache = HTTPCache("teste_http_fresco", ttl=60)
+        send = MagicMock(return_value=self._resposta(200, '{"id": 1}', {"ETag": '"v1"'}))
+
+        cache.fetch("https://api/items/1", send)
+        resposta = cache.fetch("https://api/items/1", send)
+
+        assert send.call_count == 1
+        assert resposta.from_cache
+        assert resposta.json() == {"id": 1}
+
+    def test_revalida_com_etag(self):
+        """Testa a revalidação com If-None-Match e resposta 304"""
+        cache = HTTPCache("teste_http_304", ttl=0)
+        send = MagicMock(return_value=self._resposta(200, '{"id": 1}', {"ETag": '"v1"'}))
+        cache.fetch("https://api/items/1", send, headers={"Authorization": "Bearer x"})
+
+        send.return_value = self._resposta(304)
+        resposta = cache.fetch("https://api/items/1", send, headers={"Authorization": "Bearer x"})
+
+        _, kwargs = send.call_args
+        assert kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert resposta.revalidated
+        assert resposta.json() == {"id": 1}
+        assert cache.stats()["revalidations"] == 1
+
+    def test_nao_armazena_erros(self):
+        """Testa que respostas de erro não são armazenadas"""
+        cache = HTTPCache("teste_http_erro", ttl=60)
+        send = MagicMock(return_value=self._resposta(500, "erro"))
+
+        cache.fetch("https://api/items/1", send)
+        cache.fetch("https://api/items/1", send)
+
+        assert send.call_count == 2
@@ -0,0 +1,153 @@
+"""
+Testes para o catálogo local de fornecedores
+"""
+import sqlite3
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.api.adaptadores_fornecedor import SupplierCandidate
+from app.services import catalogo as modulo_catalogo
+from app.services.catalogo import CatalogoFornecedores
+
+def produto(indice, nome, preco=50.0, estoque=10):
+    """Produto no formato normalizado"""
+    return {
+        "id": f"SP-{indice}",
+        "name": nome,
+        "description": f"Descrição de {nome}",
+        "price": preco,
+        "stock": estoque,
+        "rating": 4.5,
+        "category": "Eletrônicos",
+        "sku": f"SKU-{indice}",
+        "images": [f"https://exemplo.com/{indice}.jpg"],
+    }
+
+class TestCatalogoFornecedores:
+    """Testes para o catálogo local de fornecedores"""
+
+    @pytest.fixture
+    def catalogo(self):
+        """Catálogo em memória"""
+        catalogo = CatalogoFornecedores(":memory:")
+        yield catalogo
+        catalogo.fechar()
+
+    def test_busca_por_texto(self, catalogo):
+        """Testa a busca no índice de título e descrição"""
+        catalogo.salvar_produtos("spocket", [
+            produto(1, "Fone de Ouvido Bluetooth"),
+            produto(2, "Carregador Portátil"),
+            produto(3, "Caixa de Som Bluetooth JBL"),
+        ])
+
+        resultado = catalogo.buscar("bluetooth jbl")
+
+        # Todos os termos precisam aparecer
+        assert [p.id for p in resultado] == ["SP-3"]
+        assert {p.id for p in catalogo.buscar("bluetooth")} == {"SP-1", "SP-3"}
+        assert isinstance(resultado[0], SupplierCandidate)
+        assert resultado[0].images == ("https://exemplo.com/3.jpg",)
+        assert resultado[0].origem == "catalogo"
+        assert resultado[0].updated_at is not None
+
+    def test_busca_sem_acentos_e_por_fornecedor(self, catalogo):
+        """Testa a busca ignorando acentos e filtrando o fornecedor"""
+        catalogo.salvar_produtos("spocket", [produto(1, "Relógio Inteligente")])
+        catalogo.salvar_produtos("cj_dropshipping", [produto(2, "Relógio de Parede")])
+
+        assert len(catalogo.buscar("relogio")) == 2
+        assert [p.id for p in catalogo.buscar("relogio", "spocket")] == ["SP-1"]
+        assert catalogo.buscar("!!") == []
+
+    def test_atualizacao_incremental(self, catalogo):
+        """Testa que só produtos alterados mudam o updated_at e o índice"""
+        catalogo.salvar_produtos("spocket", [produto(1, "Mouse Gamer"), produto(2, "Teclado")], agora=1000)
+
+        contadores = catalogo.salvar_produtos(
+            "spocket", [produto(1, "Mouse Gamer RGB", preco=60.0), produto(2, "Teclado")], agora=2000
+        )
+
+        assert contadores == {"novos": 0, "alterados": 1, "inalterados": 1}
+        assert catalogo.obter("spocket", "SP-1").price == 60.0
+        assert catalogo.buscar("rgb")[0].id == "SP-1"
+        assert catalogo.obter("spocket", "SP-2").updated_at < catalogo.obter("spocket", "SP-1").updated_at
+
+    def test_termo_comum_nao_casa_o_catalogo(self, catalogo):
+        """Testa que uma palavra comum da keyword não traz produtos que não têm as demais"""
+        catalogo.salvar_produtos("spocket", [
+            produto(i, f"Kit Produto {i} Preto") for i in range(1, 20)
+        ] + [produto(20, "Kit Ferramentas Preto")])
+
+        assert [p.id for p in catalogo.buscar("kit ferramentas")] == ["SP-20"]
+        assert catalogo.buscar("kit chaves") == []
+
+    def test_campos_desconhecidos_ficam_nulos(self, catalogo):
+        """Testa que estoque, avaliação e prazo não informados voltam como None, e não zero"""
+        catalogo.salvar_produtos("spocket", [
+            {"id": "SP-1", "name": "Garrafa Térmica", "price": 30.0},
+            dict(produto(2, "Garrafa Squeeze"), shipping_days=7),
+        ])
+
+        desconhecido = catalogo.obter("spocket", "SP-1")
+        assert desconhecido.stock is None
+        assert desconhecido.rating is None
+        assert desconhecido.shipping_days is None
+        assert catalogo.obter("spocket", "SP-2").shipping_days == 7
+
+        # Passar a informar o estoque é uma alteração
+        contadores = catalogo.salvar_produtos("spocket", [{"id": "SP-1", "name": "Garrafa Térmica", "price": 30.0, "stock": 0}])
+        assert contadores["alterados"] == 1
+        assert catalogo.obter("spocket", "SP-1").stock == 0
+
+    def test_esquema_antigo_e_recriado(self, tmp_path):
+        """Testa que um catálogo com esquema antigo é descartado e recriado"""
+        caminho = str(tmp_path / "catalogo.db")
+        conn = sqlite3.connect(caminho)
+        conn.execute("CREATE TABLE produtos (fornecedor TEXT, product_id TEXT, estoque INTEGER NOT NULL DEFAULT 0)")
+        conn.execute("INSERT INTO produtos VALUES ('spocket', 'SP-1', 0)")
+        conn.commit()
+        conn.close()
+
+        catalogo = CatalogoFornecedores(caminho)
+        try:
+            assert catalogo.obter("spocket", "SP-1") is None
+            catalogo.salvar_produtos("spocket", [{"id": "SP-2", "name": "Mochila", "price": 80.0}])
+            assert catalogo.obter("spocket", "SP-2").stock is None
+        finally:
+            catalogo.fechar()
+
+    def test_remover(self, catalogo):
+        """Testa a remoção do produto e do índice"""
+        catalogo.salvar_produtos("spocket", [produto(1, "Luminária LED")])
+
+        catalogo.remover("spocket", "SP-1")
+
+        assert catalogo.obter("spocket", "SP-1") is None
+        assert catalogo.buscar("luminaria") == []
+
+    def test_sincronizar_com_paginas(self, catalogo):
+        """Testa a sincronização paginada e o intervalo entre sincronizações"""
+        api = MagicMock()
+        api.search_candidates.side_effect = lambda keyword, page, limit: [
+            SupplierCandidate.from_dict(produto(page * 10 + i, f"{keyword} {page} {i}"), "spocket")
+            for i in range(limit if page == 1 else 1)
+        ]
+
+        totais = catalogo.sincronizar(api, "spocket", ["garrafa"], paginas=3, limit=2)
+
+        assert totais["novos"] == 3
+        assert api.search_candidates.call_count == 2
+
+        # Sincronizada recentemente: não consulta de novo
+        catalogo.sincronizar(api, "spocket", ["Garrafa"], paginas=3, limit=2)
+        assert api.search_candidates.call_count == 2
+
+    def test_caminho_invalido_desativa_o_catalogo(self, tmp_path):
+        """Testa que um erro de disco ao abrir o catálogo o desativa em vez de interromper a listagem"""
+        arquivo = tmp_path / "arquivo"
+        arquivo.write_text("")
+
+        with patch.object(modulo_catalogo, "SUPPLIER_CATALOG_PATH", str(arquivo / "catalogo.db")), \
+             patch.object(modulo_catalogo, "_catalogo", None):
+            assert modulo_catalogo.obter_catalogo() is None
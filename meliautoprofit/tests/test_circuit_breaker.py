@@ -0,0 +1,123 @@
+"""
+Testes para o circuit breaker por host
+"""
+import time
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch, MagicMock
+
+from config import circuit_breaker, http_client
+from config.circuit_breaker import CircuitBreaker, CircuitOpenError, CLOSED, OPEN, HALF_OPEN
+
+class TestCircuitBreaker:
+    """Testes para o circuit breaker por host"""
+
+    def _breaker(self, **kwargs):
+        """Cria um circuito com janela pequena"""
+        params = {"window_size": 4, "min_calls": 4, "failure_rate": 0.5, "open_seconds": 30, "half_open_calls": 1}
+        params.update(kwargs)
+        return CircuitBreaker(name="Teste", **params)
+
+    def test_abre_pela_taxa_de_falhas(self):
+        """Testa a abertura quando metade das chamadas falha"""
+        breaker = self._breaker()
+        for sucesso in (True, False, True, False):
+            breaker.before_call()
+            breaker.record(sucesso)
+
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        assert breaker.stats()["rejected"] == 1
+
+    def test_abre_por_chamadas_lentas(self):
+        """Testa a abertura quando as chamadas passam do limite de latência"""
+        breaker = self._breaker(slow_call_seconds=1, slow_call_rate=0.75)
+        for duracao in (2, 2, 2, 0.1):
+            breaker.record(True, duracao)
+
+        assert breaker.state == OPEN
+
+    def test_meio_aberto_fecha_apos_teste_bem_sucedido(self):
+        """Testa a transição aberto -> meio aberto -> fechado"""
+        breaker = self._breaker()
+        for _ in range(4):
+            breaker.record(False)
+        breaker.opened_at = time.monotonic() - 31
+
+        assert breaker.is_available()
+        breaker.before_call()
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record(True)
+        assert breaker.state == CLOSED
+
+    def test_meio_aberto_reabre_apos_falha(self):
+        """Testa que uma falha no teste reabre o circuito"""
+        breaker = self._breaker()
+        for _ in range(4):
+            breaker.record(False)
+        breaker.opened_at = time.monotonic() - 31
+
+        breaker.before_call()
+        breaker.record_response(503)
+
+        assert breaker.state == OPEN
+        assert breaker.stats()["times_opened"] == 2
+
+    def test_transporte_falha_rapido_com_circuito_aberto(self):
+        """Testa que o transporte não faz a requisição com o circuito aberto"""
+        breaker = circuit_breaker.configure("https://circuito.exemplo.com", name="Exemplo", min_calls=1, window_size=1)
+        session = MagicMock()
+        session.request.return_value = MagicMock(status_code=500, headers={})
+
+        with patch.object(http_client, "get_session", return_value=session):
+            http_client.get("https://circuito.exemplo.com/produtos")
+            with pytest.raises(CircuitOpenError):
+                http_client.get("https://circuito.exemplo.com/produtos")
+
+        assert session.request.call_count == 1
+        assert not circuit_breaker.is_available("https://circuito.exemplo.com/produtos")
+        assert breaker.stats()["state"] == OPEN
+
+    def _meio_aberto(self, url):
+        """Circuito do host já liberado para a chamada de teste"""
+        breaker = circuit_breaker.configure(url, name="Exemplo", min_calls=1, window_size=1, half_open_calls=1)
+        breaker.record(False)
+        breaker.opened_at = time.monotonic() - breaker.open_seconds - 1
+        return breaker
+
+    def test_teste_com_excecao_inesperada_reabre(self):
+        """Testa que uma exceção fora do requests na chamada de teste não deixa o circuito preso"""
+        breaker = self._meio_aberto("https://sonda.exemplo.com")
+        session = MagicMock()
+        session.request.side_effect = ValueError("resposta inválida")
+
+        with patch.object(http_client, "get_session", return_value=session):
+            with pytest.raises(ValueError):
+                http_client.get("https://sonda.exemplo.com/produtos")
+
+        assert breaker.state == OPEN
+
+    def test_teste_assincrono_com_excecao_inesperada_reabre(self):
+        """Testa o mesmo para o transporte assíncrono"""
+        breaker = self._meio_aberto("https://sonda-async.exemplo.com")
+
+        def handler(request):
+            raise RuntimeError("falha inesperada")
+
+        async def chamar():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            with patch.object(http_client, "get_async_client", return_value=client):
+                try:
+                    await http_client.arequest("GET", "https://sonda-async.exemplo.com/produtos")
+                finally:
+                    await client.aclose()
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(chamar())
+
+        assert breaker.state == OPEN
@@ -0,0 +1,57 @@
+"""
+Testes para o índice de produtos já anunciados
+"""
+import threading
+
+from app.services.deduplicacao import IndiceAnunciados
+from database.repository import ProdutoRepository
+
+class TestIndiceAnunciados:
+    """Testes para o índice de produtos já anunciados"""
+
+    def test_carrega_do_banco(self, test_db):
+        """Testa o carregamento do índice a partir da tabela de produtos"""
+        indice = IndiceAnunciados.do_banco(ProdutoRepository(test_db))
+
+        assert len(indice) == 2
+        assert indice.contem(1, "CJ123456-TESTE")
+        assert indice.contem(2, "OUTRO", "TESTE-002")
+        # O id do produto só vale dentro do mesmo fornecedor
+        assert not indice.contem(2, "CJ123456-TESTE")
+
+    def test_sku_vazio_nao_e_indexado(self):
+        """Testa que produtos sem SKU não se confundem entre si"""
+        indice = IndiceAnunciados()
+        indice.adicionar(1, "A", "")
+
+        assert not indice.contem(1, "B", "")
+        assert indice.contem(1, "A")
+
+    def test_reservar_e_remover(self):
+        """Testa a reserva atômica e a liberação de um produto"""
+        indice = IndiceAnunciados()
+
+        assert indice.reservar(1, "A", "SKU-A")
+        assert not indice.reservar(1, "A", "SKU-A")
+        assert not indice.reservar(2, "B", "SKU-A")
+
+        indice.remover(1, "A", "SKU-A")
+        assert not indice.contem(1, "A", "SKU-A")
+
+    def test_reserva_concorrente(self):
+        """Testa que só uma de várias threads consegue reservar o mesmo produto"""
+        indice = IndiceAnunciados()
+        sucessos = []
+        barreira = threading.Barrier(8)
+
+        def reservar():
+            barreira.wait()
+            sucessos.append(indice.reservar(1, "A", "SKU-A"))
+
+        threads = [threading.Thread(target=reservar) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sucessos.count(True) == 1
@@ -0,0 +1,136 @@
+"""
+Testes para a API de fornecedores
+"""
+import threading
+import pytest
+from unittest.mock import patch
+
+from app.api.fornecedor import FornecedorAPI, FornecedorType, search_cache, iter_pages
+
+class TestFornecedorAPI:
+    """Testes para a API de fornecedores"""
+
+    @pytest.fixture(autouse=True)
+    def limpar_cache(self):
+        """Começa e termina cada teste com o cache de buscas vazio"""
+        search_cache.clear()
+        yield
+        search_cache.clear()
+
+    @pytest.fixture
+    def busca_spocket(self):
+        """Busca do Spocket simulada"""
+        with patch("app.api.adaptadores_fornecedor.spocket_search") as mock_busca:
+            mock_busca.side_effect = lambda keyword, page, limit: [
+                {"id": f"SP-{page}-{i}", "title": keyword, "price": 10.0} for i in range(limit)
+            ]
+            yield mock_busca
+
+    def test_busca_em_cache(self, busca_spocket):
+        """Testa que a mesma busca normalizada usa o cache"""
+        api = FornecedorAPI(FornecedorType.SPOCKET)
+
+        primeira = api.search_products("Fone  Bluetooth", limit=5)
+        segunda = api.search_products("fone bluetooth", limit=5)
+
+        assert busca_spocket.call_count == 1
+        assert segunda == primeira
+        assert search_cache.stats()["hits"] == 1
+
+    def test_pagina_e_limite_na_chave(self, busca_spocket):
+        """Testa que página e limite diferentes são buscas diferentes"""
+        api = FornecedorAPI(FornecedorType.SPOCKET)
+
+        api.search_products("mouse", page=1, limit=5)
+        api.search_products("mouse", page=2, limit=5)
+        api.search_products("mouse", page=1, limit=10)
+
+        assert busca_spocket.call_count == 3
+
+    def test_forcar_atualizacao(self, busca_spocket):
+        """Testa que force_refresh vai à rede e atualiza o cache"""
+        api = FornecedorAPI(FornecedorType.SPOCKET)
+
+        api.search_products("mouse")
+        api.search_products("mouse", force_refresh=True)
+        api.search_products("mouse")
+
+        assert busca_spocket.call_count == 2
+
+    def test_resultado_vazio_nao_fica_em_cache(self, busca_spocket):
+        """Testa que buscas vazias (ou com erro) são repetidas"""
+        busca_spocket.side_effect = lambda keyword, page, limit: []
+        api = FornecedorAPI(FornecedorType.SPOCKET)
+
+        api.search_products("inexistente")
+        api.search_products("inexistente")
+
+        assert busca_spocket.call_count == 2
+
+    def test_alteracao_nao_afeta_cache(self, busca_spocket):
+        """Testa que alterar o resultado não altera o que está em cache"""
+        api = FornecedorAPI(FornecedorType.SPOCKET)
+
+        api.search_products("mouse")[0]["price"] = 0
+        assert api.search_products("mouse")[0]["price"] == 10.0
+
+    def test_detalhes_em_paralelo(self):
+        """Testa a busca de vários detalhes, com falhas individuais isoladas"""
+        def detalhes(product_id):
+            if product_id == "SP-2":
+                raise RuntimeError("falha")
+            return {"id": product_id, "inventory_quantity": 5}
+
+        api = FornecedorAPI(FornecedorType.SPOCKET)
+        with patch("app.api.adaptadores_fornecedor.spocket_get_product_details", side_effect=detalhes) as mock_detalhes:
+            resultado = api.get_products_details(["SP-1", "SP-2", "SP-3", "SP-1"], max_workers=3)
+
+        assert mock_detalhes.call_count == 3
+        assert resultado["SP-1"]["inventory_quantity"] == 5
+        assert resultado["SP-2"] is None
+        assert set(resultado) == {"SP-1", "SP-2", "SP-3"}
+
+
+    def test_paginas_sob_demanda(self, busca_spocket):
+        """Testa que as páginas só são buscadas conforme o consumo (mais uma adiantada)"""
+        api = FornecedorAPI(FornecedorType.SPOCKET)
+
+        paginas = api.iter_candidates("mouse", limit=5, max_pages=10)
+        primeira = next(paginas)
+        segunda = next(paginas)
+        paginas.close()
+
+        assert [p.id for p in primeira][0] == "SP-1-0"
+        assert [p.id for p in segunda][0] == "SP-2-0"
+        # Duas páginas consumidas e no máximo a terceira adiantada
+        assert busca_spocket.call_count <= 3
+
+    def test_paginas_para_no_limite_ou_pagina_incompleta(self):
+        """Testa o fim da leitura pelo limite de páginas e pela página incompleta"""
+        buscadas = []
+
+        def buscar(page):
+            buscadas.append(page)
+            return list(range(5 if page < 3 else 2))
+
+        assert len(list(iter_pages(buscar, max_pages=2, page_size=5, prefetch=False))) == 2
+        assert buscadas == [1, 2]
+
+        buscadas.clear()
+        assert [len(p) for p in iter_pages(buscar, max_pages=10, page_size=5)] == [5, 5, 2]
+        assert buscadas == [1, 2, 3]
+
+    def test_pagina_seguinte_buscada_durante_o_processamento(self):
+        """Testa que a próxima página é buscada enquanto a atual é processada"""
+        segunda_pedida = threading.Event()
+
+        def buscar(page):
+            if page == 2:
+                segunda_pedida.set()
+            return [page] * 5
+
+        paginas = iter_pages(buscar, max_pages=3, page_size=5)
+        next(paginas)
+        # Sem pedir a segunda página, ela já está sendo buscada
+        assert segunda_pedida.wait(2)
+        paginas.close()
@@ -0,0 +1,50 @@
+"""
+Testes para o transporte HTTP compartilhado
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+
+from config import http_client
+
+class TestHttpClient:
+    """Testes para o transporte HTTP compartilhado"""
+
+    @pytest.fixture(autouse=True)
+    def limpar_sessoes(self):
+        """Garante sessões novas para cada teste"""
+        http_client.close_all()
+        yield
+        http_client.close_all()
+        http_client._host_config.clear()
+
+    def test_reutiliza_sessao_por_host(self):
+        """Testa que URLs do mesmo host compartilham a sessão"""
+        sessao_1 = http_client.get_session("https://api.mercadolibre.com/items/MLB1")
+        sessao_2 = http_client.get_session("https://api.mercadolibre.com/orders/search")
+        sessao_3 = http_client.get_session("https://api.spocket.co/v1/products")
+
+        assert sessao_1 is sessao_2
+        assert sessao_1 is not sessao_3
+
+    def test_aplica_timeout_padrao(self):
+        """Testa que toda requisição recebe timeout"""
+        url = "https://api.mercadolibre.com/items/MLB1"
+        sessao = http_client.get_session(url)
+
+        with patch.object(sessao, "request", return_value=MagicMock(status_code=200)) as mock_request:
+            http_client.get(url)
+
+        _, kwargs = mock_request.call_args
+        assert kwargs["timeout"] == (http_client.HTTP_CONNECT_TIMEOUT, http_client.HTTP_READ_TIMEOUT)
+
+    def test_configure_host(self):
+        """Testa a configuração de pool e timeout por host"""
+        url = "https://api.cjdropshipping.com/api/product/list"
+        sessao_antiga = http_client.get_session(url)
+
+        http_client.configure_host("api.cjdropshipping.com", pool_maxsize=5, read_timeout=60)
+        sessao_nova = http_client.get_session(url)
+
+        assert sessao_nova is not sessao_antiga
+        assert http_client.get_timeout(url) == (http_client.HTTP_CONNECT_TIMEOUT, 60)
+        assert sessao_nova.get_adapter(url)._pool_maxsize == 5
@@ -0,0 +1,46 @@
+"""
+Testes para a camada de codificação JSON
+"""
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from config import json_codec
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Executa o teste com os dois backends"""
+    if request.param and json_codec.orjson is None:
+        pytest.skip("orjson não instalado")
+    monkeypatch.setattr(json_codec, "USE_ORJSON", request.param)
+    return request.param
+
+class TestJsonCodec:
+    """Testes para a camada de codificação JSON"""
+
+    def test_ida_e_volta(self, backend):
+        """Testa que codificar e decodificar preserva o payload"""
+        payload = {"id": 1, "title": "Fone de Ouvido Sem Fio", "tags": ["áudio"], "price": 99.9}
+
+        assert json_codec.loads(json_codec.dumps(payload)) == payload
+        assert json_codec.loads(json_codec.dumps_bytes(payload, indent=True)) == payload
+        assert "\n  " in json_codec.dumps(payload, indent=True)
+
+    def test_erro_de_sintaxe(self, backend):
+        """Testa que JSON inválido lança json.JSONDecodeError nos dois backends"""
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads(b"{invalido")
+
+    def test_decodifica_corpo_da_resposta(self, backend):
+        """Testa a leitura direta dos bytes da resposta"""
+        resposta = MagicMock(content=b'{"results": [1, 2]}')
+
+        assert json_codec.response_json(resposta) == {"results": [1, 2]}
+        resposta.json.assert_not_called()
+
+    def test_resposta_sem_corpo_em_bytes(self, backend):
+        """Testa o uso de response.json() quando não há bytes (ex.: mocks e cache)"""
+        resposta = MagicMock()
+        resposta.json.return_value = {"ok": True}
+
+        assert json_codec.response_json(resposta) == {"ok": True}
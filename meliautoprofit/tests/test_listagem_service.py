@@ -1,135 +1,458 @@
-"""
-Testes para o serviço de listagem
-"""
-import pytest
-from unittest.mock import patch, MagicMock
-
-from app.services.listagem import ListagemService
-from app.api.fornecedor import FornecedorType
-from database.models import StatusProduto
-from .mocks import MockMercadoLivreAPI, MockFornecedorAPI, MockTelegramAPI
-
-class TestListagemService:
-    """Testes para o serviço de listagem"""
-    
-    @pytest.fixture
-    def service(self, test_db):
-        """Fixture para criar o serviço de listagem com mocks"""
-        with patch('app.services.listagem.MercadoLivreAPI') as mock_ml, \
-             patch('app.services.listagem.FornecedorAPI') as mock_fornecedor:
-            # Configura os mocks
-            mock_ml.return_value = MockMercadoLivreAPI()
-            mock_fornecedor.return_value = MockFornecedorAPI()
-            
-            # Cria o serviço com o banco de dados de teste
-            service = ListagemService(test_db)
-            
-            yield service
-    
-    def test_buscar_tendencias(self, service):
-        """Testa a busca de tendências"""
-        # Executa o método
-        tendencias = service.buscar_tendencias(limit=5)
-        
-        # Verifica se retornou o número correto de tendências
-        assert len(tendencias) == 5
-        
-        # Verifica se as tendências têm o formato esperado
-        for i, tendencia in enumerate(tendencias, 1):
-            assert tendencia["keyword"] == f"Produto Tendência {i}"
-            assert tendencia["price"] > 0
-    
-    def test_buscar_produtos_fornecedor(self, service):
-        """Testa a busca de produtos no fornecedor"""
-        # Executa o método
-        produtos = service.buscar_produtos_fornecedor("Smartphone", FornecedorType.CJ_DROPSHIPPING)
-        
-        # Verifica se retornou produtos
-        assert len(produtos) > 0
-        
-        # Verifica se os produtos têm o formato esperado
-        for produto in produtos:
-            assert "name" in produto
-            assert "price" in produto
-            assert "stock" in produto
-    
-    def test_selecionar_melhor_produto(self, service):
-        """Testa a seleção do melhor produto"""
-        # Produtos de teste
-        produtos = [
-            {"name": "Produto 1", "price": 100, "stock": 5, "rating": 4.5},
-            {"name": "Produto 2", "price": 120, "stock": 10, "rating": 4.2},
-            {"name": "Produto 3", "price": 80, "stock": 15, "rating": 3.8}
-        ]
-        
-        # Executa o método
-        melhor_produto = service.selecionar_melhor_produto(produtos)
-        
-        # Verifica se retornou um produto
-        assert melhor_produto is not None
-        
-        # O produto com melhor score deve ser o primeiro (por causa do rating alto)
-        assert melhor_produto["name"] == "Produto 1"
-    
-    def test_selecionar_melhor_produto_lista_vazia(self, service):
-        """Testa a seleção do melhor produto com lista vazia"""
-        # Executa o método com lista vazia
-        melhor_produto = service.selecionar_melhor_produto([])
-        
-        # Deve retornar None
-        assert melhor_produto is None
-    
-    def test_criar_anuncio_ml(self, service, test_db):
-        """Testa a criação de anúncio no Mercado Livre"""
-        # Produto do fornecedor
-        produto_fornecedor = {
-            "id": "CJ-123456",
-            "name": "Smartphone X12",
-            "description": "Smartphone de última geração",
-            "price": 500.0,
-            "stock": 50,
-            "category": "Eletrônicos",
-            "sku": "SM-X12",
-            "images": ["https://exemplo.com/imagem1.jpg"]
-        }
-        
-        # Fornecedor ID do banco de dados de teste
-        fornecedor_id = 1
-        
-        # Executa o método
-        resultado = service.criar_anuncio_ml(produto_fornecedor, fornecedor_id)
-        
-        # Verifica se retornou um resultado
-        assert resultado is not None
-        assert "id" in resultado
-        assert resultado["status"] == "active"
-        
-        # Verifica se o produto foi salvo no banco
-        produto = test_db.query(service.produto_repo.get_by_ml_item_id(resultado["id"]))
-        assert produto is not None
-    
-    @patch('app.services.listagem.ML_ITEMS_PER_DAY', 3)  # Limita a 3 anúncios para o teste
-    def test_criar_anuncios_diarios(self, service, test_db):
-        """Testa a criação de anúncios diários"""
-        # Executa o método
-        total = service.criar_anuncios_diarios()
-        
-        # Deve criar 3 anúncios
-        assert total == 3
-        
-        # Verifica se os produtos foram salvos no banco
-        produtos = test_db.query(service.produto_repo.list_by_status(StatusProduto.ATIVO))
-        assert len(produtos) >= 3  # Já existiam alguns produtos teste
-    
-    def test_criar_anuncios_diarios_sem_fornecedores(self, service, test_db):
-        """Testa a criação de anúncios diários sem fornecedores"""
-        # Remove os fornecedores do banco de teste
-        for fornecedor in test_db.query(service.fornecedor_repo.list_all()):
-            test_db.delete(fornecedor)
-        test_db.commit()
-        
-        # Executa o método
-        total = service.criar_anuncios_diarios()
-        
-        # Não deve criar nenhum anúncio
-        assert total == 0 
\ No newline at end of file
+"""
+Testes para o serviço de listagem
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+
+from app.services.listagem import ListagemService
+from app.api.fornecedor import FornecedorType
+from app.api.adaptadores_fornecedor import SupplierCandidate
+from app.services.catalogo import CatalogoFornecedores
+from app.services.similaridade import tokens_titulo
+from database.models import StatusProduto, Produto
+from .mocks import MockMercadoLivreAPI, MockFornecedorAPI, MockTelegramAPI
+
+class TestListagemService:
+    """Testes para o serviço de listagem"""
+    
+    @pytest.fixture
+    def service(self, test_db):
+        """Fixture para criar o serviço de listagem com mocks"""
+        with patch('app.services.listagem.MercadoLivreAPI') as mock_ml, \
+             patch('app.services.listagem.FornecedorAPI') as mock_fornecedor, \
+             patch('app.services.listagem.obter_catalogo', return_value=None):
+            # Configura os mocks
+            mock_ml.return_value = MockMercadoLivreAPI()
+            mock_fornecedor.side_effect = MockFornecedorAPI
+            
+            # Cria o serviço com o banco de dados de teste
+            service = ListagemService(test_db)
+            
+            yield service
+    
+    def test_buscar_tendencias(self, service):
+        """Testa a busca de tendências"""
+        # Executa o método
+        tendencias = service.buscar_tendencias(limit=5)
+        
+        # Verifica se retornou o número correto de tendências
+        assert len(tendencias) == 5
+        
+        # Verifica se as tendências têm o formato esperado
+        for i, tendencia in enumerate(tendencias, 1):
+            assert tendencia["keyword"] == f"Produto Tendência {i}"
+            assert tendencia["price"] > 0
+    
+    def test_buscar_produtos_fornecedor(self, service):
+        """Testa a busca de produtos no fornecedor"""
+        # Executa o método
+        produtos = service.buscar_produtos_fornecedor("Smartphone", FornecedorType.CJ_DROPSHIPPING)
+        
+        # Verifica se retornou produtos
+        assert len(produtos) > 0
+        
+        # Verifica se os produtos têm o formato esperado
+        for produto in produtos:
+            assert "name" in produto
+            assert "price" in produto
+            assert "stock" in produto
+    
+    def test_busca_encerra_com_bom_candidato(self, service):
+        """Testa que a busca para na primeira página com um candidato acima do limiar"""
+        cj = service.fornecedor_apis[FornecedorType.CJ_DROPSHIPPING.value]
+        
+        with patch.object(cj, 'search_products', wraps=cj.search_products) as mock_busca, \
+             patch('app.services.listagem.SUPPLIER_SEARCH_MAX_PAGES', 3):
+            produtos = service.buscar_produtos_fornecedor("Relógio", FornecedorType.CJ_DROPSHIPPING)
+        
+        # O mock devolve estoque alto, com score bem acima do limiar padrão
+        assert len(produtos) == 20
+        assert mock_busca.call_args_list[0][0][1] == 1
+        assert mock_busca.call_count <= 2
+    
+    def test_busca_le_todas_as_paginas_sem_limiar(self, service):
+        """Testa que, sem limiar, a busca lê todas as páginas permitidas"""
+        cj = service.fornecedor_apis[FornecedorType.CJ_DROPSHIPPING.value]
+        lidas = []
+        
+        def paginas():
+            for p in range(3):
+                lidas.append(p)
+                yield [SupplierCandidate(f"CJ-{p}-{i}", "cj_dropshipping", price=10.0, stock=90, rating=4.0)
+                       for i in range(3)]
+        
+        produtos = service.consumir_paginas(paginas(), cj, "cj_dropshipping", limiar=0)
+        
+        assert len(produtos) == 9
+        assert lidas == [0, 1, 2]
+    
+    def test_selecionar_melhor_produto(self, service):
+        """Testa a seleção do melhor produto"""
+        # Produtos de teste
+        produtos = [
+            {"name": "Produto 1", "price": 100, "stock": 5, "rating": 4.5},
+            {"name": "Produto 2", "price": 120, "stock": 10, "rating": 4.2},
+            {"name": "Produto 3", "price": 80, "stock": 15, "rating": 3.8}
+        ]
+        
+        # Executa o método
+        melhor_produto = service.selecionar_melhor_produto(produtos)
+        
+        # Verifica se retornou um produto
+        assert melhor_produto is not None
+        
+        # O produto com melhor score deve ser o primeiro (por causa do rating alto)
+        assert melhor_produto["name"] == "Produto 1"
+    
+    def test_selecionar_melhor_produto_lista_vazia(self, service):
+        """Testa a seleção do melhor produto com lista vazia"""
+        # Executa o método com lista vazia
+        melhor_produto = service.selecionar_melhor_produto([])
+        
+        # Deve retornar None
+        assert melhor_produto is None
+    
+    def test_criar_anuncio_ml(self, service, test_db):
+        """Testa a criação de anúncio no Mercado Livre"""
+        # Produto do fornecedor
+        produto_fornecedor = {
+            "id": "CJ-123456",
+            "name": "Smartphone X12",
+            "description": "Smartphone de última geração",
+            "price": 500.0,
+            "stock": 50,
+            "category": "Eletrônicos",
+            "sku": "SM-X12",
+            "images": ["https://exemplo.com/imagem1.jpg"]
+        }
+        
+        # Fornecedor ID do banco de dados de teste
+        fornecedor_id = 1
+        
+        # Executa o método
+        resultado = service.criar_anuncio_ml(produto_fornecedor, fornecedor_id)
+        
+        # Verifica se retornou um resultado
+        assert resultado is not None
+        assert "id" in resultado
+        assert resultado["status"] == "active"
+        
+        # Verifica se o produto foi salvo no banco
+        produto = test_db.query(service.produto_repo.get_by_ml_item_id(resultado["id"]))
+        assert produto is not None
+    
+    @patch('app.services.listagem.ML_ITEMS_PER_DAY', 3)  # Limita a 3 anúncios para o teste
+    def test_criar_anuncios_diarios(self, service, test_db):
+        """Testa a criação de anúncios diários"""
+        # Executa o método
+        total = service.criar_anuncios_diarios()
+        
+        # Deve criar 3 anúncios
+        assert total == 3
+        
+        # Verifica se os produtos foram salvos no banco
+        produtos = test_db.query(service.produto_repo.list_by_status(StatusProduto.ATIVO))
+        assert len(produtos) >= 3  # Já existiam alguns produtos teste
+    
+    def test_criar_anuncios_diarios_sem_fornecedores(self, service, test_db):
+        """Testa a criação de anúncios diários sem fornecedores"""
+        # Remove os fornecedores do banco de teste
+        for fornecedor in test_db.query(service.fornecedor_repo.list_all()):
+            test_db.delete(fornecedor)
+        test_db.commit()
+        
+        # Executa o método
+        total = service.criar_anuncios_diarios()
+        
+        # Não deve criar nenhum anúncio
+        assert total == 0
+    
+    @patch('app.services.listagem.ML_ITEMS_PER_DAY', 2)
+    def test_criar_anuncios_diarios_compara_fornecedores(self, service, test_db):
+        """Testa que todos os fornecedores são consultados e o melhor vence"""
+        buscas = []
+        spocket = service.fornecedor_apis[FornecedorType.SPOCKET.value]
+        busca_original = spocket.search_products
+        
+        def busca_spocket(keyword, page=1, limit=20):
+            buscas.append((FornecedorType.SPOCKET, keyword))
+            produtos = busca_original(keyword, page, limit)
+            # Spocket com avaliação e estoque maiores que os do CJ
+            for produto in produtos:
+                produto["rating"] += 1
+                produto["stock"] += 100
+            return produtos
+        
+        spocket.search_products = busca_spocket
+        
+        with patch.object(service, 'publicar_anuncio_ml', return_value=({}, {"id": "MLB1"})) as mock_publicar, \
+             patch.object(service, 'registrar_produto', return_value=MagicMock()) as mock_registrar:
+            total = service.criar_anuncios_diarios()
+        
+        assert total == 2
+        assert len(buscas) >= 2
+        assert mock_publicar.call_count == 2
+        for chamada in mock_publicar.call_args_list:
+            assert chamada[0][0].fornecedor == FornecedorType.SPOCKET.value
+        # Gravado com o id do fornecedor Spocket
+        assert {chamada[0][1] for chamada in mock_registrar.call_args_list} == {2}
+    
+    @patch('app.services.listagem.ML_ITEMS_PER_DAY', 1)
+    def test_produto_reservado_depois_da_pontuacao(self, service, test_db):
+        """Testa que um candidato reservado por outra tendência cede lugar ao próximo do mesmo fornecedor"""
+        spocket = service.fornecedor_apis[FornecedorType.SPOCKET.value]
+        busca_original = spocket.search_products
+        
+        def busca_spocket(keyword, page=1, limit=20):
+            produtos = busca_original(keyword, page, limit)
+            for produto in produtos:
+                produto["rating"] += 1
+                produto["stock"] += 100
+            return produtos
+        
+        spocket.search_products = busca_spocket
+        carregar_original = service.carregar_indice_anunciados
+        
+        def carregar():
+            indice = carregar_original()
+            # Outra tendência reservou o melhor produto do Spocket depois da pontuação
+            indice.reservar(2, "spocket-1")
+            return indice
+        
+        with patch.object(service, 'carregar_indice_anunciados', side_effect=carregar), \
+             patch.object(service, 'ja_anunciado', return_value=False), \
+             patch.object(service, 'publicar_anuncio_ml', return_value=({}, {"id": "MLB1"})) as mock_publicar, \
+             patch.object(service, 'registrar_produto', return_value=MagicMock()):
+            total = service.criar_anuncios_diarios()
+        
+        assert total == 1
+        publicado = mock_publicar.call_args[0][0]
+        assert publicado.fornecedor == FornecedorType.SPOCKET.value
+        assert publicado.id != "spocket-1"
+    
+    @patch('app.services.listagem.ML_ITEMS_PER_DAY', 1)
+    def test_criar_anuncios_diarios_tenta_proximo_fornecedor(self, service, test_db):
+        """Testa que a falha no melhor candidato passa para o próximo fornecedor"""
+        with patch.object(service, 'publicar_anuncio_ml', side_effect=[None, ({}, {"id": "MLB1"})]) as mock_publicar, \
+             patch.object(service, 'registrar_produto', return_value=MagicMock()):
+            total = service.criar_anuncios_diarios()
+        
+        assert total == 1
+        fornecedores_tentados = {chamada[0][0].fornecedor for chamada in mock_publicar.call_args_list}
+        assert len(fornecedores_tentados) == 2
+    
+    @patch('app.services.listagem.ML_ITEMS_PER_DAY', 2)
+    def test_criar_anuncios_diarios_para_na_meta(self, service, test_db):
+        """Testa que o pipeline não publica além da meta e registra os contadores dos estágios"""
+        with patch.object(service, 'publicar_anuncio_ml', return_value=({}, {"id": "MLB1"})) as mock_publicar, \
+             patch.object(service, 'registrar_produto', return_value=MagicMock()):
+            total = service.criar_anuncios_diarios()
+        
+        assert total == 2
+        assert mock_publicar.call_count == 2
+        assert list(service.estatisticas_pipeline) == ["busca", "pontuacao", "publicacao", "gravacao"]
+        assert service.estatisticas_pipeline["gravacao"]["processados"] == 2
+    
+    @patch('app.services.listagem.ML_ITEMS_PER_DAY', 2)
+    def test_falha_ao_gravar_libera_vaga(self, service, test_db):
+        """Testa que um anúncio não gravado no banco não conta para a meta"""
+        with patch.object(service, 'publicar_anuncio_ml', return_value=({}, {"id": "MLB1"})) as mock_publicar, \
+             patch.object(service, 'registrar_produto', side_effect=[None, MagicMock(), MagicMock()]):
+            total = service.criar_anuncios_diarios()
+        
+        assert total == 2
+        assert mock_publicar.call_count == 3
+    
+    @patch('app.services.listagem.ML_ITEMS_PER_DAY', 1)
+    def test_erro_ao_verificar_libera_vaga(self, service, test_db):
+        """Testa que uma exceção em uma etapa da publicação devolve a vaga e a execução termina"""
+        verificar_original = service.verificar_produto
+        chamadas = []
+        
+        def verificar(produto, tipo_fornecedor):
+            chamadas.append(produto.id)
+            if len(chamadas) == 1:
+                raise RuntimeError("falha na verificação")
+            return verificar_original(produto, tipo_fornecedor)
+        
+        # Com a vaga perdida, a única vaga da meta nunca voltaria e a execução não terminaria
+        with patch.object(service, 'verificar_produto', side_effect=verificar), \
+             patch.object(service, 'publicar_anuncio_ml', return_value=({}, {"id": "MLB1"})), \
+             patch.object(service, 'registrar_produto', return_value=MagicMock()):
+            total = service.criar_anuncios_diarios()
+        
+        assert total == 1
+        assert service.estatisticas_pipeline["publicacao"]["erros"] == 1
+    
+    @patch('app.services.listagem.ML_ITEMS_PER_DAY', 3)
+    def test_nao_publica_o_mesmo_produto_duas_vezes(self, service, test_db):
+        """Testa que tendências que trazem os mesmos produtos não geram anúncios repetidos"""
+        with patch.object(service, 'publicar_anuncio_ml', return_value=({}, {"id": "MLB1"})) as mock_publicar, \
+             patch.object(service, 'registrar_produto', return_value=MagicMock()):
+            total = service.criar_anuncios_diarios()
+        
+        publicados = [(chamada[0][0].fornecedor, chamada[0][0].id) for chamada in mock_publicar.call_args_list]
+        assert total == 3
+        assert len(set(publicados)) == len(publicados)
+    
+    @patch('app.services.listagem.ML_ITEMS_PER_DAY', 2)
+    def test_ignora_produtos_ja_anunciados(self, service, test_db):
+        """Testa que produtos já gravados no banco são descartados antes de qualquer chamada"""
+        # O mock devolve os mesmos 20 produtos por fornecedor (id cj_dropshipping-1 ... spocket-20)
+        for fornecedor_id, tipo in ((1, "cj_dropshipping"), (2, "spocket")):
+            for i in range(1, 21):
+                test_db.add(Produto(
+                    titulo=f"Anunciado {tipo} {i}", preco_custo=50.0, preco_venda=99.0, margem=0.98,
+                    estoque=10, sku=f"ANUNCIADO-{tipo}-{i}", fornecedor_id=fornecedor_id,
+                    fornecedor_product_id=f"{tipo}-{i}", status=StatusProduto.ATIVO,
+                ))
+        test_db.commit()
+        
+        with patch.object(service, 'publicar_anuncio_ml') as mock_publicar, \
+             patch.object(service, 'verificar_produto') as mock_verificar:
+            total = service.criar_anuncios_diarios()
+        
+        assert total == 0
+        mock_publicar.assert_not_called()
+        mock_verificar.assert_not_called()
+    
+    @patch('app.services.listagem.ML_ITEMS_PER_DAY', 1)
+    def test_ignora_titulo_quase_igual(self, service, test_db):
+        """Testa que candidatos com título quase igual ao de um produto anunciado são descartados"""
+        # Títulos da primeira tendência já anunciados, com ids de outro fornecedor
+        anunciados = [f"Produto Tendência 1 - {i}" for i in range(1, 21)]
+        for i, titulo in enumerate(anunciados, 1):
+            test_db.add(Produto(
+                titulo=titulo, preco_custo=50.0, preco_venda=99.0, margem=0.98, estoque=10,
+                sku=f"OUTRO-{i}", fornecedor_id=1, fornecedor_product_id=f"OUTRO-{i}", status=StatusProduto.ATIVO,
+            ))
+        test_db.commit()
+        
+        with patch.object(service, 'publicar_anuncio_ml', return_value=({}, {"id": "MLB1"})) as mock_publicar, \
+             patch.object(service, 'registrar_produto', return_value=MagicMock()):
+            total = service.criar_anuncios_diarios()
+        
+        assert total == 1
+        publicado = mock_publicar.call_args[0][0]
+        assert tokens_titulo(publicado.name) not in {tokens_titulo(titulo) for titulo in anunciados}
+    
+    def test_indices_acompanham_o_repositorio(self, service, test_db):
+        """Testa que gravações pelo repositório atualizam os índices já carregados"""
+        service.carregar_indice_anunciados()
+        candidato = SupplierCandidate("NOVO-1", "cj_dropshipping", name="Fone Bluetooth Sem Fio Preto", sku="NOVO-SKU")
+        
+        produto = service.produto_repo.create({
+            "titulo": "Fone Bluetooth Sem Fio Preto", "preco_custo": 50.0, "preco_venda": 99.0, "margem": 0.98,
+            "estoque": 10, "sku": "NOVO-SKU", "fornecedor_id": 1, "fornecedor_product_id": "NOVO-1",
+            "status": StatusProduto.ATIVO,
+        })
+        assert service.ja_anunciado(1, candidato)
+        
+        # Inativo: o título quase igual volta a ser permitido, o mesmo produto não
+        service.produto_repo.update(produto.id, {"status": StatusProduto.INATIVO})
+        quase_igual = SupplierCandidate("OUTRO-1", "spocket", name="Fone Bluetooth Sem Fio Preto")
+        assert not service.ja_anunciado(2, quase_igual)
+        assert service.ja_anunciado(1, candidato)
+        
+        service.produto_repo.delete(produto.id)
+        assert not service.ja_anunciado(1, candidato)
+    
+    def test_criar_anuncio_ml_recusa_sku_anunciado(self, service):
+        """Testa que o anúncio de um SKU já gravado é recusado antes de chamar o ML"""
+        with patch.object(service, 'publicar_anuncio_ml') as mock_publicar:
+            resultado = service.criar_anuncio_ml({"id": "OUTRO-ID", "sku": "TESTE-001"}, 1)
+        
+        assert resultado is None
+        mock_publicar.assert_not_called()
+    
+    def test_buscar_produtos_no_catalogo_local(self, service):
+        """Testa que o catálogo local evita a busca na API do fornecedor"""
+        service.catalogo = CatalogoFornecedores(":memory:")
+        cj = service.fornecedor_apis[FornecedorType.CJ_DROPSHIPPING.value]
+        
+        with patch.object(cj, 'search_products', wraps=cj.search_products) as mock_busca:
+            primeira = service.buscar_produtos_fornecedor("Smartphone", FornecedorType.CJ_DROPSHIPPING)
+            chamadas = mock_busca.call_count
+            segunda = service.buscar_produtos_fornecedor("smartphone", FornecedorType.CJ_DROPSHIPPING)
+        
+        assert mock_busca.call_count == chamadas
+        assert len(segunda) == len(primeira)
+        assert all(produto["origem"] == "catalogo" for produto in segunda)
+    
+    def test_catalogo_com_poucos_candidatos_consulta_a_api(self, service):
+        """Testa que poucos candidatos no catálogo não impedem a busca no fornecedor, que é o fallback"""
+        service.catalogo = CatalogoFornecedores(":memory:")
+        service.catalogo.salvar_produtos("cj_dropshipping", [
+            {"id": "CJ-CAT-1", "name": "Smartphone Antigo", "price": 10.0, "stock": 3, "rating": 4.0}
+        ])
+        service.catalogo.registrar_sincronizacao("cj_dropshipping", "Smartphone", 1)
+        cj = service.fornecedor_apis[FornecedorType.CJ_DROPSHIPPING.value]
+        
+        with patch.object(cj, 'search_products', wraps=cj.search_products) as mock_busca:
+            produtos = service.buscar_produtos_fornecedor("Smartphone", FornecedorType.CJ_DROPSHIPPING)
+        
+        assert mock_busca.called
+        assert all(produto["origem"] != "catalogo" for produto in produtos)
+        
+        # Sem resultado na API, ficam os candidatos do catálogo
+        with patch.object(cj, 'search_products', return_value=[]):
+            produtos = service.buscar_produtos_fornecedor("Antigo", FornecedorType.CJ_DROPSHIPPING)
+        
+        assert [produto.id for produto in produtos] == ["CJ-CAT-1"]
+    
+    def test_catalogo_desatualizado_consulta_a_api(self, service):
+        """Testa que uma palavra-chave não sincronizada recentemente é buscada no fornecedor"""
+        service.catalogo = CatalogoFornecedores(":memory:")
+        service.catalogo.salvar_produtos("cj_dropshipping", [
+            {"id": f"CJ-CAT-{i}", "name": f"Smartphone {i}", "price": 10.0, "stock": 3} for i in range(10)
+        ])
+        cj = service.fornecedor_apis[FornecedorType.CJ_DROPSHIPPING.value]
+        
+        with patch.object(cj, 'search_products', wraps=cj.search_products) as mock_busca:
+            service.buscar_produtos_fornecedor("Smartphone", FornecedorType.CJ_DROPSHIPPING)
+        
+        assert mock_busca.called
+        assert not service.catalogo.precisa_sincronizar("cj_dropshipping", "Smartphone")
+    
+    def test_sincronizar_catalogo_remove_antigos(self, service):
+        """Testa que a sincronização do catálogo descarta os produtos não vistos há muito tempo"""
+        service.catalogo = CatalogoFornecedores(":memory:")
+        
+        with patch.object(service.catalogo, 'remover_antigos', return_value=3) as mock_remover:
+            service.sincronizar_catalogo(["Smartphone"])
+        
+        mock_remover.assert_called_once()
+    
+    def test_verificar_produto_do_catalogo(self, service):
+        """Testa a confirmação de preço e estoque antes de anunciar"""
+        service.catalogo = CatalogoFornecedores(":memory:")
+        service.catalogo.salvar_produtos("spocket", [
+            {"id": "SP-1", "name": "Fone", "price": 10.0, "stock": 3, "rating": 4.0}
+        ])
+        produto = service.catalogo.obter("spocket", "SP-1")
+        
+        verificado = service.verificar_produto(produto, FornecedorType.SPOCKET)
+        
+        # O mock devolve preço 75 e estoque 50
+        assert verificado["price"] == 75.0
+        assert verificado["stock"] == 50
+        assert service.catalogo.obter("spocket", "SP-1")["price"] == 75.0
+    
+    def test_completar_detalhes_dos_candidatos(self, service):
+        """Testa que só os primeiros candidatos incompletos buscam detalhes"""
+        produtos = [
+            SupplierCandidate("SP-1", "spocket", name="Fone", price=10.0),
+            SupplierCandidate("SP-2", "spocket", name="Mouse", price=20.0, stock=5, rating=4.0),
+            SupplierCandidate("SP-3", "spocket", name="Teclado", price=30.0),
+            SupplierCandidate("SP-4", "spocket", name="Cabo", price=5.0),
+        ]
+        api = service.fornecedor_apis[FornecedorType.SPOCKET.value]
+        
+        with patch.object(api, 'get_products_details', wraps=api.get_products_details) as mock_detalhes:
+            completos = service.completar_detalhes(produtos, api, top_k=3)
+        
+        assert mock_detalhes.call_args[0][0] == ["SP-1", "SP-3"]
+        assert completos[0].stock == 50
+        assert completos[0].name == "Produto SP-1"
+        assert completos[1] is produtos[1]
+        assert completos[3] is produtos[3]
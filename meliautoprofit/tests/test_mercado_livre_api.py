@@ -0,0 +1,164 @@
+"""
+Testes para a API síncrona do Mercado Livre
+"""
+import json
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+
+from app.api import mercado_livre
+from app.api.mercado_livre import MercadoLivreAPI
+
+class TestMercadoLivreAPI:
+    """Testes para a API síncrona do Mercado Livre"""
+
+    @pytest.fixture
+    def pedidos(self):
+        """100 pedidos, três por dia"""
+        return [{"id": i, "date_created": f"2025-01-{1 + i // 3:02d}"} for i in range(100)]
+
+    def _get_orders_fake(self, pedidos, chamadas):
+        """Simula o /orders/search com filtro por data e paginação por offset"""
+        def get_orders(api, status, limit, offset, filters):
+            chamadas.append((offset, filters.get("order.date_created.from")))
+            desde = filters.get("order.date_created.from")
+            filtrados = [p for p in pedidos if not desde or p["date_created"] >= desde]
+            return {"results": filtrados[offset:offset + limit], "paging": {"total": len(filtrados)}}
+        return get_orders
+
+    def test_iter_orders_percorre_todas_as_paginas(self, pedidos):
+        """Testa que o gerador entrega todos os pedidos uma única vez"""
+        chamadas = []
+        with patch.object(MercadoLivreAPI, "get_orders", self._get_orders_fake(pedidos, chamadas)):
+            ids = [p["id"] for p in MercadoLivreAPI().iter_orders(page_size=25)]
+
+        assert ids == list(range(100))
+        assert [offset for offset, _ in chamadas] == [0, 25, 50, 75]
+
+    def test_iter_orders_retoma_pelo_cursor(self, pedidos):
+        """Testa a retomada a partir de uma data"""
+        chamadas = []
+        with patch.object(MercadoLivreAPI, "get_orders", self._get_orders_fake(pedidos, chamadas)):
+            ids = [p["id"] for p in MercadoLivreAPI().iter_orders(page_size=25, since="2025-01-30")]
+
+        assert ids == list(range(87, 100))
+
+    def test_iter_orders_reancora_no_offset_maximo(self, pedidos):
+        """Testa que o cursor é reancorado ao atingir o offset máximo da API"""
+        chamadas = []
+        with patch.object(MercadoLivreAPI, "get_orders", self._get_orders_fake(pedidos, chamadas)), \
+             patch.object(mercado_livre, "ML_ORDERS_MAX_OFFSET", 30):
+            ids = [p["id"] for p in MercadoLivreAPI().iter_orders(page_size=10)]
+
+        assert ids == list(range(100))
+        assert any(desde for _, desde in chamadas)
+
+    def test_iter_orders_reancora_com_datas_repetidas_em_varias_paginas(self):
+        """Testa que pedidos da data de reancoragem vistos em páginas anteriores não se repetem"""
+        # Sete pedidos por dia: a data da reancoragem ocupa mais de uma página
+        pedidos = [{"id": i, "date_created": f"2025-01-{1 + i // 7:02d}"} for i in range(100)]
+        chamadas = []
+        with patch.object(MercadoLivreAPI, "get_orders", self._get_orders_fake(pedidos, chamadas)), \
+             patch.object(mercado_livre, "ML_ORDERS_MAX_OFFSET", 20):
+            ids = [p["id"] for p in MercadoLivreAPI().iter_orders(page_size=5)]
+
+        assert ids == list(range(100))
+        assert sum(1 for _, desde in chamadas if desde) > 1
+
+    def test_iter_orders_cursor_invalido(self):
+        """Testa a validação do cursor"""
+        with pytest.raises(ValueError):
+            next(MercadoLivreAPI().iter_orders(cursor="id"))
+
+    def _resposta(self, status, **headers):
+        """Resposta do requests com o status e os cabeçalhos informados"""
+        resposta = requests.Response()
+        resposta.status_code = status
+        resposta.headers.update(headers)
+        resposta._content = b"{}"
+        return resposta
+
+    def test_retry_espera_o_retry_after(self):
+        """Testa que a nova tentativa após um 429 espera o Retry-After"""
+        respostas = [self._resposta(429, **{"Retry-After": "3"}), self._resposta(200)]
+        esperas = []
+        with patch.object(mercado_livre.http_client, "request", side_effect=respostas), \
+             patch.object(MercadoLivreAPI._request_with_retry.retry, "sleep", esperas.append):
+            resposta = MercadoLivreAPI()._request_with_retry("GET", "https://api.mercadolibre.com/items/MLB1")
+
+        assert resposta.status_code == 200
+        assert esperas == [pytest.approx(3.0, abs=0.05)]
+
+    def test_retry_esgotado_relanca_http_error(self):
+        """Testa que, esgotadas as tentativas, o chamador recebe um RequestException e não um RetryError"""
+        with patch.object(mercado_livre.http_client, "request", return_value=self._resposta(429)) as mock_request, \
+             patch.object(MercadoLivreAPI._request_with_retry.retry, "sleep"):
+            with pytest.raises(requests.exceptions.RequestException):
+                MercadoLivreAPI()._request_with_retry("GET", "https://api.mercadolibre.com/items/MLB1")
+
+        assert mock_request.call_count == 3
+
+    def _multiget_fake(self, chamadas, status_por_bloco=None):
+        """Simula o /items?ids= devolvendo uma entrada por ID pedido"""
+        def request(method, url, params=None, headers=None, **kwargs):
+            ids = params["ids"].split(",")
+            chamadas.append((ids, headers["Authorization"], params.get("attributes")))
+            status = (status_por_bloco or {}).get(ids[0], 200)
+            if status != 200:
+                resposta = self._resposta(status)
+                resposta._content = b"erro"
+                return resposta
+            resposta = self._resposta(200)
+            resposta._content = json.dumps([{"code": 200, "body": {"id": item_id}} for item_id in ids]).encode()
+            return resposta
+        return request
+
+    @pytest.fixture
+    def token(self):
+        """Gerenciador de token simulado (renovação devolve token-2)"""
+        with patch.object(mercado_livre, "token_manager") as gerenciador:
+            gerenciador.get_token.return_value = "token-1"
+            gerenciador.refresh_if_stale.return_value = "token-2"
+            yield gerenciador
+
+    def test_get_items_em_blocos_de_20(self, token):
+        """Testa a divisão do multiget em blocos de até 20 IDs, sem repetir IDs"""
+        chamadas = []
+        ids = [f"MLB{i}" for i in range(45)] + ["MLB0"]
+        with patch.object(mercado_livre.http_client, "request", side_effect=self._multiget_fake(chamadas)):
+            itens = MercadoLivreAPI().get_items(ids, attributes=["id", "price"])
+
+        assert sorted(len(ids_bloco) for ids_bloco, _, _ in chamadas) == [5, 20, 20]
+        assert all(atributos == "id,price" for _, _, atributos in chamadas)
+        assert len(itens) == 45
+        assert itens["MLB7"] == {"code": 200, "body": {"id": "MLB7"}}
+
+    def test_get_items_renova_token_apos_401(self, token):
+        """Testa que um bloco recusado com 401 é repetido com o token renovado"""
+        chamadas = []
+        multiget = self._multiget_fake(chamadas)
+
+        def request(method, url, **kwargs):
+            if kwargs["headers"]["Authorization"] == "Bearer token-1":
+                chamadas.append(("401", kwargs["headers"]["Authorization"], None))
+                return self._resposta(401)
+            return multiget(method, url, **kwargs)
+
+        with patch.object(mercado_livre.http_client, "request", side_effect=request):
+            itens = MercadoLivreAPI().get_items(["MLB1", "MLB2"])
+
+        assert [autorizacao for _, autorizacao, _ in chamadas] == ["Bearer token-1", "Bearer token-2"]
+        assert itens["MLB2"]["code"] == 200
+        token.refresh_if_stale.assert_called_once_with("token-1")
+
+    def test_get_items_falha_parcial(self, token):
+        """Testa que um bloco com erro marca só os seus IDs, sem perder os outros blocos"""
+        chamadas = []
+        ids = [f"MLB{i}" for i in range(25)]
+        with patch.object(mercado_livre.http_client, "request",
+                          side_effect=self._multiget_fake(chamadas, {"MLB20": 500})):
+            itens = MercadoLivreAPI().get_items(ids)
+
+        assert len(itens) == 25
+        assert all(itens[f"MLB{i}"]["code"] == 200 for i in range(20))
+        assert all(itens[f"MLB{i}"]["code"] == 500 for i in range(20, 25))
@@ -0,0 +1,127 @@
+"""
+Testes para a API assíncrona do Mercado Livre
+"""
+import time
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from fastapi import HTTPException
+
+from app import main
+from app.api.mercado_livre_async import AsyncMercadoLivreAPI
+from config.api_mercadolivre import token_manager, item_cache, shipment_cache
+
+class TestAsyncMercadoLivreAPI:
+    """Testes para a API assíncrona do Mercado Livre"""
+
+    @pytest.fixture(autouse=True)
+    def token_valido(self):
+        """Define um token válido no gerenciador compartilhado"""
+        dados_anteriores = token_manager.data
+        token_manager.data = {"access_token": "token-teste", "expires_at": time.time() + 3600}
+        item_cache.clear()
+        shipment_cache.clear()
+        yield
+        token_manager.data = dados_anteriores
+
+    def _executar(self, handler, coro_factory):
+        """Executa a corrotina com um transporte HTTP simulado"""
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            with patch("config.http_client.get_async_client", return_value=client):
+                try:
+                    return await coro_factory(AsyncMercadoLivreAPI())
+                finally:
+                    await client.aclose()
+        return asyncio.run(run())
+
+    def test_get_item(self):
+        """Testa a obtenção de um item"""
+        def handler(request):
+            assert request.headers["Authorization"] == "Bearer token-teste"
+            return httpx.Response(200, json={"id": request.url.path.split("/")[-1]})
+
+        item = self._executar(handler, lambda api: api.get_item("MLB1"))
+
+        assert item == {"id": "MLB1"}
+
+    def test_chamadas_concorrentes(self):
+        """Testa várias chamadas em paralelo no mesmo event loop"""
+        def handler(request):
+            return httpx.Response(200, json={"id": request.url.path.split("/")[-1]})
+
+        async def varios(api):
+            return await asyncio.gather(*(api.get_order(f"O{i}") for i in range(5)))
+
+        pedidos = self._executar(handler, varios)
+
+        assert [p["id"] for p in pedidos] == [f"O{i}" for i in range(5)]
+
+    def test_erro_da_api(self):
+        """Testa a conversão de erros da API em HTTPException"""
+        def handler(request):
+            return httpx.Response(404, text="not_found")
+
+        with pytest.raises(HTTPException) as exc:
+            self._executar(handler, lambda api: api.get_shipping("S1"))
+
+        assert exc.value.status_code == 404
+
+    def test_get_items_multiget(self):
+        """Testa o multiget em blocos com projeção de atributos"""
+        chamadas = []
+
+        def handler(request):
+            ids = request.url.params["ids"].split(",")
+            chamadas.append(ids)
+            assert request.url.params["attributes"] == "id,price"
+            return httpx.Response(200, json=[
+                {"code": 404, "body": {"error": "not_found"}} if item_id == "MLB7"
+                else {"code": 200, "body": {"id": item_id, "price": 10.0}}
+                for item_id in ids
+            ])
+
+        ids = [f"MLB{i}" for i in range(45)]
+        itens = self._executar(handler, lambda api: api.get_items(ids, attributes=["id", "price"]))
+
+        assert sorted(len(c) for c in chamadas) == [5, 20, 20]
+        assert len(itens) == 45
+        assert itens["MLB1"] == {"code": 200, "body": {"id": "MLB1", "price": 10.0}}
+        assert itens["MLB7"]["code"] == 404
+
+    def test_429_repetido_vira_http_exception(self):
+        """Testa que 429 em todas as tentativas chega ao chamador como HTTPException, e não RetryError"""
+        chamadas = []
+
+        def handler(request):
+            chamadas.append(request)
+            return httpx.Response(429, headers={"Retry-After": "0"}, text="too_many_requests")
+
+        with pytest.raises(HTTPException) as exc:
+            self._executar(handler, lambda api: api.get_order("O1"))
+
+        assert exc.value.status_code == 500
+        assert len(chamadas) == 3
+
+    def test_webhook_consulta_o_pedido(self):
+        """Testa que o webhook consulta o pedido pela API assíncrona"""
+        request = MagicMock()
+        request.body = AsyncMock(return_value=b'{"order_id": "O1"}')
+
+        with patch.object(AsyncMercadoLivreAPI, "get_order", AsyncMock(return_value={"status": "paid"})) as mock_get:
+            resposta = asyncio.run(main.handle_order(request))
+
+        assert resposta == {"status": "received"}
+        mock_get.assert_awaited_once_with("O1")
+
+    def test_webhook_aceita_notificacao_se_a_api_falhar(self):
+        """Testa que uma falha ao consultar o pedido não recusa a notificação"""
+        request = MagicMock()
+        request.body = AsyncMock(return_value=b'{"order_id": "O1"}')
+        erro = HTTPException(status_code=503, detail="circuito aberto")
+
+        with patch.object(AsyncMercadoLivreAPI, "get_order", AsyncMock(side_effect=erro)):
+            resposta = asyncio.run(main.handle_order(request))
+
+        assert resposta == {"status": "received"}
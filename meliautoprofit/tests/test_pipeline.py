@@ -0,0 +1,111 @@
+"""
+Testes para o pipeline em estágios
+"""
+import time
+import threading
+import pytest
+
+from app.services.pipeline import Pipeline, Estagio
+
+class TestPipeline:
+    """Testes para o pipeline em estágios"""
+
+    def test_processa_todos_os_itens(self):
+        """Testa que todos os itens passam pelos estágios, descartando os None"""
+        pipeline = Pipeline([
+            Estagio("dobro", lambda x: x * 2, workers=3, tamanho_fila=2),
+            Estagio("pares", lambda x: x if x % 4 == 0 else None, workers=2, tamanho_fila=2),
+            Estagio("texto", str, tamanho_fila=2),
+        ])
+
+        resultados = pipeline.executar(range(20))
+
+        assert sorted(resultados, key=int) == [str(x * 2) for x in range(20) if x % 2 == 0]
+        stats = pipeline.stats()
+        assert stats["dobro"]["processados"] == 20
+        assert stats["pares"]["descartados"] == 10
+        assert stats["texto"]["recebidos"] == 10
+
+    def test_estagios_em_paralelo(self):
+        """Testa que os workers de um estágio trabalham ao mesmo tempo"""
+        def lento(x):
+            time.sleep(0.05)
+            return x
+
+        pipeline = Pipeline([Estagio("lento", lento, workers=4)])
+        inicio = time.monotonic()
+        pipeline.executar(range(8))
+
+        # 8 itens de 50 ms com 4 workers: ~100 ms, não 400 ms
+        assert time.monotonic() - inicio < 0.3
+        assert pipeline.stats()["lento"]["vazao_por_segundo"] > 0
+
+    def test_backpressure(self):
+        """Testa que a fila de um estágio lento não passa do limite"""
+        def lento(x):
+            time.sleep(0.01)
+            return x
+
+        pipeline = Pipeline([
+            Estagio("rapido", lambda x: x, workers=2, tamanho_fila=2),
+            Estagio("lento", lento, tamanho_fila=3),
+        ])
+        pipeline.executar(range(30))
+
+        assert len(pipeline.resultados) == 30
+        assert pipeline.stats()["lento"]["fila_maxima"] <= 3
+
+    def test_parar_descarta_pendentes(self):
+        """Testa que parar() descarta os itens restantes, exceto nos estágios que finalizam pendentes"""
+        gravados = []
+
+        def gravar(x):
+            gravados.append(x)
+            if len(gravados) >= 3:
+                pipeline.parar()
+            return x
+
+        pipeline = Pipeline([
+            Estagio("entrada", lambda x: x, tamanho_fila=2),
+            Estagio("gravacao", gravar, tamanho_fila=2, finalizar_pendentes=True),
+        ])
+        pipeline.executar(range(1000))
+
+        assert pipeline.parado
+        assert 3 <= len(gravados) < 1000
+        assert pipeline.resultados == gravados
+
+    def test_erros_sao_contados(self):
+        """Testa que uma exceção descarta o item sem derrubar o pipeline"""
+        def falha_nos_impares(x):
+            if x % 2:
+                raise ValueError("falha")
+            return x
+
+        pipeline = Pipeline([Estagio("falha", falha_nos_impares, workers=2)])
+        resultados = pipeline.executar(range(10))
+
+        assert sorted(resultados) == [0, 2, 4, 6, 8]
+        assert pipeline.stats()["falha"]["erros"] == 5
+
+    def test_estagio_na_thread_chamadora(self):
+        """Testa que o estágio marcado roda na thread que chamou executar()"""
+        threads = set()
+
+        def registrar(x):
+            threads.add(threading.get_ident())
+            return x
+
+        pipeline = Pipeline([
+            Estagio("busca", lambda x: x, workers=2),
+            Estagio("gravacao", registrar, workers=3, na_thread_chamadora=True),
+        ])
+        pipeline.executar(range(10))
+
+        assert threads == {threading.get_ident()}
+        assert len(pipeline.resultados) == 10
+
+    def test_sem_estagios(self):
+        """Testa que o pipeline exige ao menos um estágio"""
+        with pytest.raises(ValueError):
+            Pipeline([])
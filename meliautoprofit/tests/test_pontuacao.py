@@ -0,0 +1,128 @@
+"""
+Testes para o motor de pontuação dos candidatos
+"""
+import math
+import random
+import time
+import pytest
+
+from app.api.adaptadores_fornecedor import SupplierCandidate
+from app.services.pontuacao import MotorPontuacao, ColunasCandidatos, ler_pesos, CRITERIOS, NEUTRO
+
+def _candidato(id, fornecedor="cj_dropshipping", **campos):
+    """Candidato de teste com valores padrão anunciáveis"""
+    campos.setdefault("price", 10.0)
+    campos.setdefault("stock", 10)
+    campos.setdefault("rating", 4.0)
+    return SupplierCandidate(id, fornecedor, name=f"Produto {id}", **campos)
+
+class TestMotorPontuacao:
+    """Testes para o motor de pontuação dos candidatos"""
+
+    def test_ler_pesos(self):
+        """Testa a leitura dos pesos da configuração"""
+        pesos = ler_pesos("avaliacao=0.5, preco=0.5, desconhecido=1, estoque=abc")
+
+        assert pesos["avaliacao"] == 0.5
+        assert pesos["preco"] == 0.5
+        assert pesos["estoque"] == 0.0
+        assert set(pesos) == set(CRITERIOS)
+
+    def test_pesos_zerados(self):
+        """Testa que pelo menos um peso precisa ser positivo"""
+        with pytest.raises(ValueError):
+            MotorPontuacao({"avaliacao": 0})
+
+    def test_sem_preco_ou_estoque_nao_pontua(self):
+        """Testa que candidatos que não podem ser anunciados ficam sem score"""
+        motor = MotorPontuacao()
+        scores = motor.pontuar([
+            _candidato("1"), _candidato("2", price=0), _candidato("3", stock=0), _candidato("4", stock=-1),
+        ])
+
+        assert not math.isnan(scores[0])
+        assert all(math.isnan(score) for score in scores[1:])
+        assert motor.melhores([_candidato("2", price=None)]) == []
+
+    def test_desconhecidos_sao_neutros(self):
+        """Testa que avaliação e estoque não informados valem NEUTRO, sem excluir o candidato"""
+        desconhecido = _candidato("desconhecido", rating=None, stock=None)
+        ruim = _candidato("ruim", rating=1.0, stock=1)
+        bom = _candidato("bom", rating=5.0, stock=1000)
+
+        for criterio in ("avaliacao", "estoque"):
+            motor = MotorPontuacao({criterio: 1})
+            scores = motor.pontuar([ruim, desconhecido, bom])
+            assert scores[1] == pytest.approx(NEUTRO)
+            assert scores[0] < scores[1] < scores[2]
+
+    def test_criterios_isolados(self):
+        """Testa o sentido de cada critério com apenas ele pesando"""
+        barato = _candidato("barato", price=10.0, rating=3.0, stock=5, shipping_days=20)
+        bem_avaliado = _candidato("avaliado", price=30.0, rating=5.0, stock=5, shipping_days=20)
+        estoque_alto = _candidato("estoque", price=30.0, rating=3.0, stock=500, shipping_days=20)
+        rapido = _candidato("rapido", price=30.0, rating=3.0, stock=5, shipping_days=2)
+        candidatos = [barato, bem_avaliado, estoque_alto, rapido]
+
+        assert MotorPontuacao({"preco": 1}).melhores(candidatos)[0][1] is barato
+        assert MotorPontuacao({"avaliacao": 1}).melhores(candidatos)[0][1] is bem_avaliado
+        assert MotorPontuacao({"estoque": 1}).melhores(candidatos)[0][1] is estoque_alto
+        assert MotorPontuacao({"prazo": 1}).melhores(candidatos)[0][1] is rapido
+
+    def test_margem_e_confiabilidade(self):
+        """Testa a margem sobre o preço de referência e a confiabilidade do fornecedor"""
+        cj = _candidato("cj", price=40.0)
+        spocket = _candidato("sp", "spocket", price=80.0)
+
+        motor = MotorPontuacao({"margem": 1})
+        scores = motor.pontuar([cj, spocket], preco_referencia=100.0)
+        assert scores[0] == pytest.approx(0.6)
+        assert scores[1] == pytest.approx(0.2)
+
+        motor = MotorPontuacao({"confiabilidade": 1})
+        melhor = motor.melhores([cj, spocket], confiabilidade={"cj_dropshipping": 0.4, "spocket": 0.9})
+        assert melhor[0] == (pytest.approx(0.9), spocket)
+
+    def test_aceita_dicionarios(self):
+        """Testa a pontuação de produtos em dicionário"""
+        produtos = [{"price": 10.0, "stock": 5, "rating": 4.5}, {"price": 10.0, "stock": 5, "rating": 3.0}]
+
+        assert MotorPontuacao({"avaliacao": 1}).melhores(produtos)[0][1] is produtos[0]
+
+    def test_melhores_igual_a_ordenacao_completa(self):
+        """Testa que a seleção parcial devolve os mesmos k melhores da ordenação completa"""
+        aleatorio = random.Random(42)
+        candidatos = [
+            _candidato(str(i), aleatorio.choice(["cj_dropshipping", "spocket"]),
+                       price=aleatorio.choice([0.0, aleatorio.uniform(1, 500)]),
+                       stock=aleatorio.randint(0, 1000), rating=aleatorio.uniform(0, 5),
+                       shipping_days=aleatorio.choice([None, aleatorio.randint(1, 40)]))
+            for i in range(2000)
+        ]
+        motor = MotorPontuacao()
+        scores = motor.pontuar(candidatos, preco_referencia=300.0)
+        esperado = sorted(
+            (i for i in range(len(candidatos)) if not math.isnan(scores[i])), key=lambda i: -scores[i]
+        )[:10]
+
+        melhores = motor.melhores(candidatos, 10, preco_referencia=300.0)
+
+        assert [produto.id for _, produto in melhores] == [candidatos[i].id for i in esperado]
+
+    def test_grupo_grande_em_milissegundos(self):
+        """Testa que repontuar dezenas de milhares de candidatos em colunas é rápido"""
+        aleatorio = random.Random(1)
+        candidatos = [
+            _candidato(str(i), price=aleatorio.uniform(1, 500), stock=aleatorio.randint(1, 1000),
+                       rating=aleatorio.uniform(0, 5))
+            for i in range(50000)
+        ]
+        colunas = ColunasCandidatos(candidatos)
+        motor = MotorPontuacao()
+
+        inicio = time.perf_counter()
+        melhores = motor.melhores(colunas, 20, preco_referencia=400.0)
+        duracao = time.perf_counter() - inicio
+
+        assert len(melhores) == 20
+        assert duracao < 0.5
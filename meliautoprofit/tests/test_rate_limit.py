@@ -0,0 +1,68 @@
+"""
+Testes para o limitador de requisições por host
+"""
+import pytest
+
+from config import rate_limit
+from config.rate_limit import TokenBucket
+
+class TestTokenBucket:
+    """Testes para o limitador de requisições por host"""
+
+    def test_permite_rajada_e_depois_espaca(self):
+        """Testa que a rajada inicial passa sem espera e o resto é espaçado"""
+        bucket = TokenBucket(rate=10, burst=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_respeita_retry_after(self):
+        """Testa que um 429 com Retry-After bloqueia pelo tempo pedido"""
+        bucket = TokenBucket(rate=10, burst=5)
+
+        bucket.observe(429, {"Retry-After": "3"})
+
+        assert bucket.reserve() == pytest.approx(3.0 + 0.2, abs=0.05)
+        assert bucket.rate == 5
+
+    def test_429_sem_cabecalho_usa_penalidade_crescente(self):
+        """Testa a espera exponencial quando o servidor não informa o tempo"""
+        bucket = TokenBucket(rate=10, burst=5)
+
+        bucket.observe(429, {})
+        primeira = bucket.stats()["blocked_for"]
+        bucket.observe(429, {})
+        segunda = bucket.stats()["blocked_for"]
+
+        assert primeira == pytest.approx(1.0, abs=0.05)
+        assert segunda == pytest.approx(2.0, abs=0.05)
+
+    def test_ajusta_taxa_pela_cota_restante(self):
+        """Testa o ajuste da taxa pelos cabeçalhos X-RateLimit-*"""
+        bucket = TokenBucket(rate=10)
+
+        bucket.observe(200, {"X-RateLimit-Remaining": "20", "X-RateLimit-Reset": "10"})
+
+        assert bucket.rate == 2
+
+    def test_recupera_taxa_apos_sucesso(self):
+        """Testa a recuperação gradual da taxa após um 429"""
+        bucket = TokenBucket(rate=10)
+        bucket.observe(429, {"Retry-After": "0"})
+
+        for _ in range(200):
+            bucket.observe(200, {})
+
+        assert bucket.rate == 10
+
+    def test_registro_por_host(self):
+        """Testa o registro e a busca de limitadores por host"""
+        bucket = rate_limit.configure("https://api.exemplo.com/v1", 5, name="Exemplo")
+
+        try:
+            assert rate_limit.get_bucket("https://api.exemplo.com/v1/products/1") is bucket
+            assert rate_limit.get_bucket("https://outro.exemplo.com/") is None
+        finally:
+            rate_limit.configure("https://api.exemplo.com/v1", 0)
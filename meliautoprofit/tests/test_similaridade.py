@@ -0,0 +1,91 @@
+"""
+Testes para a detecção de títulos quase iguais
+"""
+import random
+import time
+
+from app.services.similaridade import IndiceTitulos, tokens_titulo, jaccard
+from database.repository import ProdutoRepository
+
+class TestIndiceTitulos:
+    """Testes para a detecção de títulos quase iguais"""
+
+    def test_tokens_titulo(self):
+        """Testa a normalização do título (acentos, pontuação, stopwords e ordem)"""
+        assert tokens_titulo("Fone de Ouvido Bluetooth - Preto") == tokens_titulo("fone ouvido preto, bluetooth")
+        assert tokens_titulo("Relógio Inteligente") == {"relogio", "inteligente"}
+        assert tokens_titulo("") == frozenset()
+
+    def test_encontra_quase_iguais(self):
+        """Testa que variações do mesmo título são encontradas e produtos diferentes não"""
+        indice = IndiceTitulos(limiar=0.7)
+        indice.adicionar("fone", "Fone de Ouvido Bluetooth TWS Preto com Estojo")
+        indice.adicionar("relogio", "Relógio Inteligente Smartwatch D20")
+
+        chave, similaridade = indice.duplicado("Fone Ouvido Bluetooth TWS com Estojo - Preto")
+        assert chave == "fone"
+        assert similaridade == 1.0
+        assert indice.duplicado("Fone de Ouvido Bluetooth TWS Preto Estojo Carregador")[0] == "fone"
+        # Modelos diferentes não são o mesmo produto
+        assert indice.duplicado("Relógio Inteligente Smartwatch D21") is None
+        assert indice.duplicado("Cabo USB-C 2 metros") is None
+
+    def test_remover_e_reindexar(self):
+        """Testa a manutenção incremental do índice"""
+        indice = IndiceTitulos(limiar=0.7)
+        indice.adicionar("a", "Garrafa Térmica Inox 500ml")
+        indice.remover("a")
+
+        assert len(indice) == 0
+        assert indice.duplicado("Garrafa Térmica Inox 500ml") is None
+
+        indice.adicionar("a", "Garrafa Térmica Inox 500ml")
+        indice.adicionar("a", "Mochila Impermeável Notebook")
+        assert len(indice) == 1
+        assert indice.duplicado("Garrafa Térmica Inox 500ml") is None
+        assert indice.duplicado("Mochila Notebook Impermeável")[0] == "a"
+
+    def test_reservar(self):
+        """Testa que a reserva recusa títulos quase iguais a um já indexado"""
+        indice = IndiceTitulos(limiar=0.7)
+
+        assert indice.reservar("a", "Luminária LED de Mesa Articulada")
+        assert not indice.reservar("b", "Luminaria de Mesa LED Articulada")
+        # O próprio produto pode ser reindexado
+        assert indice.reservar("a", "Luminária LED de Mesa Articulada")
+        assert "b" not in indice
+
+    def test_limiar_zero_desativa(self):
+        """Testa que o limiar 0 desativa a detecção"""
+        indice = IndiceTitulos(limiar=0)
+        indice.adicionar("a", "Caneca Personalizada")
+
+        assert indice.duplicado("Caneca Personalizada") is None
+        assert indice.reservar("b", "Caneca Personalizada")
+
+    def test_carrega_do_banco(self, test_db):
+        """Testa o carregamento dos títulos dos produtos gravados"""
+        indice = IndiceTitulos.do_banco(ProdutoRepository(test_db), limiar=0.7)
+
+        assert len(indice) == 2
+        assert indice.duplicado("produto teste 1")[0] == (1, "CJ123456-TESTE")
+
+    def test_recall_e_consulta_rapida(self):
+        """Testa que o LSH acha os pares parecidos e responde em menos de 1 ms com milhares de títulos"""
+        aleatorio = random.Random(7)
+        vocabulario = [f"palavra{i}" for i in range(3000)]
+        titulos = [" ".join(aleatorio.sample(vocabulario, 8)) for _ in range(10000)]
+        indice = IndiceTitulos(limiar=0.7)
+        for i, titulo in enumerate(titulos):
+            indice.adicionar(i, titulo)
+
+        # Mesmo título com uma palavra a mais (Jaccard 8/9)
+        consultas = [(i, titulos[i] + " extra") for i in aleatorio.sample(range(len(titulos)), 200)]
+        inicio = time.perf_counter()
+        encontrados = [indice.duplicado(titulo) for _, titulo in consultas]
+        duracao_media = (time.perf_counter() - inicio) / len(consultas)
+
+        acertos = sum(1 for (i, _), achado in zip(consultas, encontrados) if achado and achado[0] == i)
+        assert acertos >= 0.95 * len(consultas)
+        assert duracao_media < 0.001
+        assert jaccard(tokens_titulo(titulos[0]), tokens_titulo(titulos[0] + " extra")) > 0.8
@@ -0,0 +1,60 @@
+"""
+Testes para os servidores locais que imitam as APIs externas
+"""
+from fastapi.testclient import TestClient
+
+from simulador_apis import SimulacaoConfig, criar_apps
+
+class TestSimuladorAPIs:
+    """Testes para os servidores locais que imitam as APIs externas"""
+
+    def _clientes(self, **kwargs):
+        """Cria os clientes de teste sem latência"""
+        params = {"latencia_ms": 0, "variacao_ms": 0, "tamanho_catalogo": 200}
+        params.update(kwargs)
+        return {nome: TestClient(app) for nome, app in criar_apps(SimulacaoConfig(**params)).items()}
+
+    def test_busca_de_produtos_dos_fornecedores(self):
+        """Testa as buscas da CJ e do Spocket no formato esperado pelos módulos de config"""
+        clientes = self._clientes()
+
+        cj = clientes["cj"].get("/api/product/list", params={"productNameEn": "mouse", "pageSize": 5}).json()
+        spocket = clientes["spocket"].get("/v1/products/search", params={"query": "mouse", "per_page": 5}).json()
+
+        assert cj["code"] == 200
+        assert 0 < len(cj["data"]["list"]) <= 5
+        assert all("Mouse" in p["name"] for p in cj["data"]["list"])
+        assert len(spocket["products"]) > 0
+
+        detalhe = clientes["cj"].get("/api/product/query", params={"pid": cj["data"]["list"][0]["id"]}).json()
+        assert detalhe["data"] == cj["data"]["list"][0]
+
+    def test_revalidacao_com_etag(self):
+        """Testa o 304 para If-None-Match igual ao ETag"""
+        ml = self._clientes()["ml"]
+
+        resposta = ml.get("/items/MLB10")
+        revalidada = ml.get("/items/MLB10", headers={"If-None-Match": resposta.headers["ETag"]})
+
+        assert resposta.json()["id"] == "MLB10"
+        assert revalidada.status_code == 304
+
+    def test_paginacao_e_filtro_de_pedidos(self):
+        """Testa a paginação e o filtro por data de criação de pedidos"""
+        ml = self._clientes()["ml"]
+
+        todos = ml.get("/orders/search", params={"limit": 50, "offset": 0}).json()
+        filtrados = ml.get("/orders/search", params={"order.date_created.from": "2025-01-02T00:00:00"}).json()
+
+        assert todos["paging"]["total"] == 200
+        assert filtrados["paging"]["total"] == 200 - 48
+        assert filtrados["results"][0]["date_created"] == "2025-01-02T00:00:00"
+
+    def test_injecao_de_429(self):
+        """Testa a injeção de 429 com Retry-After"""
+        telegram = self._clientes(taxa_429=1.0, retry_after=3)["telegram"]
+
+        resposta = telegram.post("/botTOKEN/sendMessage", json={"chat_id": 1, "text": "oi"})
+
+        assert resposta.status_code == 429
+        assert resposta.headers["Retry-After"] == "3"
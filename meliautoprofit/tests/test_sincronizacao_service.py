@@ -0,0 +1,100 @@
+"""
+Testes para o serviço de sincronização de preço e estoque
+"""
+import pytest
+from unittest.mock import patch
+
+from app.services.sincronizacao import SincronizacaoService
+from database.models import StatusProduto, Produto
+from .mocks import MockFornecedorAPI
+
+class TestSincronizacaoService:
+    """Testes para o serviço de sincronização de preço e estoque"""
+
+    @pytest.fixture
+    def service(self, test_db):
+        """Fixture para criar o serviço com o mock dos fornecedores"""
+        with patch('app.services.sincronizacao.FornecedorAPI') as mock_fornecedor:
+            mock_fornecedor.side_effect = MockFornecedorAPI
+            yield SincronizacaoService(test_db, tamanho_lote=2)
+
+    def _adicionar_ativos(self, test_db, quantidade, estoque=50, preco_custo=75.0):
+        """Adiciona produtos ativos do CJ já com os valores do mock (preço 75, estoque 50)"""
+        for i in range(quantidade):
+            test_db.add(Produto(
+                titulo=f"Ativo {i}", preco_custo=preco_custo, preco_venda=150.0, margem=1.0,
+                estoque=estoque, sku=f"ATIVO-{i}", fornecedor_id=1,
+                fornecedor_product_id=f"CJ-ATIVO-{i}", status=StatusProduto.ATIVO,
+            ))
+        test_db.commit()
+
+    def test_atualiza_preco_e_estoque(self, service, test_db):
+        """Testa a atualização dos produtos ativos com os valores do fornecedor"""
+        resultado = service.sincronizar()
+
+        produto = test_db.query(Produto).filter(Produto.sku == "TESTE-001").first()
+        assert produto.preco_custo == 75.0
+        assert produto.estoque == 50
+        assert resultado["alterados"] == 1
+
+        # Margem recalculada sobre o preço de venda anunciado (99)
+        assert produto.preco_venda == 99.0
+        assert produto.margem == pytest.approx((99.0 - 75.0) / 75.0)
+
+        # Produtos pendentes não são sincronizados
+        pendente = test_db.query(Produto).filter(Produto.sku == "TESTE-002").first()
+        assert pendente.estoque == 5
+
+    def test_grava_so_as_linhas_alteradas(self, service, test_db):
+        """Testa que só as linhas com diferença são gravadas, uma transação por lote"""
+        self._adicionar_ativos(test_db, 4)
+
+        with patch.object(service.produto_repo, 'bulk_update', wraps=service.produto_repo.bulk_update) as mock_gravar:
+            resultado = service.sincronizar()
+
+        # 5 ativos em lotes de 2; só o produto de teste estava diferente
+        assert resultado["lotes"] == 3
+        assert resultado["verificados"] == 5
+        assert resultado["alterados"] == 1
+        assert mock_gravar.call_count == 3
+        assert [len(chamada[0][0]) for chamada in mock_gravar.call_args_list] == [1, 0, 0]
+
+    def test_produto_sem_dados_nao_e_alterado(self, service, test_db):
+        """Testa que produtos sem resposta do fornecedor ficam como estão"""
+        cj = service.fornecedor_apis["cj_dropshipping"]
+
+        with patch.object(cj, 'get_products_details', return_value={"CJ123456-TESTE": None}):
+            resultado = service.sincronizar()
+
+        produto = test_db.query(Produto).filter(Produto.sku == "TESTE-001").first()
+        assert produto.preco_custo == 50.0
+        assert resultado["sem_dados"] == 1
+        assert resultado["alterados"] == 0
+
+class TestSincronizacaoAgendada:
+    """Testes para a sincronização agendada de preço e estoque"""
+
+    def test_executa_periodicamente(self):
+        """Testa que o timer roda a sincronização e se reagenda"""
+        import threading
+        from app.controllers import listagem_controller
+
+        execucoes = threading.Semaphore(0)
+        with patch.object(listagem_controller, 'SessionLocal') as mock_sessao, \
+                patch.object(listagem_controller, 'processar_sincronizacao_produtos',
+                             side_effect=lambda db: execucoes.release()) as mock_sincronizar:
+            try:
+                listagem_controller.agendar_sincronizacao_produtos(intervalo_horas=0.01 / 3600)
+                assert execucoes.acquire(timeout=2)
+                assert execucoes.acquire(timeout=2)
+            finally:
+                listagem_controller.parar_sincronizacao_produtos()
+
+        assert mock_sincronizar.call_count >= 2
+        assert mock_sessao.return_value.close.call_count >= 2
+
+    def test_intervalo_zero_desativa(self):
+        """Testa que intervalo 0 não agenda nada"""
+        from app.controllers import listagem_controller
+
+        assert listagem_controller.agendar_sincronizacao_produtos(intervalo_horas=0) is None
@@ -0,0 +1,141 @@
+"""
+Testes para o agrupamento de leituras idênticas (single-flight)
+"""
+import asyncio
+import threading
+import time
+
+from config.singleflight import SingleFlight
+
+class TestSingleFlight:
+    """Testes para o agrupamento de leituras idênticas"""
+
+    def test_threads_compartilham_uma_chamada(self):
+        """Testa que threads simultâneas disparam uma única chamada"""
+        flight = SingleFlight("teste_threads")
+        chamadas = []
+        liberar = threading.Event()
+
+        def buscar(pedido_id):
+            chamadas.append(pedido_id)
+            liberar.wait(2)
+            return {"id": pedido_id}
+
+        resultados = []
+        threads = [
+            threading.Thread(target=lambda: resultados.append(flight.do(("order", 1), buscar, 1)))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        while flight.stats()["shared"] < 4:
+            time.sleep(0.01)
+        liberar.set()
+        for t in threads:
+            t.join()
+
+        assert chamadas == [1]
+        assert resultados == [{"id": 1}] * 5
+        # Cada chamador recebe seu próprio objeto
+        assert len({id(r) for r in resultados}) == 5
+
+    def test_erro_propagado_para_quem_espera(self):
+        """Testa que a exceção da chamada chega a todos os chamadores"""
+        flight = SingleFlight("teste_erro")
+        liberar = threading.Event()
+
+        def falhar():
+            liberar.wait(2)
+            raise ValueError("falhou")
+
+        erros = []
+
+        def chamar():
+            try:
+                flight.do("chave", falhar)
+            except ValueError as e:
+                erros.append(e)
+
+        threads = [threading.Thread(target=chamar) for _ in range(3)]
+        for t in threads:
+            t.start()
+        while flight.stats()["shared"] < 2:
+            time.sleep(0.01)
+        liberar.set()
+        for t in threads:
+            t.join()
+
+        assert len(erros) == 3
+
+    def test_chamadas_sequenciais_nao_sao_compartilhadas(self):
+        """Testa que nada é guardado depois que a chamada termina"""
+        flight = SingleFlight("teste_sequencial")
+        contador = []
+
+        flight.do("chave", contador.append, 1)
+        flight.do("chave", contador.append, 2)
+
+        assert contador == [1, 2]
+        assert flight.stats()["in_flight"] == 0
+
+    def test_corrotinas_compartilham_uma_chamada(self):
+        """Testa o modo asyncio"""
+        flight = SingleFlight("teste_async")
+        chamadas = []
+
+        async def buscar(item_id):
+            chamadas.append(item_id)
+            await asyncio.sleep(0.01)
+            return {"id": item_id}
+
+        async def cenario():
+            return await asyncio.gather(
+                *(flight.ado(("item", "MLB1"), buscar, "MLB1") for _ in range(4)),
+                flight.ado(("item", "MLB2"), buscar, "MLB2")
+            )
+
+        resultados = asyncio.run(cenario())
+
+        assert sorted(chamadas) == ["MLB1", "MLB2"]
+        assert resultados[:4] == [{"id": "MLB1"}] * 4
+        assert flight.stats()["shared"] == 3
+
+    def test_corrotinas_recebem_o_erro(self):
+        """Testa a propagação de exceções no modo asyncio"""
+        flight = SingleFlight("teste_async_erro")
+
+        async def falhar():
+            await asyncio.sleep(0.01)
+            raise ValueError("falhou")
+
+        async def cenario():
+            return await asyncio.gather(*(flight.ado("chave", falhar) for _ in range(3)), return_exceptions=True)
+
+        resultados = asyncio.run(cenario())
+
+        assert all(isinstance(r, ValueError) for r in resultados)
+
+    def test_cancelar_o_primeiro_nao_afeta_quem_espera(self):
+        """Testa que o cancelamento de quem iniciou a chamada não chega aos outros chamadores"""
+        flight = SingleFlight("teste_async_cancelamento")
+        chamadas = []
+
+        async def buscar():
+            chamadas.append(1)
+            await asyncio.sleep(0.05)
+            return {"id": "MLB1"}
+
+        async def cenario():
+            primeiro = asyncio.create_task(flight.ado("chave", buscar))
+            await asyncio.sleep(0)
+            segundo = asyncio.create_task(flight.ado("chave", buscar))
+            await asyncio.sleep(0.01)
+            primeiro.cancel()
+            return await asyncio.gather(primeiro, segundo, return_exceptions=True)
+
+        primeiro, segundo = asyncio.run(cenario())
+
+        assert isinstance(primeiro, asyncio.CancelledError)
+        assert segundo == {"id": "MLB1"}
+        assert chamadas == [1]
+        assert flight.stats()["in_flight"] == 0
@@ -0,0 +1,98 @@
+"""
+Testes para a API do Telegram
+"""
+import threading
+import time
+import pytest
+from unittest.mock import patch, MagicMock
+
+from app.api.telegram import TelegramAPI
+from config import api_telegram
+
+def resposta(status_code=200, ok=True):
+    """Resposta simulada do getMe"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = b'{"ok": true, "result": {"id": 1, "is_bot": true}}' if ok else b'{"ok": false}'
+    return response
+
+class TestTelegramAPI:
+    """Testes para a API do Telegram"""
+
+    @pytest.fixture(autouse=True)
+    def limpar_cache(self):
+        """Começa cada teste sem resultado em cache e com token definido"""
+        api_telegram.health_cache.clear()
+        with patch.object(api_telegram, "TELEGRAM_BOT_TOKEN", "token-teste"):
+            yield
+        api_telegram.health_cache.clear()
+
+    def test_construcao_sem_rede(self):
+        """Testa que criar a API não faz requisições"""
+        with patch.object(api_telegram.http_client, "get") as mock_get, \
+             patch.object(api_telegram.http_client, "post") as mock_post:
+            TelegramAPI()
+            TelegramAPI()
+
+        mock_get.assert_not_called()
+        mock_post.assert_not_called()
+
+    def test_health_check_em_cache(self):
+        """Testa que o getMe é consultado uma vez dentro do TTL"""
+        with patch.object(api_telegram.http_client, "get", return_value=resposta()) as mock_get:
+            assert TelegramAPI().health_check() is True
+            assert TelegramAPI().health_check() is True
+            assert api_telegram.health_check() is True
+
+        assert mock_get.call_count == 1
+        assert mock_get.call_args[0][0].endswith("/getMe")
+
+    def test_health_check_forcado(self):
+        """Testa que force ignora o cache"""
+        with patch.object(api_telegram.http_client, "get", return_value=resposta()) as mock_get:
+            api_telegram.health_check()
+            api_telegram.health_check(force=True)
+
+        assert mock_get.call_count == 2
+
+    def test_health_check_falha(self):
+        """Testa falhas de rede e respostas de erro"""
+        with patch.object(api_telegram.http_client, "get", return_value=resposta(401, ok=False)):
+            assert api_telegram.health_check() is False
+
+        api_telegram.health_cache.clear()
+        erro = api_telegram.requests.exceptions.ConnectionError("sem rede")
+        with patch.object(api_telegram.http_client, "get", side_effect=erro):
+            assert api_telegram.health_check() is False
+
+    def test_health_check_simultaneo(self):
+        """Testa que verificações simultâneas fazem uma única requisição"""
+        liberar = threading.Event()
+
+        def get_lento(url, **kwargs):
+            liberar.wait(2)
+            return resposta()
+
+        resultados = []
+        with patch.object(api_telegram.http_client, "get", side_effect=get_lento) as mock_get:
+            threads = [
+                threading.Thread(target=lambda: resultados.append(api_telegram.health_check()))
+                for _ in range(5)
+            ]
+            for t in threads:
+                t.start()
+            time.sleep(0.05)
+            liberar.set()
+            for t in threads:
+                t.join()
+
+        assert resultados == [True] * 5
+        assert mock_get.call_count == 1
+
+    def test_sem_token(self):
+        """Testa que sem token não há requisição"""
+        with patch.object(api_telegram, "TELEGRAM_BOT_TOKEN", None), \
+             patch.object(api_telegram.http_client, "get") as mock_get:
+            assert api_telegram.health_check() is False
+
+        mock_get.assert_not_called()
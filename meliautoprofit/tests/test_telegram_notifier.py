@@ -0,0 +1,117 @@
+"""
+Testes para a fila de envio do Telegram
+"""
+import time
+import threading
+import pytest
+
+from config.telegram_notifier import TelegramNotifier, PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW
+
+class TestTelegramNotifier:
+    """Testes para a fila de envio do Telegram"""
+
+    @pytest.fixture
+    def enviados(self):
+        """Mensagens entregues ao envio simulado"""
+        return []
+
+    def _notifier(self, enviados, **kwargs):
+        """Cria um notificador com envio simulado e sem espera entre mensagens"""
+        def send(text, chat_id, parse_mode):
+            enviados.append((chat_id, text))
+            return {"ok": True}
+        params = {"chat_rate": 1000, "digest_window": 0.2}
+        params.update(kwargs)
+        return TelegramNotifier(send, **params)
+
+    def test_envio_sem_bloquear(self, enviados):
+        """Testa que notify retorna antes do envio terminar"""
+        liberar = threading.Event()
+
+        def send_lento(text, chat_id, parse_mode):
+            liberar.wait(2)
+            enviados.append(text)
+            return {"ok": True}
+
+        notifier = TelegramNotifier(send_lento, chat_rate=1000)
+        inicio = time.monotonic()
+        assert notifier.notify("olá", 1)
+        assert time.monotonic() - inicio < 0.1
+
+        liberar.set()
+        assert notifier.flush(2)
+        assert enviados == ["olá"]
+        notifier.stop()
+
+    def test_resumo_de_baixa_prioridade(self, enviados):
+        """Testa que notificações de baixa prioridade viram um único resumo"""
+        notifier = self._notifier(enviados)
+
+        for i in range(5):
+            notifier.notify(f"Pedido {i}", 1, priority=PRIORITY_LOW)
+        notifier.notify("Outro chat", 2, priority=PRIORITY_LOW)
+        assert notifier.flush(2)
+
+        por_chat = {chat: texto for chat, texto in enviados}
+        assert len(enviados) == 2
+        assert "5 notificações" in por_chat["1"]
+        assert all(f"Pedido {i}" in por_chat["1"] for i in range(5))
+        assert por_chat["2"] == "Outro chat"
+        assert notifier.stats()["merged"] == 5
+        notifier.stop()
+
+    def test_prioridade_alta_sai_primeiro(self, enviados):
+        """Testa a ordem da fila por prioridade"""
+        liberar = threading.Event()
+        notifier = self._notifier(enviados)
+        envio_original = notifier.send
+        notifier.send = lambda *args: liberar.wait(2) and envio_original(*args)
+
+        notifier.notify("bloqueia", 1, priority=PRIORITY_NORMAL)
+        time.sleep(0.05)
+        notifier.notify("normal", 1, priority=PRIORITY_NORMAL)
+        notifier.notify("erro", 1, priority=PRIORITY_HIGH)
+        liberar.set()
+        assert notifier.flush(2)
+
+        assert [texto for _, texto in enviados] == ["bloqueia", "erro", "normal"]
+        notifier.stop()
+
+    def test_respeita_limite_por_chat(self, enviados):
+        """Testa o espaçamento das mensagens de um mesmo chat"""
+        notifier = self._notifier(enviados, chat_rate=20)
+
+        inicio = time.monotonic()
+        for i in range(4):
+            notifier.notify(f"msg {i}", 1)
+        assert notifier.flush(2)
+
+        # Uma imediata e três espaçadas de 50 ms
+        assert time.monotonic() - inicio >= 0.14
+        notifier.stop()
+
+    def test_fila_cheia_descarta(self, enviados):
+        """Testa o limite da fila"""
+        liberar = threading.Event()
+        notifier = TelegramNotifier(lambda *args: liberar.wait(2), max_queue=1, chat_rate=1000)
+
+        notifier.notify("primeira", 1)
+        time.sleep(0.05)
+        notifier.notify("segunda", 1)
+
+        assert notifier.notify("terceira", 1) is False
+        assert notifier.stats()["dropped"] == 1
+        liberar.set()
+        notifier.stop()
+
+    def test_novas_tentativas_e_falha(self, enviados):
+        """Testa as novas tentativas quando o envio falha"""
+        tentativas = []
+        notifier = TelegramNotifier(lambda *args: tentativas.append(args) and None, chat_rate=1000, retries=2)
+
+        notifier.notify("falha", 1)
+        assert notifier.flush(2)
+
+        assert len(tentativas) == 3
+        assert notifier.stats()["failed"] == 1
+        notifier.stop()
@@ -0,0 +1,113 @@
+"""
+Testes para o cache de tokens de acesso
+"""
+import time
+import threading
+from unittest.mock import MagicMock
+
+from config.token_cache import TokenCache, AutoRefreshTokenCache
+
+class TestTokenCache:
+    """Testes para o cache de tokens de acesso"""
+
+    def _fetcher(self, ttl=3600, atraso=0):
+        """Cria um fetcher mockado que gera tokens numerados"""
+        contador = {"n": 0}
+
+        def fetch():
+            time.sleep(atraso)
+            contador["n"] += 1
+            return {"access_token": f"token-{contador['n']}", "expires_at": time.time() + ttl}
+
+        return MagicMock(side_effect=fetch)
+
+    def test_reaproveita_token_valido(self):
+        """Testa que o token é buscado uma única vez enquanto válido"""
+        fetcher = self._fetcher()
+        cache = TokenCache(fetcher, refresh_margin=60)
+
+        assert cache.get_token() == "token-1"
+        assert cache.get_token() == "token-1"
+        assert fetcher.call_count == 1
+
+    def test_renova_dentro_da_margem(self):
+        """Testa a renovação antecipada antes da expiração"""
+        fetcher = self._fetcher(ttl=30)
+        cache = TokenCache(fetcher, refresh_margin=60)
+
+        cache.get_token()
+        assert cache.get_token() == "token-2"
+        assert fetcher.call_count == 2
+
+    def test_renovacao_concorrente_unica(self):
+        """Testa que chamadas concorrentes compartilham a mesma renovação"""
+        fetcher = self._fetcher(atraso=0.05)
+        cache = TokenCache(fetcher, refresh_margin=60)
+        resultados = []
+
+        threads = [threading.Thread(target=lambda: resultados.append(cache.get_token())) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert fetcher.call_count == 1
+        assert resultados == ["token-1"] * 10
+
+    def test_persistencia_em_disco(self, tmp_path):
+        """Testa que um token persistido é reaproveitado por outra instância"""
+        caminho = str(tmp_path / "token.json")
+        TokenCache(self._fetcher(), persist_path=caminho).get_token()
+
+        fetcher = self._fetcher()
+        cache = TokenCache(fetcher, persist_path=caminho)
+
+        assert cache.get_token() == "token-1"
+        assert fetcher.call_count == 0
+
+    def test_invalidate(self, tmp_path):
+        """Testa o descarte do token após falha de autorização"""
+        caminho = tmp_path / "token.json"
+        fetcher = self._fetcher()
+        cache = TokenCache(fetcher, persist_path=str(caminho))
+
+        cache.get_token()
+        cache.invalidate()
+
+        assert not caminho.exists()
+        assert cache.get_token() == "token-2"
+
+    def test_refresh_if_stale(self):
+        """Testa que vários 401 com o mesmo token geram uma única renovação"""
+        fetcher = self._fetcher()
+        cache = TokenCache(fetcher, refresh_margin=60)
+        antigo = cache.get_token()
+
+        assert cache.refresh_if_stale(antigo) == "token-2"
+        assert cache.refresh_if_stale(antigo) == "token-2"
+        assert fetcher.call_count == 2
+
+    def test_renovacao_em_segundo_plano(self):
+        """Testa que o token é renovado pelo timer sem chamadas no caminho quente"""
+        fetcher = self._fetcher(ttl=0.3)
+        cache = AutoRefreshTokenCache(fetcher, refresh_margin=0.1)
+
+        try:
+            assert cache.get_token() == "token-1"
+            time.sleep(0.25)
+            assert fetcher.call_count >= 2
+            assert cache.access_token != "token-1"
+        finally:
+            cache.stop()
+
+    def test_token_de_vida_curta_nao_renova_em_laco(self):
+        """Testa que um token que expira antes de 2 * margem não dispara renovações seguidas"""
+        fetcher = self._fetcher(ttl=2)
+        cache = AutoRefreshTokenCache(fetcher, refresh_margin=1.5)
+
+        try:
+            assert cache.get_token() == "token-1"
+            time.sleep(0.3)
+            assert fetcher.call_count == 1
+        finally:
+            cache.stop()